@@ -0,0 +1,19 @@
+from .async_base_api import AsyncBaseAPI
+
+
+class AsyncAuthAPI(AsyncBaseAPI):
+    def __init__(self, base_url, client, username=None, password=None, **kwargs):
+        super().__init__(base_url, client, **kwargs)
+        self.username = username
+        self.password = password
+
+    async def create_token(self, username=None, password=None):
+        username = username or self.username
+        password = password or self.password
+        payload = {"username": username, "password": password}
+        response = await self._post("/auth", payload)
+        response.raise_for_status()
+        return self.decode(response)["token"]
+
+    async def create(self, payload):
+        return await self._post("/auth", payload)
@@ -0,0 +1,73 @@
+import time
+
+from .base_api import CodecMixin
+from .codec import DEFAULT_CODEC
+from .transport import DEFAULT_TRANSPORT
+
+
+class AsyncBaseAPI(CodecMixin):
+    """
+    httpx counterpart of BaseAPI with the same codec, hooks, validator and
+    transport timeout. There is no limiter or timing_hooks: AdaptiveLimiter
+    blocks a thread and RequestTiming comes from the requests adapter.
+    """
+
+    def __init__(
+        self,
+        base_url,
+        client,
+        transport=DEFAULT_TRANSPORT,
+        hooks=(),
+        codec=DEFAULT_CODEC,
+        validator=None,
+    ):
+        self.base_url = base_url
+        self.client = client
+        self.transport = transport
+        self.hooks = list(hooks)
+        self.codec = codec
+        self.validator = validator
+
+    async def _request(self, method, endpoint, route=None, **kwargs):
+        kwargs.setdefault("timeout", self.transport.async_timeout)
+        status = None
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(
+                method, f"{self.base_url}{endpoint}", **kwargs
+            )
+            status = response.status_code
+        finally:
+            elapsed = time.perf_counter() - start
+            for hook in self.hooks:
+                hook(method, route or endpoint, status, elapsed)
+        if self.validator is not None:
+            self.validator(method, route or endpoint, response)
+        return response
+
+    def _with_body(self, payload, codec, kwargs):
+        kwargs["content"] = self._body(payload, codec, kwargs)
+        return kwargs
+
+    async def _get(self, endpoint, codec=None, **kwargs):
+        if codec is not None:
+            self._negotiate(codec, kwargs, body=False)
+        return await self._request("GET", endpoint, **kwargs)
+
+    async def _post(self, endpoint, payload=None, codec=None, **kwargs):
+        return await self._request(
+            "POST", endpoint, **self._with_body(payload, codec, kwargs)
+        )
+
+    async def _put(self, endpoint, payload=None, codec=None, **kwargs):
+        return await self._request(
+            "PUT", endpoint, **self._with_body(payload, codec, kwargs)
+        )
+
+    async def _patch(self, endpoint, payload=None, codec=None, **kwargs):
+        return await self._request(
+            "PATCH", endpoint, **self._with_body(payload, codec, kwargs)
+        )
+
+    async def _delete(self, endpoint, **kwargs):
+        return await self._request("DELETE", endpoint, **kwargs)
@@ -0,0 +1,52 @@
+from .async_base_api import AsyncBaseAPI
+from .booking_api import BOOKING_ROUTE, booking_filters, created_id, token_headers
+
+
+class AsyncBookingAPI(AsyncBaseAPI):
+    """
+    Async BookingAPI for concurrency tests. It has no response cache, bulk
+    helpers or auth_api refresh, so update and delete need an explicit token.
+    """
+
+    def __init__(self, base_url, client, registry=None, **kwargs):
+        super().__init__(base_url, client, **kwargs)
+        self.registry = registry
+
+    async def get_all(self, firstname=None, lastname=None, checkin=None, checkout=None):
+        params = booking_filters(firstname, lastname, checkin, checkout)
+        return await self._get("/booking", params=params)
+
+    async def get(self, booking_id, codec=None):
+        return await self._get(f"/booking/{booking_id}", codec, route=BOOKING_ROUTE)
+
+    async def create(self, payload, codec=None):
+        response = await self._post("/booking", payload, codec)
+        if self.registry is not None and response.status_code == 200:
+            self.registry.add(created_id(self, response, codec))
+        return response
+
+    async def update(self, booking_id, payload, token, codec=None):
+        return await self._put(
+            f"/booking/{booking_id}",
+            payload,
+            codec,
+            headers=token_headers(token),
+            route=BOOKING_ROUTE,
+        )
+
+    async def partial_update(self, booking_id, payload, token, codec=None):
+        return await self._patch(
+            f"/booking/{booking_id}",
+            payload,
+            codec,
+            headers=token_headers(token),
+            route=BOOKING_ROUTE,
+        )
+
+    async def delete(self, booking_id, token):
+        response = await self._delete(
+            f"/booking/{booking_id}", headers=token_headers(token), route=BOOKING_ROUTE
+        )
+        if self.registry is not None and response.status_code == 201:
+            self.registry.discard(booking_id)
+        return response
@@ -0,0 +1,6 @@
+from .async_base_api import AsyncBaseAPI
+
+
+class AsyncHealthCheckAPI(AsyncBaseAPI):
+    async def get(self):
+        return await self._get("/ping")
@@ -1,11 +1,30 @@
+import threading
+import time
+
 from .base_api import BaseAPI
 
+DEFAULT_TOKEN_TTL = 600
+
 
 class AuthAPI(BaseAPI):
-    def __init__(self, base_url, session, username=None, password=None):
-        super().__init__(base_url, session)
+    def __init__(
+        self,
+        base_url,
+        session,
+        username=None,
+        password=None,
+        token_ttl=DEFAULT_TOKEN_TTL,
+        **kwargs,
+    ):
+        super().__init__(base_url, session, **kwargs)
         self.username = username
         self.password = password
+        self.token_ttl = token_ttl
+        self.token_fetches = 0
+        self.token_cache_hits = 0
+        self._token = None
+        self._token_expires = 0.0
+        self._lock = threading.RLock()
 
     def create_token(self, username=None, password=None):
         username = username or self.username
@@ -13,7 +32,40 @@ class AuthAPI(BaseAPI):
         payload = {"username": username, "password": password}
         response = self._post("/auth", payload)
         response.raise_for_status()
-        return response.json()["token"]
+        with self._lock:
+            self.token_fetches += 1
+        return self.decode(response)["token"]
 
     def create(self, payload):
         return self._post("/auth", payload)
+
+    def get_token(self):
+        """Return the cached token, fetching a new one once the TTL has passed."""
+        with self._lock:
+            if self._token is not None and time.monotonic() < self._token_expires:
+                self.token_cache_hits += 1
+                return self._token
+            return self._fetch_token()
+
+    def refresh_token(self, rejected_token):
+        """Replace a token the server rejected, unless another thread already has."""
+        with self._lock:
+            if self._token is not None and self._token != rejected_token:
+                self.token_cache_hits += 1
+                return self._token
+            return self._fetch_token()
+
+    def use_token(self, token):
+        """Cache a token obtained elsewhere, as if get_token had just fetched it."""
+        with self._lock:
+            self._token = token
+            self._token_expires = time.monotonic() + self.token_ttl
+
+    def invalidate_token(self):
+        with self._lock:
+            self._token = None
+
+    def _fetch_token(self):
+        self._token = self.create_token()
+        self._token_expires = time.monotonic() + self.token_ttl
+        return self._token
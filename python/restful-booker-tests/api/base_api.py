@@ -1,28 +1,134 @@
-import json
+import time
 
+from .codec import DEFAULT_CODEC, get_codec
+from .transport import DEFAULT_TRANSPORT
 
-class BaseAPI:
-    def __init__(self, base_url, session):
+
+class CodecMixin:
+    """
+    Body encoding and content negotiation shared by BaseAPI and AsyncBaseAPI.
+
+    Needs a codec attribute; nothing here touches the session or client.
+    """
+
+    def decode(self, response, codec=None):
+        """Parse a response body with codec (or its name), default the client's."""
+        return self._codec(codec).loads(response.content)
+
+    def _codec(self, codec):
+        if codec is None:
+            return self.codec
+        return get_codec(codec) if isinstance(codec, str) else codec
+
+    def _encode(self, payload, codec=None):
+        # Pre-encoded bodies (e.g. from PayloadTemplate.render) are sent as-is.
+        if isinstance(payload, bytes):
+            return payload
+        return (codec or self.codec).dumps(payload or {})
+
+    def _negotiate(self, codec, kwargs, body=True):
+        # A per-call codec sets Accept, and Content-Type when there is a body;
+        # without one the session's JSON headers apply.
+        codec = self._codec(codec)
+        headers = {"Accept": codec.accept}
+        if body:
+            headers["Content-Type"] = codec.content_type
+        headers.update(kwargs.get("headers") or {})
+        kwargs["headers"] = headers
+        return codec
+
+    def _body(self, payload, codec, kwargs):
+        if codec is not None:
+            codec = self._negotiate(codec, kwargs)
+        return self._encode(payload, codec)
+
+
+class BaseAPI(CodecMixin):
+    def __init__(
+        self,
+        base_url,
+        session,
+        transport=DEFAULT_TRANSPORT,
+        hooks=(),
+        codec=DEFAULT_CODEC,
+        limiter=None,
+        timing_hooks=(),
+        validator=None,
+    ):
         self.base_url = base_url
         self.session = session
+        self.transport = transport
+        # Each hook is called as hook(method, route, status, elapsed) after
+        # every request; status is None when the request raised.
+        self.hooks = list(hooks)
+        self.codec = codec
+        # An AdaptiveLimiter, shared by every client that should count
+        # towards the same in-flight limit.
+        self.limiter = limiter
+        # Each timing hook is called as hook(method, route, timing) with the
+        # RequestTiming of every response that has one (see api.timing).
+        self.timing_hooks = list(timing_hooks)
+        # Called as validator(method, route, response) on every response,
+        # e.g. an api.schema.ResponseValidator.
+        self.validator = validator
 
-    def _get(self, endpoint, **kwargs):
-        return self.session.get(f"{self.base_url}{endpoint}", **kwargs)
+    def _with_body(self, payload, codec, kwargs):
+        kwargs["data"] = self._body(payload, codec, kwargs)
+        return kwargs
 
-    def _post(self, endpoint, payload=None, **kwargs):
-        return self.session.post(
-            f"{self.base_url}{endpoint}", data=json.dumps(payload or {}), **kwargs
-        )
+    def _request(self, method, endpoint, route=None, **kwargs):
+        kwargs.setdefault("timeout", self.transport.timeout)
+        if not self.hooks and self.limiter is None and not self.timing_hooks:
+            response = self.session.request(
+                method, f"{self.base_url}{endpoint}", **kwargs
+            )
+        else:
+            response = self._observed_request(method, endpoint, route, kwargs)
+        # Streamed bodies belong to the caller, so they are never read here.
+        if self.validator is not None and not kwargs.get("stream"):
+            self.validator(method, route or endpoint, response)
+        return response
 
-    def _put(self, endpoint, payload=None, **kwargs):
-        return self.session.put(
-            f"{self.base_url}{endpoint}", data=json.dumps(payload or {}), **kwargs
+    def _observed_request(self, method, endpoint, route, kwargs):
+        status = None
+        response = None
+        if self.limiter is not None:
+            ticket = self.limiter.acquire()
+        start = time.perf_counter()
+        try:
+            response = self.session.request(
+                method, f"{self.base_url}{endpoint}", **kwargs
+            )
+            status = response.status_code
+            return response
+        finally:
+            elapsed = time.perf_counter() - start
+            if self.limiter is not None:
+                self.limiter.release(ticket, elapsed, status)
+            for hook in self.hooks:
+                hook(method, route or endpoint, status, elapsed)
+            timing = getattr(response, "timing", None)
+            if timing is not None:
+                for hook in self.timing_hooks:
+                    hook(method, route or endpoint, timing)
+
+    def _get(self, endpoint, codec=None, **kwargs):
+        if codec is not None:
+            self._negotiate(codec, kwargs, body=False)
+        return self._request("GET", endpoint, **kwargs)
+
+    def _post(self, endpoint, payload=None, codec=None, **kwargs):
+        return self._request(
+            "POST", endpoint, **self._with_body(payload, codec, kwargs)
         )
 
-    def _patch(self, endpoint, payload=None, **kwargs):
-        return self.session.patch(
-            f"{self.base_url}{endpoint}", data=json.dumps(payload or {}), **kwargs
+    def _put(self, endpoint, payload=None, codec=None, **kwargs):
+        return self._request("PUT", endpoint, **self._with_body(payload, codec, kwargs))
+
+    def _patch(self, endpoint, payload=None, codec=None, **kwargs):
+        return self._request(
+            "PATCH", endpoint, **self._with_body(payload, codec, kwargs)
         )
 
     def _delete(self, endpoint, **kwargs):
-        return self.session.delete(f"{self.base_url}{endpoint}", **kwargs)
+        return self._request("DELETE", endpoint, **kwargs)
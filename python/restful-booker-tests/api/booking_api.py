@@ -1,33 +1,218 @@
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
 from .base_api import BaseAPI
+from .bulk import DEFAULT_MAX_WORKERS, run_bulk
+from .streaming import iter_json_array
+
+BOOKING_ROUTE = "/booking/{id}"
+# restful-booker's JSON create reply starts with the new id, so the registry
+# can read it without decoding the booking that follows.
+_CREATED_ID = re.compile(rb'\s*\{\s*"bookingid"\s*:\s*(\d+)\s*[,}]')
+
+
+# Request shaping shared with AsyncBookingAPI, so the two clients cannot
+# drift on query parameters, auth headers or how a new ID is read.
+
+
+def booking_filters(firstname=None, lastname=None, checkin=None, checkout=None):
+    """Query parameters for GET /booking, leaving out unset filters."""
+    params = {}
+    if firstname:
+        params["firstname"] = firstname
+    if lastname:
+        params["lastname"] = lastname
+    if checkin:
+        params["checkin"] = checkin
+    if checkout:
+        params["checkout"] = checkout
+    return params
+
+
+def token_headers(token):
+    return {"Cookie": f"token={token}"}
+
+
+def created_id(client, response, codec=None):
+    """ID of the booking a 200 create reply describes, decoded with client."""
+    match = _CREATED_ID.match(response.content)
+    if match is not None:
+        return int(match.group(1))
+    return client.decode(response, codec)["bookingid"]
 
 
 class BookingAPI(BaseAPI):
+    def __init__(
+        self,
+        base_url,
+        session,
+        max_workers=DEFAULT_MAX_WORKERS,
+        auth_api=None,
+        registry=None,
+        cache=None,
+        **kwargs,
+    ):
+        super().__init__(base_url, session, **kwargs)
+        self.max_workers = max_workers
+        self.auth_api = auth_api
+        self.registry = registry
+        self.cache = cache
+
     def get_all(self, firstname=None, lastname=None, checkin=None, checkout=None):
-        params = {}
-        if firstname:
-            params["firstname"] = firstname
-        if lastname:
-            params["lastname"] = lastname
-        if checkin:
-            params["checkin"] = checkin
-        if checkout:
-            params["checkout"] = checkout
-        return self._get("/booking", params=params)
-
-    def get(self, booking_id):
-        return self._get(f"/booking/{booking_id}")
-
-    def create(self, payload):
-        return self._post("/booking", payload)
-
-    def update(self, booking_id, payload, token):
-        headers = {"Cookie": f"token={token}"}
-        return self._put(f"/booking/{booking_id}", payload, headers=headers)
-
-    def partial_update(self, booking_id, payload, token):
-        headers = {"Cookie": f"token={token}"}
-        return self._patch(f"/booking/{booking_id}", payload, headers=headers)
-
-    def delete(self, booking_id, token):
-        headers = {"Cookie": f"token={token}"}
-        return self._delete(f"/booking/{booking_id}", headers=headers)
+        params = booking_filters(firstname, lastname, checkin, checkout)
+        return self._cached_get("/booking", params=params)
+
+    def iter_ids(
+        self,
+        firstname=None,
+        lastname=None,
+        checkin=None,
+        checkout=None,
+        chunk_size=16384,
+    ):
+        """Yield booking IDs from GET /booking as the response body streams in."""
+        params = booking_filters(firstname, lastname, checkin, checkout)
+        response = self._get("/booking", params=params, stream=True)
+        try:
+            response.raise_for_status()
+            for item in iter_json_array(response.iter_content(chunk_size)):
+                yield item["bookingid"] if isinstance(item, dict) else item
+        finally:
+            response.close()
+
+    def iter_bookings(self, max_in_flight=None, **filters):
+        """
+        Yield (booking_id, response) for every booking matching filters.
+
+        Detail GETs start as soon as each ID is parsed, with at most
+        max_in_flight outstanding, and results come back in ID order.
+        """
+        max_in_flight = max_in_flight or self.max_workers
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            for booking_id in self.iter_ids(**filters):
+                pending.append((booking_id, executor.submit(self.get, booking_id)))
+                if len(pending) >= max_in_flight:
+                    booking_id, future = pending.popleft()
+                    yield booking_id, future.result()
+            while pending:
+                booking_id, future = pending.popleft()
+                yield booking_id, future.result()
+
+    def get(self, booking_id, codec=None):
+        if codec is not None:
+            # The cache is keyed on URL only, so other formats bypass it.
+            return self._get(f"/booking/{booking_id}", codec, route=BOOKING_ROUTE)
+        return self._cached_get(f"/booking/{booking_id}", route=BOOKING_ROUTE)
+
+    def create(self, payload, codec=None):
+        """POST a booking; codec ("xml", "form", ...) sets body and reply format."""
+        response = self._post("/booking", payload, codec)
+        if self.registry is not None and response.status_code == 200:
+            self.registry.add(created_id(self, response, codec))
+        self._invalidate()
+        return response
+
+    def update(self, booking_id, payload, token=None, codec=None):
+        response = self._authorized(
+            self._put,
+            f"/booking/{booking_id}",
+            token,
+            payload,
+            codec,
+            route=BOOKING_ROUTE,
+        )
+        self._invalidate(booking_id)
+        return response
+
+    def partial_update(self, booking_id, payload, token=None, codec=None):
+        response = self._authorized(
+            self._patch,
+            f"/booking/{booking_id}",
+            token,
+            payload,
+            codec,
+            route=BOOKING_ROUTE,
+        )
+        self._invalidate(booking_id)
+        return response
+
+    def delete(self, booking_id, token=None):
+        response = self._authorized(
+            self._delete, f"/booking/{booking_id}", token, route=BOOKING_ROUTE
+        )
+        self._invalidate(booking_id)
+        if self.registry is not None and response.status_code == 201:
+            self.registry.discard(booking_id)
+        return response
+
+    def _cached_get(self, endpoint, params=None, **kwargs):
+        if self.cache is None:
+            return self._get(endpoint, params=params, **kwargs)
+        key = self.cache.key(endpoint, params)
+        cached = self.cache.get(key)
+        if cached is not None and "ETag" not in cached.headers:
+            self.cache.count(hit=True)
+            return cached
+        headers = {"If-None-Match": cached.headers["ETag"]} if cached else None
+        response = self._get(endpoint, params=params, headers=headers, **kwargs)
+        if response.status_code == 304 and cached is not None:
+            self.cache.count(hit=True, revalidated=True)
+            return cached
+        self.cache.count()
+        if response.status_code == 200:
+            self.cache.put(key, response)
+        return response
+
+    def _invalidate(self, booking_id=None):
+        # Any write can change filter results, so list queries always go.
+        if self.cache is None:
+            return
+        self.cache.invalidate("/booking")
+        if booking_id is not None:
+            self.cache.invalidate(f"/booking/{booking_id}")
+
+    def _authorized(self, send, endpoint, token, *args, **kwargs):
+        # An explicit token is sent as-is, so tests can still assert on 403s.
+        # Without one, the cached token from auth_api is used and refreshed
+        # once if the server rejects it.
+        if token is not None:
+            return send(endpoint, *args, headers=token_headers(token), **kwargs)
+        if self.auth_api is None:
+            raise ValueError("token is required when BookingAPI has no auth_api")
+        token = self.auth_api.get_token()
+        response = send(endpoint, *args, headers=token_headers(token), **kwargs)
+        if response.status_code == 403:
+            token = self.auth_api.refresh_token(token)
+            response = send(endpoint, *args, headers=token_headers(token), **kwargs)
+        return response
+
+    def create_many(self, payloads, max_workers=None):
+        return run_bulk(
+            self.create,
+            ((payload,) for payload in payloads),
+            max_workers or self.max_workers,
+        )
+
+    def get_many(self, booking_ids, max_workers=None):
+        return run_bulk(
+            self.get,
+            ((booking_id,) for booking_id in booking_ids),
+            max_workers or self.max_workers,
+        )
+
+    def update_many(self, updates, token=None, max_workers=None):
+        """Apply (booking_id, payload) pairs with full PUT updates."""
+        return run_bulk(
+            self.update,
+            ((booking_id, payload, token) for booking_id, payload in updates),
+            max_workers or self.max_workers,
+        )
+
+    def delete_many(self, booking_ids, token=None, max_workers=None):
+        return run_bulk(
+            self.delete,
+            ((booking_id, token) for booking_id in booking_ids),
+            max_workers or self.max_workers,
+        )
@@ -0,0 +1,43 @@
+from concurrent.futures import ThreadPoolExecutor
+
+# Matches the default pool_maxsize of requests' HTTPAdapter, so every worker
+# can hold a pooled connection without urllib3 discarding any.
+DEFAULT_MAX_WORKERS = 10
+
+
+class BulkResult:
+    """Responses in input order; failed items hold None and their exception in errors."""
+
+    def __init__(self, size):
+        self.responses = [None] * size
+        self.errors = {}
+
+    @property
+    def ok(self):
+        return not self.errors and all(r.ok for r in self.responses)
+
+    def __len__(self):
+        return len(self.responses)
+
+    def __iter__(self):
+        return iter(self.responses)
+
+    def __getitem__(self, index):
+        return self.responses[index]
+
+
+def run_bulk(func, args_list, max_workers=DEFAULT_MAX_WORKERS):
+    args_list = list(args_list)
+    result = BulkResult(len(args_list))
+
+    def call(index, args):
+        try:
+            result.responses[index] = func(*args)
+        except Exception as exc:
+            result.errors[index] = exc
+
+    # The worker count is the cap on requests in flight at any one time.
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for index, args in enumerate(args_list):
+            executor.submit(call, index, args)
+    return result
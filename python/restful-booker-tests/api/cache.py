@@ -0,0 +1,61 @@
+import threading
+from collections import OrderedDict
+
+
+class ResponseCache:
+    """
+    Size-bounded LRU of GET responses keyed by endpoint and query params.
+
+    Entries carrying an ETag are revalidated with If-None-Match on every read;
+    entries without one are served until a write through the owning client
+    invalidates them.
+    """
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def key(endpoint, params=None):
+        return (endpoint, tuple(sorted((params or {}).items())))
+
+    def get(self, key):
+        with self._lock:
+            response = self._entries.get(key)
+            if response is not None:
+                self._entries.move_to_end(key)
+            return response
+
+    def put(self, key, response):
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, endpoint):
+        """Drop every entry for endpoint, whatever its params."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == endpoint]:
+                del self._entries[key]
+
+    def count(self, hit=False, revalidated=False):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+            if revalidated:
+                self.revalidations += 1
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
@@ -0,0 +1,301 @@
+import bisect
+import difflib
+import hashlib
+import io
+import json
+import mmap
+import os
+import struct
+import threading
+import zlib
+
+import httpx
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+
+RECORD = "record"
+REPLAY = "replay"
+
+# File layout: MAGIC, zlib-compressed records, a table of (digest, offset,
+# length) entries sorted by digest, then a trailer pointing at the table.
+# Replay binary-searches the table straight out of the memory map, so opening
+# a cassette costs the same however many interactions it holds.
+MAGIC = b"RBCASS1\0"
+_ENTRY = struct.Struct(">16sQI")
+_TRAILER = struct.Struct(">QI8s")
+_RECORD_HEADER = struct.Struct(">II")
+# Bodies are stored decoded, so these no longer describe them on replay.
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+class CassetteMismatchError(Exception):
+    pass
+
+
+# POST /auth carries the SUT credentials and answers with a live token, so
+# neither is written to a cassette: the request body and the token are
+# replaced by placeholders before hashing and storing. That also makes /auth
+# match on method and path alone, so a cassette replays with any credentials.
+AUTH_TARGET = "/auth"
+REDACTED_AUTH_BODY = b'{"username":"[redacted]","password":"[redacted]"}'
+REDACTED_TOKEN = "[redacted]"
+
+
+def redact(method, target, body, content=None):
+    """Return (body, content) as they may be stored for this request."""
+    if method != "POST" or target.split("?")[0] != AUTH_TARGET:
+        return body, content
+    if content is not None:
+        try:
+            reply = json.loads(content)
+        except ValueError:
+            reply = None
+        if isinstance(reply, dict) and "token" in reply:
+            content = json.dumps({**reply, "token": REDACTED_TOKEN}).encode()
+    return REDACTED_AUTH_BODY, content
+
+
+def request_digest(method, target, body):
+    key = hashlib.blake2b(digest_size=16)
+    key.update(f"{method} {target}\0".encode())
+    key.update(body)
+    return key.digest()
+
+
+class Cassette:
+    """
+    Recorded request/response pairs, matched on method, path, query and body
+    (method and path only for the redacted POST /auth).
+
+    Host and headers are ignored so a cassette recorded against one SUT (or a
+    fake on a random port) replays anywhere. Identical requests are replayed
+    in the order they were recorded.
+    """
+
+    def __init__(self, path, mode):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"cassette mode must be {RECORD!r} or {REPLAY!r}")
+        self.path = path
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._recorded = []
+        self._played = {}
+        self._map = None
+        if mode == REPLAY:
+            with open(path, "rb") as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            table, count, magic = _TRAILER.unpack_from(
+                self._map, len(self._map) - _TRAILER.size
+            )
+            if magic != MAGIC or self._map[: len(MAGIC)] != MAGIC:
+                raise ValueError(f"{path} is not a cassette file")
+            self._digests = _DigestTable(self._map, table, count)
+
+    def __len__(self):
+        return len(self._digests) if self._map is not None else len(self._recorded)
+
+    def record(self, method, target, body, status, reason, headers, content):
+        body, content = redact(method, target, body, content)
+        headers = [
+            (name, value)
+            for name, value in headers
+            if name.lower() not in _DROPPED_HEADERS
+        ]
+        meta = json.dumps(
+            {
+                "method": method,
+                "target": target,
+                "status": status,
+                "reason": reason,
+                "headers": headers,
+            }
+        ).encode()
+        blob = zlib.compress(
+            _RECORD_HEADER.pack(len(meta), len(body)) + meta + body + content
+        )
+        with self._lock:
+            self._recorded.append((request_digest(method, target, body), blob))
+
+    def play(self, method, target, body):
+        """Return (status, reason, headers, content) recorded for this request."""
+        body, _ = redact(method, target, body)
+        digest = request_digest(method, target, body)
+        with self._lock:
+            first = bisect.bisect_left(self._digests, digest)
+            played = self._played.get(digest, 0)
+            index = first + played
+            if index >= len(self._digests) or self._digests[index] != digest:
+                raise CassetteMismatchError(
+                    self._mismatch(method, target, body, played)
+                )
+            self._played[digest] = played + 1
+        meta, _, content = self._read(index)
+        return meta["status"], meta["reason"], meta["headers"], content
+
+    def close(self):
+        if self.mode == RECORD:
+            self._write()
+        elif self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def _write(self):
+        # A stable sort keeps repeats of one request in recorded order.
+        records = sorted(self._recorded, key=lambda record: record[0])
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        partial = f"{self.path}.partial"
+        with open(partial, "wb") as f:
+            f.write(MAGIC)
+            entries = []
+            for digest, blob in records:
+                entries.append(_ENTRY.pack(digest, f.tell(), len(blob)))
+                f.write(blob)
+            table = f.tell()
+            f.write(b"".join(entries))
+            f.write(_TRAILER.pack(table, len(entries), MAGIC))
+        os.replace(partial, self.path)
+
+    def _read(self, index):
+        _, offset, length = self._digests.entry(index)
+        data = zlib.decompress(self._map[offset : offset + length])
+        meta_length, body_length = _RECORD_HEADER.unpack_from(data)
+        start = _RECORD_HEADER.size
+        meta = json.loads(data[start : start + meta_length])
+        start += meta_length
+        return meta, data[start : start + body_length], data[start + body_length :]
+
+    def _mismatch(self, method, target, body, played):
+        wanted = _describe(method, target, body)
+        if played:
+            return (
+                f"{method} {target} was recorded {played} time(s) and has "
+                f"already been replayed that often\n" + "\n".join(wanted)
+            )
+        # Cold path: scan every recording for the closest request to diff against.
+        best, best_ratio = None, -1.0
+        for index in range(len(self._digests)):
+            meta, recorded_body, _ = self._read(index)
+            candidate = _describe(meta["method"], meta["target"], recorded_body)
+            ratio = difflib.SequenceMatcher(None, wanted, candidate).ratio()
+            if candidate[0].split("?")[0] == wanted[0].split("?")[0]:
+                ratio += 1
+            if ratio > best_ratio:
+                best, best_ratio = candidate, ratio
+        if best is None:
+            return f"{method} {target} is not in an empty cassette"
+        diff = difflib.unified_diff(best, wanted, "recorded", "requested", lineterm="")
+        return f"{method} {target} is not in the cassette\n" + "\n".join(diff)
+
+
+class _DigestTable:
+    # Sequence view over the sorted index in the memory map, for bisect.
+
+    def __init__(self, buffer, offset, count):
+        self.buffer = buffer
+        self.offset = offset
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        start = self.offset + index * _ENTRY.size
+        return self.buffer[start : start + 16]
+
+    def entry(self, index):
+        return _ENTRY.unpack_from(self.buffer, self.offset + index * _ENTRY.size)
+
+
+def _describe(method, target, body):
+    lines = [f"{method} {target}"]
+    if body:
+        try:
+            lines += json.dumps(json.loads(body), indent=2, sort_keys=True).split("\n")
+        except ValueError:
+            lines += body.decode(errors="replace").split("\n")
+    return lines
+
+
+class CassetteAdapter(HTTPAdapter):
+    """requests adapter that records through inner, or replays without a network."""
+
+    def __init__(self, cassette, inner=None):
+        super().__init__()
+        self.cassette = cassette
+        self.inner = inner
+
+    def send(self, request, **kwargs):
+        body = request.body or b""
+        if isinstance(body, str):
+            body = body.encode()
+        if self.cassette.mode == REPLAY:
+            status, reason, headers, content = self.cassette.play(
+                request.method, request.path_url, body
+            )
+            raw = HTTPResponse(
+                body=io.BytesIO(content),
+                headers=headers,
+                status=status,
+                reason=reason,
+                preload_content=False,
+            )
+            return self.build_response(request, raw)
+        response = self.inner.send(request, **kwargs)
+        self.cassette.record(
+            request.method,
+            request.path_url,
+            body,
+            response.status_code,
+            response.reason,
+            list(response.raw.headers.items()),
+            response.content,
+        )
+        return response
+
+    def close(self):
+        if self.inner is not None:
+            self.inner.close()
+
+
+class AsyncCassetteTransport(httpx.AsyncBaseTransport):
+    """httpx counterpart of CassetteAdapter for the async clients."""
+
+    def __init__(self, cassette, inner=None):
+        self.cassette = cassette
+        self.inner = inner
+
+    async def handle_async_request(self, request):
+        body = await request.aread()
+        target = request.url.raw_path.decode()
+        if self.cassette.mode == REPLAY:
+            status, _, headers, content = self.cassette.play(
+                request.method, target, body
+            )
+            return httpx.Response(
+                status, headers=headers, content=content, request=request
+            )
+        response = await self.inner.handle_async_request(request)
+        content = await response.aread()
+        self.cassette.record(
+            request.method,
+            target,
+            body,
+            response.status_code,
+            response.reason_phrase,
+            response.headers.multi_items(),
+            content,
+        )
+        return response
+
+    async def aclose(self):
+        if self.inner is not None:
+            await self.inner.aclose()
+
+
+def use_cassette(session, cassette):
+    """Route every request on a requests session through cassette."""
+    for prefix in ("http://", "https://"):
+        session.mount(prefix, CassetteAdapter(cassette, session.get_adapter(prefix)))
+    return session
@@ -0,0 +1,221 @@
+import json
+import re
+import uuid
+from urllib.parse import parse_qsl, urlencode
+from xml.etree import ElementTree
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class StdlibJSONCodec:
+    name = "json"
+    content_type = "application/json"
+    accept = "application/json"
+
+    def dumps(self, obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def loads(self, data):
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    name = "orjson"
+    content_type = "application/json"
+    accept = "application/json"
+
+    def dumps(self, obj):
+        return orjson.dumps(obj)
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+
+class XMLCodec:
+    """
+    restful-booker's XML format: one element per field, nested for
+    bookingdates. Fields the booking schema types as numbers or booleans are
+    decoded as such, so a booking round-trips to the same dict as with JSON.
+    """
+
+    name = "xml"
+    content_type = "text/xml"
+    accept = "application/xml"
+
+    def __init__(self, root="booking"):
+        self.root = root
+
+    def dumps(self, obj):
+        root = ElementTree.Element(self.root)
+        _fill_element(root, obj)
+        return ElementTree.tostring(root, encoding="utf-8", xml_declaration=False)
+
+    def loads(self, data):
+        return _read_element(ElementTree.fromstring(data))
+
+
+class FormCodec:
+    """
+    application/x-www-form-urlencoded with qs-style nesting, e.g.
+    bookingdates[checkin]=2026-01-01, as the SUT's Express body parser reads it.
+    """
+
+    name = "form"
+    content_type = "application/x-www-form-urlencoded"
+    accept = "application/x-www-form-urlencoded"
+
+    def dumps(self, obj):
+        return urlencode(list(_flatten(obj))).encode()
+
+    def loads(self, data):
+        result = {}
+        for name, value in parse_qsl(data.decode(), keep_blank_values=True):
+            target = result
+            *parents, leaf = _FORM_KEY.findall(name)
+            for parent in parents:
+                target = target.setdefault(parent, {})
+            target[leaf] = _scalar(leaf, value)
+        return result
+
+
+_FORM_KEY = re.compile(r"[^\[\]]+")
+_INT = re.compile(r"-?\d+")
+_FLOAT = re.compile(r"-?\d+\.\d+")
+# XML and form bodies carry only text. These fields are numbers and booleans
+# in api.schema, so only they are converted; a firstname of "007" stays a
+# string.
+NUMBER_FIELDS = frozenset({"bookingid", "totalprice"})
+BOOLEAN_FIELDS = frozenset({"depositpaid"})
+
+
+def _text(value):
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return "" if value is None else str(value)
+
+
+def _scalar(field, text):
+    if text is None:
+        return ""
+    if field in BOOLEAN_FIELDS and text in ("true", "false"):
+        return text == "true"
+    if field in NUMBER_FIELDS:
+        if _INT.fullmatch(text):
+            return int(text)
+        if _FLOAT.fullmatch(text):
+            return float(text)
+    return text
+
+
+def _fill_element(parent, obj):
+    for key, value in obj.items():
+        child = ElementTree.SubElement(parent, key)
+        if isinstance(value, dict):
+            _fill_element(child, value)
+        else:
+            child.text = _text(value)
+
+
+def _read_element(element):
+    return {
+        child.tag: (
+            _read_element(child) if len(child) else _scalar(child.tag, child.text)
+        )
+        for child in element
+    }
+
+
+def _flatten(obj, prefix=None):
+    for key, value in obj.items():
+        name = key if prefix is None else f"{prefix}[{key}]"
+        if isinstance(value, dict):
+            yield from _flatten(value, name)
+        else:
+            yield name, _text(value)
+
+
+DEFAULT_CODEC = OrjsonCodec() if orjson is not None else StdlibJSONCodec()
+
+
+def get_codec(name=None):
+    """
+    Return the codec called name ("json", "orjson", "xml" or "form"), or the
+    fastest available JSON codec.
+    """
+    if not name:
+        return DEFAULT_CODEC
+    if name == "orjson" and orjson is None:
+        raise ValueError("orjson codec requested but orjson is not installed")
+    codecs = {
+        "json": StdlibJSONCodec,
+        "orjson": OrjsonCodec,
+        "xml": XMLCodec,
+        "form": FormCodec,
+    }
+    if name not in codecs:
+        raise ValueError(f"unknown codec {name!r}")
+    return codecs[name]()
+
+
+class PayloadTemplate:
+    """
+    A payload encoded once, with selected fields swapped in per render.
+
+    The template is encoded with a unique placeholder in each field; render()
+    only encodes the new field values and joins them with the pre-encoded
+    segments, so the rest of the body is never re-serialized. Nested fields
+    use dotted paths, e.g. "bookingdates.checkin", and are passed to render()
+    with double underscores, e.g. bookingdates__checkin="2026-01-01".
+
+    Only JSON codecs qualify: a value encoded on its own must appear verbatim
+    in the encoded document, which XML and form bodies do not guarantee.
+    """
+
+    def __init__(self, payload, fields, codec=DEFAULT_CODEC):
+        if codec.content_type != "application/json":
+            raise ValueError(f"PayloadTemplate needs a JSON codec, not {codec.name!r}")
+        self.codec = codec
+        self.fields = tuple(fields)
+        marker = uuid.uuid4().hex
+        placeholders = {field: f"{marker}:{field}" for field in self.fields}
+        encoded = codec.dumps(_with_fields(payload, placeholders))
+
+        self._segments = []
+        self._order = []
+        # Placeholders can appear in any order in the encoded body, so they
+        # are located and sorted by position before splitting.
+        positions = sorted(
+            (encoded.index(codec.dumps(value)), field)
+            for field, value in placeholders.items()
+        )
+        start = 0
+        for position, field in positions:
+            self._segments.append(encoded[start:position])
+            self._order.append(field)
+            start = position + len(codec.dumps(placeholders[field]))
+        self._segments.append(encoded[start:])
+
+    def render(self, **values):
+        """Return the encoded body with values for every templated field."""
+        dumps = self.codec.dumps
+        parts = [self._segments[0]]
+        for field, segment in zip(self._order, self._segments[1:]):
+            parts.append(dumps(values[field.replace(".", "__")]))
+            parts.append(segment)
+        return b"".join(parts)
+
+
+def _with_fields(payload, values):
+    # Copies only the dicts on the path to each replaced field.
+    result = dict(payload)
+    for path, value in values.items():
+        target = result
+        *parents, leaf = path.split(".")
+        for parent in parents:
+            target[parent] = dict(target[parent])
+            target = target[parent]
+        target[leaf] = value
+    return result
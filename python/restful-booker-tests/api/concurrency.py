@@ -0,0 +1,87 @@
+import threading
+
+
+class AdaptiveLimiter:
+    """
+    Client-side cap on requests in flight, adjusted by AIMD.
+
+    Every response within latency_target raises the limit by increase/limit,
+    i.e. about +increase per full window of requests. A slow response, a 5xx
+    or a request that raised (connection errors, timeouts) multiplies it by
+    decrease, at most once per window, so one burst of failures from requests
+    that were already in flight counts as a single congestion signal.
+    """
+
+    def __init__(
+        self,
+        initial=4,
+        min_limit=1,
+        max_limit=256,
+        latency_target=0.25,
+        increase=1.0,
+        decrease=0.5,
+    ):
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.increase = increase
+        self.decrease = decrease
+        self.in_flight = 0
+        self.peak_limit = self.limit
+        self.successes = 0
+        self.slow = 0
+        self.server_errors = 0
+        self.failures = 0
+        self.backoffs = 0
+        self._started = 0
+        self._window_end = 0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        """Block until a request may start; return its sequence number."""
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+            self._started += 1
+            return self._started
+
+    def release(self, ticket, elapsed, status=None):
+        """Record how the request with ticket ended; status is None if it raised."""
+        with self._condition:
+            self.in_flight -= 1
+            if status is None:
+                self.failures += 1
+            elif status >= 500:
+                self.server_errors += 1
+            elif elapsed > self.latency_target:
+                self.slow += 1
+            else:
+                self.successes += 1
+                self.limit = min(
+                    self.limit + self.increase / self.limit, self.max_limit
+                )
+                self.peak_limit = max(self.peak_limit, self.limit)
+                self._condition.notify()
+                return
+            # Requests that started before the last backoff saw the old
+            # limit; their slow responses are not a new signal.
+            if ticket > self._window_end:
+                self.limit = max(self.limit * self.decrease, self.min_limit)
+                self.backoffs += 1
+                self._window_end = self._started
+            self._condition.notify()
+
+    def snapshot(self):
+        with self._condition:
+            return {
+                "limit": self.limit,
+                "peak_limit": self.peak_limit,
+                "in_flight": self.in_flight,
+                "successes": self.successes,
+                "slow": self.slow,
+                "server_errors": self.server_errors,
+                "failures": self.failures,
+                "backoffs": self.backoffs,
+            }
@@ -0,0 +1,104 @@
+import statistics
+import threading
+import time
+
+import requests
+
+# Share of the run, at each end, whose median ping latency is compared for drift.
+DRIFT_WINDOW = 0.25
+
+
+class HealthReport:
+    def __init__(self):
+        self.time_to_ready = None
+        # (wall-clock time, ok, seconds) per background ping.
+        self.samples = []
+
+    def merge_dict(self, data):
+        if data["time_to_ready"] is not None:
+            self.time_to_ready = max(self.time_to_ready or 0.0, data["time_to_ready"])
+        self.samples.extend(tuple(sample) for sample in data["samples"])
+
+    def to_dict(self):
+        return {"time_to_ready": self.time_to_ready, "samples": self.samples}
+
+    def summary(self):
+        samples = sorted(self.samples)
+        summary = {"time_to_ready": self.time_to_ready, "pings": len(samples)}
+        if not samples:
+            return summary
+        window = max(int(len(samples) * DRIFT_WINDOW), 1)
+        first = [seconds for _, ok, seconds in samples[:window] if ok]
+        last = [seconds for _, ok, seconds in samples[-window:] if ok]
+        summary["availability"] = sum(ok for _, ok, _ in samples) / len(samples)
+        summary["longest_outage"] = _longest_outage(samples)
+        if first and last:
+            summary["p50_start"] = statistics.median(first)
+            summary["p50_end"] = statistics.median(last)
+            summary["drift"] = summary["p50_end"] / summary["p50_start"] - 1
+        return summary
+
+    def __str__(self):
+        summary = self.summary()
+        ready = summary["time_to_ready"]
+        text = "not checked" if ready is None else f"ready in {ready:.2f}s"
+        if summary["pings"]:
+            text += (
+                f"; {summary['pings']} pings, {summary['availability']:.2%} available, "
+                f"longest outage {summary['longest_outage']:.2f}s"
+            )
+        if "drift" in summary:
+            text += (
+                f"; p50 {summary['p50_start'] * 1000:.2f}ms -> "
+                f"{summary['p50_end'] * 1000:.2f}ms ({summary['drift']:+.0%})"
+            )
+        return text
+
+
+def _longest_outage(samples):
+    longest, down_since = 0.0, None
+    for timestamp, ok, _ in samples:
+        if not ok and down_since is None:
+            down_since = timestamp
+        elif ok and down_since is not None:
+            longest = max(longest, timestamp - down_since)
+            down_since = None
+    if down_since is not None:
+        longest = max(longest, samples[-1][0] - down_since)
+    return longest
+
+
+class HealthSampler:
+    """Background thread that pings /ping every interval seconds."""
+
+    def __init__(self, healthcheck_api, interval=1.0):
+        self.healthcheck_api = healthcheck_api
+        self.interval = interval
+        self.samples = []
+        self._stop = threading.Event()
+        self._thread = None
+
+    def sample(self):
+        timestamp = time.time()
+        start = time.perf_counter()
+        try:
+            ok = self.healthcheck_api.get().status_code == 201
+        except requests.RequestException:
+            ok = False
+        self.samples.append((timestamp, ok, time.perf_counter() - start))
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        while True:
+            self.sample()
+            if self._stop.wait(self.interval):
+                return
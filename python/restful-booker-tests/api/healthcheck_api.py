@@ -1,6 +1,35 @@
+import time
+
+import requests
+
 from .base_api import BaseAPI
 
 
 class HealthCheckAPI(BaseAPI):
     def get(self):
         return self._get("/ping")
+
+    def wait_until_ready(self, timeout=60.0, initial_delay=0.05, max_delay=2.0):
+        """
+        Poll /ping with exponential backoff until it returns 201.
+
+        Returns the seconds waited. Raises TimeoutError naming the last status
+        or connection error once timeout has passed.
+        """
+        start = time.perf_counter()
+        delay = initial_delay
+        while True:
+            try:
+                response = self.get()
+                if response.status_code == 201:
+                    return time.perf_counter() - start
+                last = f"HTTP {response.status_code}"
+            except requests.RequestException as exc:
+                last = f"{type(exc).__name__}: {exc}"
+            remaining = timeout - (time.perf_counter() - start)
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"{self.base_url}/ping not ready after {timeout:g}s ({last})"
+                )
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, max_delay)
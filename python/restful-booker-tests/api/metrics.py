@@ -0,0 +1,226 @@
+import threading
+
+# Values are bucketed on their top SIGNIFICANT_BITS bits, HDR-histogram style,
+# which bounds the relative error of any reported percentile to about 3%
+# while keeping record() to a couple of integer operations and a dict update.
+SIGNIFICANT_BITS = 6
+
+
+class LatencyHistogram:
+    """Log-linear histogram of durations, stored in integer microseconds."""
+
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, seconds):
+        micros = int(seconds * 1_000_000)
+        shift = max(micros.bit_length() - SIGNIFICANT_BITS, 0)
+        bucket = (micros >> shift) << shift
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += micros
+        if micros > self.max:
+            self.max = micros
+
+    def merge(self, other):
+        for bucket, count in other.buckets.items():
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, pct):
+        """Return the pct percentile in seconds, or 0.0 for an empty histogram."""
+        if not self.count:
+            return 0.0
+        rank = pct / 100 * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(bucket, self.max) / 1_000_000
+        return self.max / 1_000_000
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "mean": self.total / self.count / 1_000_000 if self.count else 0.0,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max / 1_000_000,
+        }
+
+    def to_dict(self):
+        return {
+            "buckets": {str(bucket): count for bucket, count in self.buckets.items()},
+            "count": self.count,
+            "total": self.total,
+            "max": self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        histogram = cls()
+        histogram.buckets = {int(b): count for b, count in data["buckets"].items()}
+        histogram.count = data["count"]
+        histogram.total = data["total"]
+        histogram.max = data["max"]
+        return histogram
+
+
+class LatencyRecorder:
+    """BaseAPI hook that keeps one histogram and status tally per endpoint."""
+
+    def __init__(self):
+        self.histograms = {}
+        self.statuses = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, method, route, status, elapsed):
+        key = (method, route)
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = LatencyHistogram()
+                self.statuses[key] = {}
+            histogram.record(elapsed)
+            tally = self.statuses[key]
+            tally[status] = tally.get(status, 0) + 1
+
+    def summary(self):
+        with self._lock:
+            return {
+                f"{method} {route}": {
+                    **histogram.summary(),
+                    "statuses": {
+                        str(status): count
+                        for status, count in self.statuses[(method, route)].items()
+                    },
+                }
+                for (method, route), histogram in sorted(self.histograms.items())
+            }
+
+    def to_dict(self):
+        """Serialize raw histograms so other processes can merge them."""
+        with self._lock:
+            return [
+                {
+                    "method": method,
+                    "route": route,
+                    "histogram": histogram.to_dict(),
+                    "statuses": {
+                        str(status): count
+                        for status, count in self.statuses[(method, route)].items()
+                    },
+                }
+                for (method, route), histogram in self.histograms.items()
+            ]
+
+    def merge_dict(self, data):
+        with self._lock:
+            for entry in data:
+                key = (entry["method"], entry["route"])
+                histogram = LatencyHistogram.from_dict(entry["histogram"])
+                if key in self.histograms:
+                    self.histograms[key].merge(histogram)
+                else:
+                    self.histograms[key] = histogram
+                    self.statuses[key] = {}
+                tally = self.statuses[key]
+                for status, count in entry["statuses"].items():
+                    status = int(status) if status.isdigit() else None
+                    tally[status] = tally.get(status, 0) + count
+
+
+class ConnectionRecorder:
+    """
+    BaseAPI timing hook that keeps connect, TTFB and download histograms per
+    endpoint, and new vs reused connection counts per endpoint and adapter.
+    """
+
+    PHASES = ("connect", "ttfb", "download")
+
+    def __init__(self):
+        self.endpoints = {}
+        self.adapters = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, method, route, timing):
+        key = (method, route)
+        with self._lock:
+            entry = self.endpoints.get(key)
+            if entry is None:
+                entry = self.endpoints[key] = self._entry()
+            # Connect time is only meaningful for requests that opened one.
+            if not timing.reused:
+                entry["connect"].record(timing.connect)
+            entry["ttfb"].record(timing.ttfb)
+            entry["download"].record(timing.download)
+            field = "reused" if timing.reused else "new"
+            entry[field] += 1
+            counts = self.adapters.setdefault(timing.adapter, {"new": 0, "reused": 0})
+            counts[field] += 1
+
+    @classmethod
+    def _entry(cls):
+        return {phase: LatencyHistogram() for phase in cls.PHASES} | {
+            "new": 0,
+            "reused": 0,
+        }
+
+    def summary(self):
+        with self._lock:
+            result = {}
+            for (method, route), entry in sorted(self.endpoints.items()):
+                total = entry["new"] + entry["reused"]
+                result[f"{method} {route}"] = {
+                    "count": total,
+                    "new": entry["new"],
+                    "reused": entry["reused"],
+                    "reuse_rate": entry["reused"] / total if total else 0.0,
+                    **{phase: entry[phase].summary() for phase in self.PHASES},
+                }
+            return result
+
+    def adapter_summary(self):
+        with self._lock:
+            return {
+                name: dict(counts) for name, counts in sorted(self.adapters.items())
+            }
+
+    def to_dict(self):
+        """Serialize raw histograms so other processes can merge them."""
+        with self._lock:
+            return {
+                "endpoints": [
+                    {
+                        "method": method,
+                        "route": route,
+                        "new": entry["new"],
+                        "reused": entry["reused"],
+                        **{phase: entry[phase].to_dict() for phase in self.PHASES},
+                    }
+                    for (method, route), entry in self.endpoints.items()
+                ],
+                "adapters": {name: dict(c) for name, c in self.adapters.items()},
+            }
+
+    def merge_dict(self, data):
+        with self._lock:
+            for item in data["endpoints"]:
+                key = (item["method"], item["route"])
+                entry = self.endpoints.get(key)
+                if entry is None:
+                    entry = self.endpoints[key] = self._entry()
+                for phase in self.PHASES:
+                    entry[phase].merge(LatencyHistogram.from_dict(item[phase]))
+                entry["new"] += item["new"]
+                entry["reused"] += item["reused"]
+            for name, counts in data["adapters"].items():
+                target = self.adapters.setdefault(name, {"new": 0, "reused": 0})
+                target["new"] += counts["new"]
+                target["reused"] += counts["reused"]
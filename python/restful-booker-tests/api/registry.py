@@ -0,0 +1,81 @@
+import threading
+import time
+
+# Statuses restful-booker returns when a booking is already gone.
+GONE_STATUSES = (404, 405)
+
+
+class CleanupReport:
+    def __init__(self):
+        self.deleted = 0
+        self.already_gone = 0
+        self.failed = {}
+        self.duration = 0.0
+
+    def merge_dict(self, data):
+        self.deleted += data["deleted"]
+        self.already_gone += data["already_gone"]
+        self.failed.update(data["failed"])
+        self.duration = max(self.duration, data["duration"])
+
+    def to_dict(self):
+        return {
+            "deleted": self.deleted,
+            "already_gone": self.already_gone,
+            "failed": self.failed,
+            "duration": self.duration,
+        }
+
+    def __str__(self):
+        return (
+            f"deleted {self.deleted} bookings ({self.already_gone} already gone, "
+            f"{len(self.failed)} failed) in {self.duration:.2f}s"
+        )
+
+
+class BookingRegistry:
+    """Thread-safe set of booking IDs created through BookingAPI and not yet deleted."""
+
+    def __init__(self):
+        self._ids = set()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, booking_id):
+        return booking_id in self._ids
+
+    def add(self, booking_id):
+        with self._lock:
+            self._ids.add(booking_id)
+
+    def discard(self, booking_id):
+        with self._lock:
+            self._ids.discard(booking_id)
+
+    def drain(self):
+        with self._lock:
+            ids, self._ids = sorted(self._ids), set()
+        return ids
+
+    def cleanup(self, booking_api, batch_size=500):
+        """Delete every live booking in concurrent batches and report the outcome."""
+        report = CleanupReport()
+        start = time.perf_counter()
+        ids = self.drain()
+        for offset in range(0, len(ids), batch_size):
+            batch = ids[offset : offset + batch_size]
+            result = booking_api.delete_many(batch)
+            for index, booking_id in enumerate(batch):
+                response = result[index]
+                if index in result.errors:
+                    report.failed[str(booking_id)] = repr(result.errors[index])
+                elif response.status_code == 201:
+                    report.deleted += 1
+                elif response.status_code in GONE_STATUSES:
+                    report.already_gone += 1
+                else:
+                    report.failed[str(booking_id)] = f"HTTP {response.status_code}"
+        report.duration = time.perf_counter() - start
+        return report
@@ -0,0 +1,252 @@
+import itertools
+import random
+import re
+import threading
+import time
+
+from .codec import DEFAULT_CODEC
+
+# Schemas are plain Python values: a type (str, int, bool, float), NUMBER,
+# a Pattern, a dict of field schemas (fields wrapped in Optional may be
+# absent, any other field is an error), a one-item list for arrays, or OneOf.
+# compile_schema() turns one into straight-line Python source and execs it
+# once, so checking a booking is a dozen type() and `in` tests.
+
+
+class SchemaError(Exception):
+    pass
+
+
+class Optional:
+    def __init__(self, schema):
+        self.schema = schema
+
+
+class OneOf:
+    def __init__(self, *alternatives):
+        self.alternatives = alternatives
+
+
+class Pattern:
+    def __init__(self, regex, description):
+        self.regex = re.compile(regex)
+        self.description = description
+
+
+NUMBER = object()  # int or float, but not bool
+DATE = Pattern(r"\d{4}-\d{2}-\d{2}", "CCYY-MM-DD date")
+
+BOOKING = {
+    "firstname": str,
+    "lastname": str,
+    "totalprice": NUMBER,
+    "depositpaid": bool,
+    "bookingdates": {"checkin": DATE, "checkout": DATE},
+    "additionalneeds": Optional(str),
+}
+CREATED_BOOKING = {"bookingid": int, "booking": BOOKING}
+AUTH_TOKEN = {"token": str}
+BAD_CREDENTIALS = {"reason": str}
+BOOKING_IDS = [{"bookingid": int}]
+
+# (method, route) -> schema of a 200 JSON response, per test-plan.md section 1.
+RESPONSE_SCHEMAS = {
+    ("POST", "/auth"): OneOf(AUTH_TOKEN, BAD_CREDENTIALS),
+    ("GET", "/booking"): BOOKING_IDS,
+    ("POST", "/booking"): CREATED_BOOKING,
+    ("GET", "/booking/{id}"): BOOKING,
+    ("PUT", "/booking/{id}"): BOOKING,
+    ("PATCH", "/booking/{id}"): BOOKING,
+}
+
+_TYPE_NAMES = {str: "string", int: "integer", bool: "boolean", float: "number"}
+
+
+class _Compiler:
+    def __init__(self):
+        self.namespace = {}
+        self.lines = []
+        self._ids = itertools.count()
+
+    def name(self, prefix):
+        return f"{prefix}{next(self._ids)}"
+
+    def constant(self, value):
+        name = self.name("_c")
+        self.namespace[name] = value
+        return name
+
+    def function(self, schema):
+        name = self.name("_validate")
+        body = []
+        self.emit(body, schema, "data", "'$'", 1)
+        self.lines += [f"def {name}(data):", *body, "    return None", ""]
+        return name
+
+    def emit(self, body, schema, var, path, depth):
+        # path is a Python expression for the JSON path, only evaluated when
+        # a check fails.
+        pad = "    " * depth
+        got = f"' got ' + type({var}).__name__"
+        if isinstance(schema, type) and schema in _TYPE_NAMES:
+            body.append(f"{pad}if type({var}) is not {schema.__name__}:")
+            body.append(
+                f"{pad}    return {path} + ': expected {_TYPE_NAMES[schema]},' + {got}"
+            )
+        elif schema is NUMBER:
+            body.append(f"{pad}if type({var}) is not int and type({var}) is not float:")
+            body.append(f"{pad}    return {path} + ': expected number,' + {got}")
+        elif isinstance(schema, Pattern):
+            regex = self.constant(schema.regex)
+            body.append(
+                f"{pad}if type({var}) is not str or {regex}.fullmatch({var}) is None:"
+            )
+            body.append(
+                f"{pad}    return {path} + ': expected {schema.description}, got '"
+                f" + repr({var})[:40]"
+            )
+        elif isinstance(schema, dict):
+            keys = self.constant(frozenset(schema))
+            body.append(f"{pad}if type({var}) is not dict:")
+            body.append(f"{pad}    return {path} + ': expected object,' + {got}")
+            body.append(f"{pad}if not {var}.keys() <= {keys}:")
+            body.append(
+                f"{pad}    return {path} + ': unexpected field '"
+                f" + repr(sorted({var}.keys() - {keys})[0])"
+            )
+            for key, field in schema.items():
+                child = self.name("v")
+                child_path = f"{path} + {'.' + key!r}"
+                if isinstance(field, Optional):
+                    body.append(f"{pad}if {key!r} in {var}:")
+                    body.append(f"{pad}    {child} = {var}[{key!r}]")
+                    self.emit(body, field.schema, child, child_path, depth + 1)
+                else:
+                    body.append(f"{pad}if {key!r} not in {var}:")
+                    body.append(f"{pad}    return {child_path} + ': missing'")
+                    body.append(f"{pad}{child} = {var}[{key!r}]")
+                    self.emit(body, field, child, child_path, depth)
+        elif isinstance(schema, list):
+            index, item = self.name("i"), self.name("v")
+            body.append(f"{pad}if type({var}) is not list:")
+            body.append(f"{pad}    return {path} + ': expected array,' + {got}")
+            body.append(f"{pad}for {index}, {item} in enumerate({var}):")
+            item_path = f"{path} + '[' + str({index}) + ']'"
+            self.emit(body, schema[0], item, item_path, depth + 1)
+        elif isinstance(schema, OneOf):
+            # Alternatives are separate functions, so their errors are
+            # relative to this value rather than the document root.
+            errors = []
+            for alternative in schema.alternatives:
+                error = self.name("e")
+                errors.append(error)
+                body.append(f"{pad}{error} = {self.function(alternative)}({var})")
+                body.append(f"{pad}if {error} is not None:")
+                pad += "    "
+            joined = " + '; ' + ".join(errors)
+            body.append(
+                f"{pad}return {path} + ': no alternative matched (' + {joined} + ')'"
+            )
+        else:
+            raise TypeError(f"unsupported schema {schema!r}")
+
+
+def compile_schema(schema):
+    """
+    Return validate(data): None if data matches schema, else a message naming
+    the first failing JSON path. The generated source is on validate.source.
+    """
+    compiler = _Compiler()
+    name = compiler.function(schema)
+    source = "\n".join(compiler.lines)
+    exec(compile(source, "<schema>", "exec"), compiler.namespace)
+    validate = compiler.namespace[name]
+    validate.source = source
+    return validate
+
+
+class ResponseValidator:
+    """
+    Checks a sample of 200 JSON responses against RESPONSE_SCHEMAS.
+
+    Used as BaseAPI(validator=...). With strict set a mismatch raises
+    SchemaError; otherwise it is counted and the first max_failures are kept,
+    so the validator can stay on under load. Routes without a schema,
+    non-JSON replies and streamed responses are not checked.
+    """
+
+    def __init__(
+        self,
+        schemas=RESPONSE_SCHEMAS,
+        sample_rate=1.0,
+        strict=False,
+        max_failures=20,
+        codec=DEFAULT_CODEC,
+    ):
+        self.validators = {key: compile_schema(s) for key, s in schemas.items()}
+        self.sample_rate = sample_rate
+        self.strict = strict
+        self.max_failures = max_failures
+        self.codec = codec
+        self.checked = 0
+        self.failed = 0
+        self.seconds = 0.0
+        self.failures = []
+        self._lock = threading.Lock()
+
+    def __call__(self, method, route, response):
+        validate = self.validators.get((method, route))
+        if validate is None or response.status_code != 200:
+            return
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return
+        if not response.headers.get("Content-Type", "").startswith("application/json"):
+            return
+        start = time.perf_counter()
+        try:
+            error = validate(self.codec.loads(response.content))
+        except ValueError as exc:
+            error = f"$: invalid JSON ({exc})"
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.checked += 1
+            self.seconds += elapsed
+            if error is not None:
+                self.failed += 1
+                if len(self.failures) < self.max_failures:
+                    self.failures.append(f"{method} {route}: {error}")
+        if error is not None and self.strict:
+            raise SchemaError(f"{method} {route}: {error}")
+
+    def summary(self):
+        with self._lock:
+            return {
+                "checked": self.checked,
+                "failed": self.failed,
+                "mean_us": self.seconds / self.checked * 1e6 if self.checked else 0.0,
+                "failures": list(self.failures),
+            }
+
+    def to_dict(self):
+        with self._lock:
+            return {
+                "checked": self.checked,
+                "failed": self.failed,
+                "seconds": self.seconds,
+                "failures": list(self.failures),
+            }
+
+    def merge_dict(self, data):
+        with self._lock:
+            self.checked += data["checked"]
+            self.failed += data["failed"]
+            self.seconds += data["seconds"]
+            room = self.max_failures - len(self.failures)
+            self.failures += data["failures"][: max(room, 0)]
+
+    def __str__(self):
+        summary = self.summary()
+        return (
+            f"checked {summary['checked']} responses, {summary['failed']} failed, "
+            f"{summary['mean_us']:.1f}us each (decode + validate)"
+        )
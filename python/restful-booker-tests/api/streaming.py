@@ -0,0 +1,71 @@
+import codecs
+import json
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\r\n"
+# Between elements only; the opening bracket is consumed once by _open, so
+# an element that is itself an array is parsed whole.
+_SEPARATORS = _WHITESPACE + ","
+
+
+def iter_json_array(chunks):
+    """
+    Yield the elements of a top-level JSON array from an iterable of byte chunks.
+
+    Only the unparsed tail is buffered, so memory stays proportional to one
+    element rather than the whole body.
+    """
+    text = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    opened = False
+    for chunk in chunks:
+        buffer += text.decode(chunk)
+        if not opened:
+            buffer, opened = _open(buffer, final=False)
+            if not opened:
+                continue
+        position = yield from _drain(buffer, final=False)
+        if position is None:
+            return
+        buffer = buffer[position:]
+    buffer += text.decode(b"", final=True)
+    if not opened:
+        buffer, opened = _open(buffer, final=True)
+    yield from _drain(buffer, final=True)
+
+
+def _open(buffer, final):
+    # Returns (rest of buffer, True) once the opening bracket has been read,
+    # or (buffer, False) while only whitespace has arrived.
+    start = len(buffer) - len(buffer.lstrip(_WHITESPACE))
+    if start == len(buffer) and not final:
+        return buffer, False
+    if buffer[start : start + 1] != "[":
+        raise json.JSONDecodeError("Expecting '['", buffer, start)
+    return buffer[start + 1 :], True
+
+
+def _drain(buffer, final):
+    # Returns the offset of the first unconsumed character, or None once the
+    # closing bracket has been seen.
+    position = 0
+    length = len(buffer)
+    while True:
+        while position < length and buffer[position] in _SEPARATORS:
+            position += 1
+        if position == length:
+            return position
+        if buffer[position] == "]":
+            return None
+        try:
+            value, end = _decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return position
+        # A value that runs to the end of the buffer may be a number cut off
+        # mid-digit, so wait for the next chunk before trusting it.
+        if end == length and not final:
+            return position
+        yield value
+        position = end
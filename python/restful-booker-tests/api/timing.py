@@ -0,0 +1,140 @@
+import threading
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# The timing of the request the current thread is sending, if any. urllib3
+# connections have no reference back to the adapter, so the adapter publishes
+# the record here for the duration of send().
+_active = threading.local()
+
+
+class RequestTiming:
+    """
+    Where one request's time went, in seconds.
+
+    connect is TCP (and TLS) setup for any connection opened while sending,
+    ttfb runs from writing the request on a connected socket to reading the
+    response headers, and download is reading the body. Retries add to
+    connect and attempts; ttfb is from the last attempt.
+    """
+
+    __slots__ = (
+        "adapter",
+        "connect",
+        "ttfb",
+        "download",
+        "attempts",
+        "opened",
+        "_mark",
+    )
+
+    def __init__(self, adapter):
+        self.adapter = adapter
+        self.connect = 0.0
+        self.ttfb = 0.0
+        self.download = 0.0
+        self.attempts = 0
+        self.opened = 0
+        self._mark = 0.0
+
+    @property
+    def reused(self):
+        """True if the request went out on a pooled, already-open connection."""
+        return self.opened == 0
+
+
+class _TimedConnectionMixin:
+    def connect(self):
+        timing = getattr(_active, "timing", None)
+        if timing is None:
+            return super().connect()
+        start = time.perf_counter()
+        super().connect()
+        timing._mark = time.perf_counter()
+        timing.connect += timing._mark - start
+        timing.opened += 1
+
+    def request(self, *args, **kwargs):
+        timing = getattr(_active, "timing", None)
+        if timing is not None:
+            timing.attempts += 1
+            # Plain HTTP connects lazily inside request(); connect() moves
+            # the mark past the handshake.
+            timing._mark = time.perf_counter()
+        return super().request(*args, **kwargs)
+
+    def getresponse(self, *args, **kwargs):
+        response = super().getresponse(*args, **kwargs)
+        timing = getattr(_active, "timing", None)
+        if timing is not None:
+            timing.ttfb = time.perf_counter() - timing._mark
+        return response
+
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that attaches a RequestTiming to every response as
+    response.timing and counts requests sent on new vs reused connections.
+    """
+
+    def __init__(self, *args, name="session", **kwargs):
+        self.name = name
+        self.requests = 0
+        self.new_connections = 0
+        self.reused_connections = 0
+        self._counter_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool,
+        }
+
+    def send(self, request, stream=False, **kwargs):
+        timing = RequestTiming(self.name)
+        _active.timing = timing
+        try:
+            response = super().send(request, stream=stream, **kwargs)
+        finally:
+            _active.timing = None
+        if not stream:
+            # Session.send would read the body next anyway; reading it here
+            # lets the download be timed on its own.
+            start = time.perf_counter()
+            response.content
+            timing.download = time.perf_counter() - start
+        with self._counter_lock:
+            self.requests += 1
+            self.new_connections += timing.opened
+            self.reused_connections += timing.reused
+        response.timing = timing
+        return response
+
+    def stats(self):
+        with self._counter_lock:
+            return {
+                "requests": self.requests,
+                "new_connections": self.new_connections,
+                "reused_connections": self.reused_connections,
+            }
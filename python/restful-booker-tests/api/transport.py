@@ -0,0 +1,111 @@
+import os
+from dataclasses import dataclass, replace
+
+import httpx
+import requests
+from urllib3.util.retry import Retry
+
+from .timing import TimedHTTPAdapter
+
+# Methods that are safe to resend after a dropped connection or a 5xx.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES = (502, 503, 504)
+
+
+def _env_bool(value):
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+@dataclass(frozen=True)
+class TransportConfig:
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    pool_block: bool = False
+    keep_alive: bool = True
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+    max_retries: int = 3
+    backoff_factor: float = 0.2
+    backoff_jitter: float = 0.1
+    backoff_max: float = 5.0
+
+    @classmethod
+    def from_env(cls, environ=None):
+        """Build a config from HTTP_* variables, keeping defaults for unset ones."""
+        environ = os.environ if environ is None else environ
+        fields = {
+            "pool_connections": ("HTTP_POOL_CONNECTIONS", int),
+            "pool_maxsize": ("HTTP_POOL_MAXSIZE", int),
+            "pool_block": ("HTTP_POOL_BLOCK", _env_bool),
+            "keep_alive": ("HTTP_KEEP_ALIVE", _env_bool),
+            "connect_timeout": ("HTTP_CONNECT_TIMEOUT", float),
+            "read_timeout": ("HTTP_READ_TIMEOUT", float),
+            "max_retries": ("HTTP_MAX_RETRIES", int),
+            "backoff_factor": ("HTTP_BACKOFF_FACTOR", float),
+            "backoff_jitter": ("HTTP_BACKOFF_JITTER", float),
+            "backoff_max": ("HTTP_BACKOFF_MAX", float),
+        }
+        values = {}
+        for field, (name, convert) in fields.items():
+            if environ.get(name):
+                values[field] = convert(environ[name])
+        return cls(**values)
+
+    @property
+    def timeout(self):
+        return (self.connect_timeout, self.read_timeout)
+
+    @property
+    def async_timeout(self):
+        return httpx.Timeout(self.read_timeout, connect=self.connect_timeout)
+
+    def async_limits(self, max_connections):
+        """httpx pool limits; with keep_alive off no connection is kept idle."""
+        return httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections if self.keep_alive else 0,
+        )
+
+    def probe(self, connect_timeout=1.0):
+        """
+        Config for readiness probes: no urllib3 retries and a short connect
+        timeout, so the caller's own backoff loop sets the polling rate.
+        """
+        return replace(
+            self,
+            max_retries=0,
+            connect_timeout=min(self.connect_timeout, connect_timeout),
+        )
+
+    def retry(self):
+        # Exponential backoff (factor * 2**n, capped at backoff_max) plus up to
+        # backoff_jitter seconds of random jitter so parallel clients spread out.
+        return Retry(
+            total=self.max_retries,
+            allowed_methods=IDEMPOTENT_METHODS,
+            status_forcelist=RETRY_STATUSES,
+            backoff_factor=self.backoff_factor,
+            backoff_jitter=self.backoff_jitter,
+            backoff_max=self.backoff_max,
+            raise_on_status=False,
+        )
+
+
+DEFAULT_TRANSPORT = TransportConfig()
+
+
+def build_session(config=DEFAULT_TRANSPORT, name="session"):
+    """Build a session whose adapter, labelled name, times every request."""
+    session = requests.Session()
+    adapter = TimedHTTPAdapter(
+        name=name,
+        pool_connections=config.pool_connections,
+        pool_maxsize=config.pool_maxsize,
+        pool_block=config.pool_block,
+        max_retries=config.retry(),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if not config.keep_alive:
+        session.headers["Connection"] = "close"
+    return session
@@ -0,0 +1,123 @@
+"""
+Latency baselines for the benchmark suite
+
+Baselines are stored per SUT version in one JSON file. A run is compared with
+the baseline for its own version, or, for a version seen for the first time,
+with the most recently recorded version against the same kind of target, so
+a new SUT image is checked against the one it replaces.
+"""
+
+import datetime
+import json
+import os
+
+METRICS = (("median", "p50"), ("p95", "p95"))
+
+
+class Comparison:
+    def __init__(
+        self, operation, current, baseline=None, version=None, threshold=0.2, floor=0
+    ):
+        self.operation = operation
+        self.current = current
+        self.baseline = baseline
+        self.version = version
+        self.threshold = threshold
+        # Changes smaller than floor seconds never count, so microsecond
+        # jitter on very fast operations cannot fail a run.
+        self.floor = floor
+
+    def rows(self):
+        """Yield (metric, baseline, current, relative change) per compared metric."""
+        for label, key in METRICS:
+            current = self.current[key]
+            if self.baseline is None:
+                yield label, None, current, None
+                continue
+            base = self.baseline[key]
+            change = (current - base) / base if base else 0.0
+            yield label, base, current, change
+
+    @property
+    def regressions(self):
+        return [
+            label
+            for label, base, current, change in self.rows()
+            if change is not None
+            and change > self.threshold
+            and current - base > self.floor
+        ]
+
+    @property
+    def regressed(self):
+        return bool(self.regressions)
+
+    def __str__(self):
+        parts = []
+        for label, base, current, change in self.rows():
+            if base is None:
+                parts.append(f"{label} {current * 1000:.2f}ms")
+            else:
+                parts.append(
+                    f"{label} {base * 1000:.2f}ms -> {current * 1000:.2f}ms "
+                    f"({change:+.1%})"
+                )
+        text = f"{self.operation}: " + ", ".join(parts)
+        if self.baseline is None:
+            return text + " (no baseline)"
+        text += f" vs {self.version}"
+        if self.regressed:
+            text += (
+                f" REGRESSED: {', '.join(self.regressions)} "
+                f"over +{self.threshold:.0%}"
+            )
+        return text
+
+
+class BaselineStore:
+    def __init__(self, path):
+        self.path = path
+        try:
+            with open(path) as f:
+                self.data = json.load(f)
+        except FileNotFoundError:
+            self.data = {}
+
+    def baseline(self, version, target):
+        """Return (version, operations) to compare a run of version against."""
+        if version in self.data:
+            return version, self.data[version]["operations"]
+        candidates = [
+            (entry["recorded_at"], name)
+            for name, entry in self.data.items()
+            if entry.get("target") == target
+        ]
+        if not candidates:
+            return None, {}
+        _, name = max(candidates)
+        return name, self.data[name]["operations"]
+
+    def compare(self, version, target, operation, current, threshold, floor=0):
+        baseline_version, operations = self.baseline(version, target)
+        return Comparison(
+            operation,
+            current,
+            operations.get(operation),
+            baseline_version,
+            threshold,
+            floor,
+        )
+
+    def record(self, version, target, results):
+        """Store results for version, keeping operations this run did not measure."""
+        entry = self.data.setdefault(version, {"operations": {}})
+        entry["target"] = target
+        entry["recorded_at"] = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        entry["operations"].update(results)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        partial = f"{self.path}.partial"
+        with open(partial, "w") as f:
+            json.dump(self.data, f, indent=2, sort_keys=True)
+        os.replace(partial, self.path)
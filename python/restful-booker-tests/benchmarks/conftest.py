@@ -0,0 +1,135 @@
+"""
+Benchmark suite fixtures
+
+Run with `pytest benchmarks` (single process). Every benchmark times an
+operation through the same clients the functional tests use, compares median
+and p95 with the stored baseline for SUT_VERSION and fails past
+BENCH_THRESHOLD. A run with no regressions becomes the new baseline.
+"""
+
+import html
+import os
+import time
+
+import pytest
+
+from api.metrics import LatencyHistogram
+from benchmarks.baseline import BaselineStore
+from fake_server import FAKE_BASE_URL
+
+BASE_URL = os.getenv("BASE_URL", "http://localhost:3001")
+TARGET = "fake" if BASE_URL == FAKE_BASE_URL else "sut"
+SUT_VERSION = os.getenv("SUT_VERSION") or ("fake" if TARGET == "fake" else "unknown")
+BENCH_BASELINES = os.getenv("BENCH_BASELINES", "benchmarks/baselines.json")
+BENCH_THRESHOLD = float(os.getenv("BENCH_THRESHOLD", "0.2"))
+BENCH_FLOOR = float(os.getenv("BENCH_FLOOR", "0.0005"))
+BENCH_ROUNDS = int(os.getenv("BENCH_ROUNDS", "50"))
+BENCH_WARMUP = int(os.getenv("BENCH_WARMUP", "5"))
+# Set to record this run as the baseline even if it regressed.
+BENCH_UPDATE_BASELINE = os.getenv("BENCH_UPDATE_BASELINE", "").lower() in ("1", "true")
+
+comparisons_key = pytest.StashKey[list]()
+
+
+class Benchmark:
+    """Times func() for warmup + rounds calls and checks it against the baseline."""
+
+    def __init__(self, request, store, results):
+        self.request = request
+        self.store = store
+        self.results = results
+        self.warmup = BENCH_WARMUP
+        self.rounds = BENCH_ROUNDS
+
+    @property
+    def calls(self):
+        return self.warmup + self.rounds
+
+    def __call__(self, operation, func, status=200):
+        for _ in range(self.warmup):
+            func()
+        histogram = LatencyHistogram()
+        for _ in range(self.rounds):
+            start = time.perf_counter()
+            response = func()
+            histogram.record(time.perf_counter() - start)
+            assert (
+                response.status_code == status
+            ), f"{operation}: {response.status_code}"
+
+        summary = histogram.summary()
+        comparison = self.store.compare(
+            SUT_VERSION, TARGET, operation, summary, BENCH_THRESHOLD, BENCH_FLOOR
+        )
+        self.results[operation] = summary
+        self.request.config.stash[comparisons_key].append(comparison)
+        _attach_html(self.request, comparison)
+        if comparison.regressed:
+            pytest.fail(str(comparison), pytrace=False)
+        return summary
+
+
+@pytest.fixture(scope="session")
+def baseline_store(request):
+    if os.getenv("PYTEST_XDIST_WORKER"):
+        raise pytest.UsageError("benchmarks must run in a single process (no -n)")
+    request.config.stash[comparisons_key] = []
+    store = BaselineStore(BENCH_BASELINES)
+    results = {}
+    yield store, results
+    comparisons = request.config.stash[comparisons_key]
+    if results and (BENCH_UPDATE_BASELINE or not any(c.regressed for c in comparisons)):
+        store.record(SUT_VERSION, TARGET, results)
+
+
+@pytest.fixture
+def benchmark(request, baseline_store):
+    store, results = baseline_store
+    return Benchmark(request, store, results)
+
+
+def _table(comparisons):
+    rows = []
+    for comparison in comparisons:
+        for label, base, current, change in comparison.rows():
+            style = ' style="color:#c00"' if label in comparison.regressions else ""
+            rows.append(
+                f"<tr{style}>"
+                f"<td>{html.escape(comparison.operation)}</td><td>{label}</td>"
+                f"<td>{'' if base is None else f'{base * 1000:.2f}'}</td>"
+                f"<td>{current * 1000:.2f}</td>"
+                f"<td>{'' if change is None else f'{change:+.1%}'}</td></tr>"
+            )
+    return (
+        "<table><tr><th>operation</th><th>metric</th><th>baseline ms</th>"
+        "<th>current ms</th><th>change</th></tr>" + "".join(rows) + "</table>"
+    )
+
+
+def _attach_html(request, comparison):
+    if not request.config.pluginmanager.hasplugin("html"):
+        return
+    import pytest_html
+
+    request.getfixturevalue("extras").append(
+        pytest_html.extras.html(_table([comparison]))
+    )
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix, session):
+    comparisons = session.config.stash.get(comparisons_key, None)
+    if comparisons:
+        prefix.append(
+            f"<h2>Benchmarks: SUT {html.escape(SUT_VERSION)}, "
+            f"threshold +{BENCH_THRESHOLD:.0%}</h2>" + _table(comparisons)
+        )
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    comparisons = config.stash.get(comparisons_key, None)
+    if not comparisons:
+        return
+    terminalreporter.section(f"benchmarks (SUT {SUT_VERSION})")
+    for comparison in comparisons:
+        terminalreporter.write_line(str(comparison))
@@ -0,0 +1,102 @@
+"""
+Client Operation Benchmarks
+
+One micro-benchmark per client operation in api/, timed end to end through
+the same clients as the functional tests and compared with stored baselines.
+"""
+
+from utils import sample_booking
+
+
+class TestClientBenchmarks:
+    """Median and p95 latency per client operation"""
+
+    def test_BENCH_001_create(self, benchmark, booking_api):
+        """
+        BENCH-001: Create
+        POST /booking
+        Expected: No median/p95 regression past the threshold
+        """
+        payload = sample_booking("Bench", "Create")
+        benchmark("create", lambda: booking_api.create(payload))
+
+    def test_BENCH_002_get(self, benchmark, booking_api):
+        """
+        BENCH-002: Get
+        GET /booking/:id
+        Expected: No median/p95 regression past the threshold
+        """
+        booking_id = booking_api.create(sample_booking("Bench", "Get")).json()[
+            "bookingid"
+        ]
+        benchmark("get", lambda: booking_api.get(booking_id))
+
+    def test_BENCH_003_get_all_filtered(self, benchmark, booking_api, booking_factory):
+        """
+        BENCH-003: Get All with Filters
+        GET /booking?firstname=&lastname=&checkin=
+        Expected: No median/p95 regression past the threshold
+        """
+        payload = booking_factory.booking("Bench", "Filter")
+        booking_api.create(payload)
+        benchmark(
+            "get_all_filtered",
+            lambda: booking_api.get_all(
+                firstname=payload["firstname"],
+                lastname=payload["lastname"],
+                checkin="2025-11-30",
+            ),
+        )
+
+    def test_BENCH_004_update(self, benchmark, booking_api):
+        """
+        BENCH-004: Update
+        PUT /booking/:id with the cached token
+        Expected: No median/p95 regression past the threshold
+        """
+        payload = sample_booking("Bench", "Update")
+        booking_id = booking_api.create(payload).json()["bookingid"]
+        benchmark("update", lambda: booking_api.update(booking_id, payload))
+
+    def test_BENCH_005_partial_update(self, benchmark, booking_api):
+        """
+        BENCH-005: Partial Update
+        PATCH /booking/:id with the cached token
+        Expected: No median/p95 regression past the threshold
+        """
+        booking_id = booking_api.create(sample_booking("Bench", "Patch")).json()[
+            "bookingid"
+        ]
+        benchmark(
+            "partial_update",
+            lambda: booking_api.partial_update(booking_id, {"totalprice": 321}),
+        )
+
+    def test_BENCH_006_delete(self, benchmark, booking_api):
+        """
+        BENCH-006: Delete
+        DELETE /booking/:id, one pre-created booking per call
+        Expected: No median/p95 regression past the threshold
+        """
+        created = booking_api.create_many(
+            sample_booking("Bench", "Delete") for _ in range(benchmark.calls)
+        )
+        booking_ids = iter(resp.json()["bookingid"] for resp in created)
+        benchmark("delete", lambda: booking_api.delete(next(booking_ids)), status=201)
+
+    def test_BENCH_007_auth(self, benchmark, auth_api):
+        """
+        BENCH-007: Auth
+        POST /auth with valid credentials
+        Expected: No median/p95 regression past the threshold
+        """
+        credentials = {"username": auth_api.username, "password": auth_api.password}
+        benchmark("auth", lambda: auth_api.create(credentials))
+
+    def test_BENCH_008_ping(self, benchmark, healthcheck_api):
+        """
+        BENCH-008: Ping
+        GET /ping
+        Expected: No median/p95 regression past the threshold
+        """
+        benchmark("ping", healthcheck_api.get, status=201)
@@ -0,0 +1,140 @@
+"""
+Deterministic booking data generator
+
+Streams an unlimited sequence of unique booking payloads for bulk, load and
+soak runs. The same seed always yields the same sequence, and a share of the
+records exercise the edge cases from the CREATE section of the test plan.
+"""
+
+import datetime
+import itertools
+import random
+
+FIRST_NAMES = (
+    "James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda",
+    "David", "Elizabeth", "Sally", "Jim", "Aoife", "José", "Zoë", "Łukasz",
+    "Søren", "Chloé", "Αλέξανδρος", "Мария", "さくら", "李",
+)  # fmt: skip
+LAST_NAMES = (
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+    "Wilson", "Taylor", "Müller", "Núñez", "O'Connor", "Kowalski", "Jørgensen",
+    "Παπαδόπουλος", "Иванов", "山田", "王",
+)  # fmt: skip
+ADDITIONAL_NEEDS = (
+    "Breakfast", "Lunch", "Dinner", "Late checkout", "Airport transfer",
+    "Extra bed", "Sea view", "",
+)  # fmt: skip
+SPECIAL_CHARACTERS = "!@#$%^&*()<>?/\\|{}[]~`'\""
+
+# Every date is drawn from a fixed window; formatting it once up front keeps
+# per-record work to an index lookup.
+DATE_WINDOW_START = datetime.date(2024, 1, 1)
+DATE_WINDOW_DAYS = 3 * 366
+_DATES = [
+    (DATE_WINDOW_START + datetime.timedelta(days=offset)).isoformat()
+    for offset in range(DATE_WINDOW_DAYS + 31)
+]
+_PAST_DATES = [
+    (datetime.date(2000, 1, 1) + datetime.timedelta(days=offset)).isoformat()
+    for offset in range(366)
+]
+
+
+def _zero_price(booking, rng):
+    booking["totalprice"] = 0
+
+
+def _negative_price(booking, rng):
+    booking["totalprice"] = -rng.randint(1, 500)
+
+
+def _decimal_price(booking, rng):
+    booking["totalprice"] = rng.randint(100, 99999) / 100
+
+
+def _empty_firstname(booking, rng):
+    booking["firstname"] = ""
+
+
+def _special_characters(booking, rng):
+    booking["firstname"] += "".join(rng.sample(SPECIAL_CHARACTERS, 4))
+
+
+def _long_names(booking, rng):
+    booking["firstname"] = booking["firstname"] * (256 // len(booking["firstname"]) + 1)
+    booking["lastname"] = "L" * 256 + booking["lastname"]
+
+
+def _past_dates(booking, rng):
+    checkin = rng.randrange(len(_PAST_DATES) - 30)
+    booking["bookingdates"] = {
+        "checkin": _PAST_DATES[checkin],
+        "checkout": _PAST_DATES[checkin + rng.randint(1, 30)],
+    }
+
+
+def _checkout_before_checkin(booking, rng):
+    dates = booking["bookingdates"]
+    dates["checkin"], dates["checkout"] = dates["checkout"], dates["checkin"]
+
+
+# Test plan ID -> mutation applied to a freshly built record.
+EDGE_CASES = {
+    "CREATE-007": _zero_price,
+    "CREATE-008": _negative_price,
+    "VALID-006": _decimal_price,
+    "CREATE-011": _empty_firstname,
+    "CREATE-012": _special_characters,
+    "CREATE-013": _long_names,
+    "CREATE-014": _past_dates,
+    "CREATE-015": _checkout_before_checkin,
+}
+
+
+class BookingGenerator:
+    """
+    Iterable of unique booking payloads, reproducible from seed.
+
+    Uniqueness comes from a sequence number suffixed to the lastname (and the
+    optional namespace), so it holds for any number of records. Each record is
+    a new dict; nothing is copied from a template.
+    """
+
+    def __init__(
+        self, seed=0, namespace="", edge_case_rate=0.0, edge_cases=None, max_stay=14
+    ):
+        self.seed = seed
+        self.namespace = namespace
+        self.edge_case_rate = edge_case_rate
+        self.edge_cases = [EDGE_CASES[case] for case in (edge_cases or EDGE_CASES)]
+        self.max_stay = max_stay
+
+    def __iter__(self):
+        rng = random.Random(self.seed)
+        suffix = f"-{self.namespace}" if self.namespace else ""
+        for sequence in itertools.count():
+            checkin = rng.randrange(DATE_WINDOW_DAYS)
+            booking = {
+                "firstname": rng.choice(FIRST_NAMES),
+                "lastname": f"{rng.choice(LAST_NAMES)}{suffix}-{sequence:x}",
+                "totalprice": rng.randint(1, 2000),
+                "depositpaid": rng.random() < 0.7,
+                "bookingdates": {
+                    "checkin": _DATES[checkin],
+                    "checkout": _DATES[checkin + rng.randint(1, self.max_stay)],
+                },
+                "additionalneeds": rng.choice(ADDITIONAL_NEEDS),
+            }
+            if self.edge_case_rate and rng.random() < self.edge_case_rate:
+                rng.choice(self.edge_cases)(booking, rng)
+            yield booking
+
+    def take(self, count):
+        """Return the first count records as a list."""
+        return list(itertools.islice(self, count))
+
+    def batches(self, size):
+        """Yield successive lists of size records, forever."""
+        records = iter(self)
+        while True:
+            yield list(itertools.islice(records, size))
@@ -1,49 +1,231 @@
 import pytest
+import pytest_asyncio
 import os
-import requests
+import uuid
+import httpx
 from dotenv import load_dotenv
+from api.async_auth_api import AsyncAuthAPI
+from api.async_booking_api import AsyncBookingAPI
+from api.async_healthcheck_api import AsyncHealthCheckAPI
 from api.auth_api import AuthAPI
 from api.booking_api import BookingAPI
+from api.cache import ResponseCache
+from api.cassette import REPLAY, AsyncCassetteTransport, Cassette, use_cassette
+from api.codec import get_codec
 from api.healthcheck_api import HealthCheckAPI
+from api.transport import TransportConfig, build_session
+from fake_server import DEFAULT_PASSWORD, DEFAULT_USERNAME, FAKE_BASE_URL, FakeServer
+from utils import BookingFactory
+
+pytest_plugins = [
+    "plugins.latency",
+    "plugins.cleanup",
+    "plugins.health",
+    "plugins.durations",
+    "plugins.connections",
+    "plugins.schema",
+]
 
 # Load environment variables from .env file
 load_dotenv()
 
 BASE_URL = os.getenv("BASE_URL", "http://localhost:3001")
+ASYNC_MAX_CONNECTIONS = int(os.getenv("ASYNC_MAX_CONNECTIONS", "100"))
+BULK_MAX_WORKERS = int(os.getenv("BULK_MAX_WORKERS", "10"))
+TOKEN_TTL = float(os.getenv("TOKEN_TTL", "600"))
+JSON_CODEC = os.getenv("JSON_CODEC")
+BOOKING_CACHE_SIZE = int(os.getenv("BOOKING_CACHE_SIZE", "0"))
+# CASSETTE_MODE=record saves every client request/response to CASSETTE_PATH;
+# CASSETTE_MODE=replay serves them back without touching the SUT.
+CASSETTE_MODE = os.getenv("CASSETTE_MODE")
+CASSETTE_PATH = os.getenv("CASSETTE_PATH", "cassettes/suite.cassette")
 
 
 @pytest.fixture(scope="session")
-def base_url():
-    return BASE_URL
+def fake_server():
+    # BASE_URL=fake runs the suite against an in-process fake SUT; this is
+    # that server, or None against any other target.
+    if BASE_URL != FAKE_BASE_URL:
+        yield None
+        return
+    with FakeServer(
+        username=os.getenv("AUTH_USERNAME"), password=os.getenv("AUTH_PASSWORD")
+    ) as server:
+        yield server
+
+
+@pytest.fixture(scope="session")
+def base_url(fake_server):
+    return BASE_URL if fake_server is None else fake_server.url
+
+
+@pytest.fixture(scope="session")
+def fake_sut():
+    # True when the suite runs against the in-process fake (BASE_URL=fake),
+    # for checks that only hold for its serialized store.
+    return BASE_URL == FAKE_BASE_URL
+
+
+@pytest.fixture(scope="session")
+def live_base_url(base_url, sut_ready):
+    # For tests that open their own sessions or processes: those bypass the
+    # cassette, so on replay there may be no SUT for them to reach.
+    if CASSETTE_MODE == REPLAY:
+        pytest.skip("opens its own connections, which a cassette cannot replay")
+    return base_url
 
 
 @pytest.fixture(scope="session")
 def auth_username():
+    if BASE_URL == FAKE_BASE_URL:
+        return os.getenv("AUTH_USERNAME", DEFAULT_USERNAME)
     return os.getenv("AUTH_USERNAME")
 
 
 @pytest.fixture(scope="session")
 def auth_password():
+    if BASE_URL == FAKE_BASE_URL:
+        return os.getenv("AUTH_PASSWORD", DEFAULT_PASSWORD)
     return os.getenv("AUTH_PASSWORD")
 
 
 @pytest.fixture(scope="session")
-def session():
-    session = requests.Session()
+def data_namespace():
+    if CASSETTE_MODE:
+        # Replay matches on request bodies, so names must repeat between runs.
+        return "cassette"
+    # Session fixtures are per process, so under pytest-xdist every worker
+    # gets its own session, pool and token; this namespace keeps the data
+    # each worker creates apart from the others and from earlier runs.
+    run_id = os.getenv("PYTEST_XDIST_TESTRUNUID") or uuid.uuid4().hex
+    worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+    return f"{run_id[:8]}{worker}"
+
+
+@pytest.fixture(scope="session")
+def booking_factory(data_namespace):
+    return BookingFactory(data_namespace)
+
+
+@pytest.fixture(scope="session")
+def transport():
+    return TransportConfig.from_env()
+
+
+@pytest.fixture(scope="session")
+def cassette():
+    if not CASSETTE_MODE:
+        yield None
+        return
+    if os.getenv("PYTEST_XDIST_WORKER"):
+        raise pytest.UsageError("CASSETTE_MODE needs a single-process run (no -n)")
+    cassette = Cassette(CASSETTE_PATH, CASSETTE_MODE)
+    yield cassette
+    cassette.close()
+
+
+@pytest.fixture(scope="session")
+def session(transport, cassette):
+    session = build_session(transport)
     session.headers.update({"Content-type": "application/json"})
-    return session
+    if cassette is not None:
+        use_cassette(session, cassette)
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def client_options(
+    transport, latency_recorder, connection_recorder, response_validator
+):
+    # BaseAPI keyword arguments shared by every client fixture.
+    return {
+        "transport": transport,
+        "hooks": [latency_recorder],
+        "timing_hooks": [connection_recorder],
+        "validator": response_validator,
+        "codec": get_codec(JSON_CODEC),
+    }
+
+
+@pytest.fixture(scope="session")
+def auth_api(
+    base_url, session, client_options, auth_username, auth_password, sut_ready
+):
+    return AuthAPI(
+        base_url,
+        session,
+        username=auth_username,
+        password=auth_password,
+        token_ttl=TOKEN_TTL,
+        **client_options,
+    )
 
 
 @pytest.fixture(scope="session")
-def auth_api(base_url, session, auth_username, auth_password):
-    return AuthAPI(base_url, session, username=auth_username, password=auth_password)
+def booking_api(
+    base_url, session, client_options, auth_api, booking_registry, sut_ready
+):
+    return BookingAPI(
+        base_url,
+        session,
+        max_workers=BULK_MAX_WORKERS,
+        auth_api=auth_api,
+        registry=booking_registry,
+        cache=ResponseCache(BOOKING_CACHE_SIZE) if BOOKING_CACHE_SIZE else None,
+        **client_options,
+    )
 
 
 @pytest.fixture(scope="session")
-def booking_api(base_url, session):
-    return BookingAPI(base_url, session)
+def healthcheck_api(base_url, session, client_options, sut_ready):
+    return HealthCheckAPI(base_url, session, **client_options)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_client(transport, cassette, sut_ready):
+    # One pooled client shared by every async API object, so concurrent
+    # requests reuse keep-alive connections instead of opening new ones.
+    limits = transport.async_limits(ASYNC_MAX_CONNECTIONS)
+    pool = httpx.AsyncHTTPTransport(limits=limits)
+    if cassette is not None:
+        pool = AsyncCassetteTransport(cassette, pool)
+    async with httpx.AsyncClient(
+        headers={"Content-type": "application/json"},
+        transport=pool,
+        timeout=transport.async_timeout,
+    ) as client:
+        yield client
 
 
 @pytest.fixture(scope="session")
-def healthcheck_api(base_url, session):
-    return HealthCheckAPI(base_url, session)
+def async_client_options(client_options):
+    # AsyncBaseAPI takes everything BaseAPI does except timing_hooks.
+    return {k: v for k, v in client_options.items() if k != "timing_hooks"}
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_auth_api(
+    base_url, async_client, async_client_options, auth_username, auth_password
+):
+    return AsyncAuthAPI(
+        base_url,
+        async_client,
+        username=auth_username,
+        password=auth_password,
+        **async_client_options,
+    )
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_booking_api(
+    base_url, async_client, async_client_options, booking_registry
+):
+    return AsyncBookingAPI(
+        base_url, async_client, registry=booking_registry, **async_client_options
+    )
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_healthcheck_api(base_url, async_client, async_client_options):
+    return AsyncHealthCheckAPI(base_url, async_client, **async_client_options)
@@ -0,0 +1,3 @@
+from .server import DEFAULT_PASSWORD, DEFAULT_USERNAME, FAKE_BASE_URL, FakeServer
+
+__all__ = ["DEFAULT_PASSWORD", "DEFAULT_USERNAME", "FAKE_BASE_URL", "FakeServer"]
@@ -0,0 +1,89 @@
+"""
+Request and response formats the SUT accepts besides JSON
+
+XML bodies are one element per field; url-encoded bodies nest with brackets
+(bookingdates[checkin]). Like Express, replies in these formats go out as
+text/html, so clients must know which format they asked for.
+
+Deliberately written apart from api/codec.py: the fake is there to catch the
+clients' codecs drifting from the SUT, which it cannot do if it shares them.
+"""
+
+import re
+from urllib.parse import parse_qsl, urlencode
+from xml.etree import ElementTree
+
+XML_TYPES = ("text/xml", "application/xml")
+FORM_TYPE = "application/x-www-form-urlencoded"
+# Only these booking fields are typed; every other value stays a string.
+NUMBER_FIELDS = ("bookingid", "totalprice")
+BOOLEAN_FIELDS = ("depositpaid",)
+_NUMBER = re.compile(r"-?\d+(\.\d+)?")
+
+
+def _value(field, text):
+    text = text or ""
+    if field in BOOLEAN_FIELDS and text in ("true", "false"):
+        return text == "true"
+    if field in NUMBER_FIELDS and _NUMBER.fullmatch(text):
+        return float(text) if "." in text else int(text)
+    return text
+
+
+def _text(value):
+    if isinstance(value, bool):
+        return str(value).lower()
+    return str(value)
+
+
+def parse_xml(body):
+    def read(element):
+        return {
+            child.tag: read(child) if len(child) else _value(child.tag, child.text)
+            for child in element
+        }
+
+    try:
+        return read(ElementTree.fromstring(body))
+    except ElementTree.ParseError:
+        return None
+
+
+def render_xml(data, root):
+    def fill(parent, value):
+        for key, item in value.items():
+            child = ElementTree.SubElement(parent, key)
+            if isinstance(item, dict):
+                fill(child, item)
+            else:
+                child.text = _text(item)
+
+    element = ElementTree.Element(root)
+    fill(element, data)
+    return (
+        b"<?xml version='1.0'?>"
+        + ElementTree.tostring(element, encoding="unicode").encode()
+    )
+
+
+def parse_form(body):
+    result = {}
+    for name, value in parse_qsl(body.decode(), keep_blank_values=True):
+        *parents, leaf = re.findall(r"[^\[\]]+", name)
+        target = result
+        for parent in parents:
+            target = target.setdefault(parent, {})
+        target[leaf] = _value(leaf, value)
+    return result
+
+
+def render_form(data):
+    def pairs(value, prefix):
+        for key, item in value.items():
+            name = key if prefix is None else f"{prefix}[{key}]"
+            if isinstance(item, dict):
+                yield from pairs(item, name)
+            else:
+                yield name, _text(item)
+
+    return urlencode(list(pairs(data, None))).encode()
@@ -0,0 +1,284 @@
+"""
+In-process fake of the restful-booker API
+
+Implements /auth, /booking, /booking/:id and /ping with the status codes the
+suite expects from the real SUT, so tests can run without the container.
+Set BASE_URL=fake to have conftest.py start one on a free port.
+
+Usage: python -m fake_server --port 3001
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import secrets
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from .formats import (
+    FORM_TYPE,
+    XML_TYPES,
+    parse_form,
+    parse_xml,
+    render_form,
+    render_xml,
+)
+from .store import REQUIRED_FIELDS, BookingStore
+
+FAKE_BASE_URL = "fake"
+DEFAULT_USERNAME = "admin"
+DEFAULT_PASSWORD = "password123"
+
+
+class BookerHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this, Nagle plus
+    # delayed ACKs add ~40ms to every keep-alive request.
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_PATCH(self):
+        self._dispatch("PATCH")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method):
+        url = urlsplit(self.path)
+        parts = [part for part in url.path.split("/") if part]
+        length = int(self.headers.get("Content-Length") or 0)
+        self.body = self.rfile.read(length) if length else b""
+        if parts == ["ping"] and method == "GET":
+            return self._text(201, "Created")
+        if parts == ["auth"] and method == "POST":
+            return self._auth()
+        if parts == ["booking"] and method == "GET":
+            return self._search(parse_qs(url.query))
+        if parts == ["booking"] and method == "POST":
+            return self._create()
+        if len(parts) == 2 and parts[0] == "booking":
+            handler = {
+                "GET": self._get,
+                "PUT": self._replace,
+                "PATCH": self._update,
+                "DELETE": self._delete,
+            }.get(method)
+            if handler:
+                return handler(parts[1])
+        self._text(404, "Not Found")
+
+    def _auth(self):
+        payload = self._payload()
+        if (
+            isinstance(payload, dict)
+            and payload.get("username") == self.server.username
+            and payload.get("password") == self.server.password
+        ):
+            return self._send_json(200, {"token": self.server.issue_token()})
+        self._send_json(200, {"reason": "Bad credentials"})
+
+    def _search(self, query):
+        filters = {
+            name: values[0]
+            for name, values in query.items()
+            if name in ("firstname", "lastname", "checkin", "checkout")
+        }
+        ids = self.server.store.search(**filters)
+        self._send_json(200, [{"bookingid": booking_id} for booking_id in ids])
+
+    def _create(self):
+        booking = self._payload()
+        if not self._complete(booking):
+            return self._text(500, "Internal Server Error")
+        booking_id = self.server.store.create(booking)
+        self._send_booking(
+            {"bookingid": booking_id, "booking": booking}, "created-booking"
+        )
+
+    def _get(self, raw_id):
+        booking = self.server.store.get(self._booking_id(raw_id))
+        if booking is None:
+            return self._text(404, "Not Found")
+        self._send_booking(booking)
+
+    def _replace(self, raw_id):
+        if not self._authorized():
+            return self._text(403, "Forbidden")
+        booking = self._payload()
+        if not self._complete(booking):
+            return self._text(400, "Bad Request")
+        if not self.server.store.replace(self._booking_id(raw_id), booking):
+            return self._text(405, "Method Not Allowed")
+        self._send_booking(booking)
+
+    def _update(self, raw_id):
+        if not self._authorized():
+            return self._text(403, "Forbidden")
+        fields = self._payload()
+        if not isinstance(fields, dict):
+            return self._text(400, "Bad Request")
+        booking = self.server.store.update(self._booking_id(raw_id), fields)
+        if booking is None:
+            return self._text(405, "Method Not Allowed")
+        self._send_booking(booking)
+
+    def _delete(self, raw_id):
+        if not self._authorized():
+            return self._text(403, "Forbidden")
+        if not self.server.store.delete(self._booking_id(raw_id)):
+            return self._text(405, "Method Not Allowed")
+        self._text(201, "Created")
+
+    def _authorized(self):
+        for cookie in self.headers.get("Cookie", "").split(";"):
+            name, _, value = cookie.strip().partition("=")
+            if name == "token" and self.server.valid_token(value):
+                return True
+        scheme, _, encoded = self.headers.get("Authorization", "").partition(" ")
+        if scheme.lower() == "basic":
+            try:
+                credentials = base64.b64decode(encoded).decode()
+            except ValueError:
+                return False
+            return credentials == f"{self.server.username}:{self.server.password}"
+        return False
+
+    @staticmethod
+    def _booking_id(raw_id):
+        return int(raw_id) if raw_id.isdigit() else None
+
+    @staticmethod
+    def _complete(booking):
+        return isinstance(booking, dict) and all(f in booking for f in REQUIRED_FIELDS)
+
+    def _payload(self):
+        # Booking bodies may also be XML or url-encoded, chosen by Content-Type.
+        content_type = self.headers.get("Content-Type", "").split(";")[0].strip()
+        if content_type in XML_TYPES:
+            return parse_xml(self.body)
+        if content_type == FORM_TYPE:
+            return parse_form(self.body)
+        try:
+            return json.loads(self.body or b"{}")
+        except ValueError:
+            return None
+
+    def _send_json(self, status, data):
+        self._send(status, json.dumps(data).encode(), "application/json; charset=utf-8")
+
+    def _send_booking(self, data, root="booking"):
+        # Replies follow Accept; like the SUT, XML and form replies are
+        # sent as text/html and anything unrecognised gets a 418.
+        accept = self.headers.get("Accept", "*/*")
+        if "application/json" in accept or "*/*" in accept:
+            return self._send_json(200, data)
+        if "application/xml" in accept or "text/xml" in accept:
+            return self._send(200, render_xml(data, root), "text/html; charset=utf-8")
+        if FORM_TYPE in accept:
+            return self._send(200, render_form(data), "text/html; charset=utf-8")
+        self._text(418, "I'm a Teapot")
+
+    def _text(self, status, text):
+        self._send(status, text.encode(), "text/plain; charset=utf-8")
+
+    def _send(self, status, body, content_type):
+        if self.command == "GET" and status == 200:
+            # Weak ETags and If-None-Match handling, as Express does for the real SUT.
+            etag = f'W/"{len(body):x}-{hashlib.sha1(body).hexdigest()[:27]}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            self.send_response(status)
+            self.send_header("ETag", etag)
+        else:
+            self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class FakeServer(ThreadingHTTPServer):
+    """Threaded fake SUT; use as a context manager to serve in the background."""
+
+    daemon_threads = True
+
+    def __init__(self, host="127.0.0.1", port=0, username=None, password=None):
+        super().__init__((host, port), BookerHandler)
+        self.username = username or DEFAULT_USERNAME
+        self.password = password or DEFAULT_PASSWORD
+        self.store = BookingStore()
+        self._tokens = set()
+        self._tokens_lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def issue_token(self):
+        token = secrets.token_hex(8)
+        with self._tokens_lock:
+            self._tokens.add(token)
+        return token
+
+    def valid_token(self, token):
+        with self._tokens_lock:
+            return token in self._tokens
+
+    def revoke_token(self, token):
+        """Stop accepting token, as if it had expired on the real SUT."""
+        with self._tokens_lock:
+            self._tokens.discard(token)
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fake restful-booker server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3001)
+    args = parser.parse_args(argv)
+    server = FakeServer(args.host, args.port)
+    print(f"fake restful-booker listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+In-memory booking store for the fake restful-booker server
+
+Name filters are answered from hash indexes and date filters from sorted
+indexes, so GET /booking stays fast however many bookings accumulate.
+"""
+
+import bisect
+import threading
+
+REQUIRED_FIELDS = ("firstname", "lastname", "totalprice", "depositpaid", "bookingdates")
+
+
+class BookingStore:
+    def __init__(self):
+        self._bookings = {}
+        self._next_id = 1
+        self._by_firstname = {}
+        self._by_lastname = {}
+        # Sorted (date, booking_id) pairs; CCYY-MM-DD strings sort as dates.
+        self._by_checkin = []
+        self._by_checkout = []
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._bookings)
+
+    def create(self, booking):
+        with self._lock:
+            booking_id = self._next_id
+            self._next_id += 1
+            self._bookings[booking_id] = booking
+            self._index(booking_id, booking)
+        return booking_id
+
+    def get(self, booking_id):
+        with self._lock:
+            return self._bookings.get(booking_id)
+
+    def replace(self, booking_id, booking):
+        """Swap in a new booking; returns False if the ID does not exist."""
+        with self._lock:
+            old = self._bookings.get(booking_id)
+            if old is None:
+                return False
+            self._unindex(booking_id, old)
+            self._bookings[booking_id] = booking
+            self._index(booking_id, booking)
+        return True
+
+    def update(self, booking_id, fields):
+        """Merge fields into a booking and return the result, or None if missing."""
+        with self._lock:
+            old = self._bookings.get(booking_id)
+            if old is None:
+                return None
+            booking = {**old, **fields}
+            if "bookingdates" in fields and isinstance(old.get("bookingdates"), dict):
+                booking["bookingdates"] = {
+                    **old["bookingdates"],
+                    **fields["bookingdates"],
+                }
+            self._unindex(booking_id, old)
+            self._bookings[booking_id] = booking
+            self._index(booking_id, booking)
+        return booking
+
+    def delete(self, booking_id):
+        with self._lock:
+            booking = self._bookings.pop(booking_id, None)
+            if booking is None:
+                return False
+            self._unindex(booking_id, booking)
+        return True
+
+    def search(self, firstname=None, lastname=None, checkin=None, checkout=None):
+        """Return sorted IDs matching every given filter (dates match on or after)."""
+        with self._lock:
+            candidates = []
+            if firstname is not None:
+                candidates.append(self._by_firstname.get(firstname, set()))
+            if lastname is not None:
+                candidates.append(self._by_lastname.get(lastname, set()))
+            if checkin is not None:
+                candidates.append(self._on_or_after(self._by_checkin, checkin))
+            if checkout is not None:
+                candidates.append(self._on_or_after(self._by_checkout, checkout))
+            if not candidates:
+                return sorted(self._bookings)
+            candidates.sort(key=len)
+            return sorted(candidates[0].intersection(*candidates[1:]))
+
+    @staticmethod
+    def _on_or_after(index, date):
+        start = bisect.bisect_left(index, (date,))
+        return {booking_id for _, booking_id in index[start:]}
+
+    def _index(self, booking_id, booking):
+        for names, name in self._names(booking):
+            names.setdefault(name, set()).add(booking_id)
+        for index, date in self._dates(booking):
+            bisect.insort(index, (date, booking_id))
+
+    def _unindex(self, booking_id, booking):
+        for names, name in self._names(booking):
+            ids = names[name]
+            ids.discard(booking_id)
+            if not ids:
+                del names[name]
+        for index, date in self._dates(booking):
+            position = bisect.bisect_left(index, (date, booking_id))
+            del index[position]
+
+    def _names(self, booking):
+        # Query strings can only ever match string names, so nothing else is indexed.
+        if isinstance(booking.get("firstname"), str):
+            yield self._by_firstname, booking["firstname"]
+        if isinstance(booking.get("lastname"), str):
+            yield self._by_lastname, booking["lastname"]
+
+    def _dates(self, booking):
+        dates = booking.get("bookingdates")
+        if not isinstance(dates, dict):
+            return
+        if isinstance(dates.get("checkin"), str):
+            yield self._by_checkin, dates["checkin"]
+        if isinstance(dates.get("checkout"), str):
+            yield self._by_checkout, dates["checkout"]
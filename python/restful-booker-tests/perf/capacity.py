@@ -0,0 +1,235 @@
+"""
+Capacity finder
+
+Drives a booking scenario from --max-concurrency closed-loop workers, with
+every request gated by an AdaptiveLimiter whose latency target is the SLO.
+The limiter ramps the in-flight limit up additively until requests break the
+SLO or the SUT answers 5xx / drops connections, then backs off, so the limit
+settles where the SUT saturates. Every interval the runner records the limit,
+request throughput and latency, and the report names the highest throughput
+that stayed within the p95 SLO and where the SLO first broke.
+
+Usage: python -m perf.capacity --scenario crud --slo 0.2 --duration 60
+"""
+
+import argparse
+import json
+import statistics
+import threading
+import time
+
+from api.concurrency import AdaptiveLimiter
+from api.metrics import LatencyHistogram
+from perf.clients import Clients
+from perf.scenarios import SCENARIOS
+
+
+class CapacityProbe:
+    """BaseAPI hook that collects request latency and errors per window."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self.latency = LatencyHistogram()
+        self.server_errors = 0
+        self.failures = 0
+
+    def __call__(self, method, route, status, elapsed):
+        with self._lock:
+            self.latency.record(elapsed)
+            if status is None:
+                self.failures += 1
+            elif status >= 500:
+                self.server_errors += 1
+
+    def swap(self):
+        """Return (latency, server_errors, failures) so far and start a new window."""
+        with self._lock:
+            window = (self.latency, self.server_errors, self.failures)
+            self._reset()
+        return window
+
+
+def find_capacity(
+    clients, probe, limiter, scenario, duration, interval, workers=None, on_window=None
+):
+    """
+    Run scenario(clients) in a closed loop for duration seconds.
+
+    clients must have been built with probe as a hook and limiter as their
+    limiter. Returns one dict per interval.
+    """
+    stop = threading.Event()
+    iterations = [0, 0]  # completed, raised
+    lock = threading.Lock()
+
+    def worker():
+        while not stop.is_set():
+            failed = 0
+            try:
+                scenario(clients)
+            except Exception:
+                failed = 1
+            with lock:
+                iterations[0] += 1
+                iterations[1] += failed
+
+    threads = [
+        threading.Thread(target=worker, daemon=True)
+        for _ in range(workers or limiter.max_limit)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    windows = []
+    last = start
+    try:
+        while not stop.is_set():
+            stop.wait(min(interval, max(start + duration - time.perf_counter(), 0)))
+            if time.perf_counter() - start >= duration:
+                stop.set()
+            latency, server_errors, failures = probe.swap()
+            with lock:
+                completed, raised = iterations
+                iterations[:] = [0, 0]
+            now = time.perf_counter()
+            summary = latency.summary()
+            sample = {
+                "elapsed": now - start,
+                "limit": limiter.snapshot()["limit"],
+                "requests": latency.count,
+                "throughput": latency.count / (now - last),
+                "iterations": completed,
+                "scenario_errors": raised,
+                "server_errors": server_errors,
+                "failures": failures,
+                **{key: summary[key] for key in ("p50", "p95", "p99")},
+            }
+            last = now
+            windows.append(sample)
+            if on_window is not None:
+                on_window(sample)
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+    return windows
+
+
+def saturation(windows, slo):
+    """
+    Summarize capacity windows against a p95 SLO in seconds.
+
+    - sustainable: the window with the highest throughput whose p95 met the
+      SLO without 5xx or connection failures
+    - first_break: the first window that missed the SLO or saw errors
+    - settled_limit: median limiter limit over the second half of the run,
+      i.e. the concurrency the SUT sustains
+    """
+
+    def healthy(sample):
+        return (
+            sample["requests"]
+            and sample["p95"] <= slo
+            and not sample["server_errors"]
+            and not sample["failures"]
+        )
+
+    good = [sample for sample in windows if healthy(sample)]
+    broken = [
+        sample for sample in windows if sample["requests"] and not healthy(sample)
+    ]
+    tail = windows[len(windows) // 2 :]
+    return {
+        "slo_p95": slo,
+        "sustainable": max(good, key=lambda sample: sample["throughput"], default=None),
+        "first_break": broken[0] if broken else None,
+        "settled_limit": statistics.median(s["limit"] for s in tail) if tail else None,
+    }
+
+
+def format_window(sample):
+    return (
+        f"{sample['elapsed']:>7.1f}s limit={sample['limit']:>6.1f} "
+        f"{sample['throughput']:>8.1f} req/s p50={sample['p50'] * 1000:>7.2f}ms "
+        f"p95={sample['p95'] * 1000:>7.2f}ms 5xx={sample['server_errors']} "
+        f"conn={sample['failures']}"
+    )
+
+
+def format_report(report, limiter):
+    lines = []
+    sustainable = report["sustainable"]
+    if sustainable is None:
+        lines.append(f"no window met p95 <= {report['slo_p95'] * 1000:.0f}ms")
+    else:
+        lines.append(
+            f"max sustainable  {sustainable['throughput']:.1f} req/s at "
+            f"limit {sustainable['limit']:.1f} "
+            f"(p95 {sustainable['p95'] * 1000:.2f}ms)"
+        )
+    first_break = report["first_break"]
+    if first_break is not None:
+        lines.append(
+            f"SLO first broke  at {first_break['elapsed']:.1f}s, "
+            f"limit {first_break['limit']:.1f}, "
+            f"p95 {first_break['p95'] * 1000:.2f}ms, "
+            f"{first_break['server_errors']} 5xx, {first_break['failures']} failed"
+        )
+    if report["settled_limit"] is not None:
+        lines.append(f"settled limit    {report['settled_limit']:.1f} in flight")
+    lines.append(f"limiter          {limiter.snapshot()}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="crud")
+    parser.add_argument("--slo", type=float, default=0.2, help="p95 seconds")
+    parser.add_argument("--duration", type=float, default=60.0, help="seconds")
+    parser.add_argument("--interval", type=float, default=2.0, help="seconds")
+    parser.add_argument("--initial-concurrency", type=int, default=2)
+    parser.add_argument("--max-concurrency", type=int, default=64)
+    parser.add_argument("--base-url", default=None)
+    parser.add_argument("--json", dest="json_path", default=None)
+    args = parser.parse_args(argv)
+
+    probe = CapacityProbe()
+    limiter = AdaptiveLimiter(
+        initial=args.initial_concurrency,
+        max_limit=args.max_concurrency,
+        latency_target=args.slo,
+    )
+    clients = Clients(
+        args.base_url, workers=args.max_concurrency, hooks=[probe], limiter=limiter
+    )
+    try:
+        windows = find_capacity(
+            clients,
+            probe,
+            limiter,
+            SCENARIOS[args.scenario],
+            args.duration,
+            args.interval,
+            on_window=lambda sample: print(format_window(sample), flush=True),
+        )
+    finally:
+        cleanup = clients.close()
+
+    report = saturation(windows, args.slo)
+    print(format_report(report, limiter))
+    print(f"cleanup          {cleanup}")
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(
+                {"windows": windows, "limiter": limiter.snapshot(), **report},
+                f,
+                indent=2,
+            )
+    return 0 if report["sustainable"] is not None else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
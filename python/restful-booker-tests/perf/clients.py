@@ -0,0 +1,89 @@
+"""
+Client wiring for the perf tools
+
+Builds the same AuthAPI/BookingAPI/HealthCheckAPI objects the pytest fixtures
+use, from the same environment variables, so scenarios exercise the functional clients.
+"""
+
+import os
+from dataclasses import replace
+
+from dotenv import load_dotenv
+
+from api.auth_api import AuthAPI
+from api.booking_api import BookingAPI
+from api.codec import get_codec
+from api.healthcheck_api import HealthCheckAPI
+from api.registry import BookingRegistry
+from api.schema import ResponseValidator
+from api.transport import TransportConfig, build_session
+from fake_server import FAKE_BASE_URL, FakeServer
+
+
+class Clients:
+    def __init__(
+        self,
+        base_url=None,
+        workers=None,
+        hooks=(),
+        username=None,
+        password=None,
+        limiter=None,
+    ):
+        load_dotenv()
+        self.base_url = base_url or os.getenv("BASE_URL", "http://localhost:3001")
+        username = username or os.getenv("AUTH_USERNAME")
+        password = password or os.getenv("AUTH_PASSWORD")
+        self.fake_server = None
+        if self.base_url == FAKE_BASE_URL:
+            self.fake_server = FakeServer(username=username, password=password)
+            self.fake_server.start()
+            self.base_url = self.fake_server.url
+            username, password = self.fake_server.username, self.fake_server.password
+        codec = get_codec(os.getenv("JSON_CODEC"))
+        # SCHEMA_SAMPLE_RATE=0.1 checks a tenth of responses during load runs.
+        sample_rate = float(os.getenv("SCHEMA_SAMPLE_RATE", "0"))
+        self.validator = (
+            ResponseValidator(sample_rate=sample_rate, codec=codec)
+            if sample_rate
+            else None
+        )
+        transport = TransportConfig.from_env()
+        if workers and workers > transport.pool_maxsize:
+            # Give every worker thread its own pooled connection.
+            transport = replace(transport, pool_maxsize=workers)
+        self.transport = transport
+        options = {
+            "transport": transport,
+            "hooks": hooks,
+            "codec": codec,
+            "limiter": limiter,
+            "validator": self.validator,
+        }
+        self.session = build_session(transport, name="perf")
+        self.session.headers.update({"Content-type": "application/json"})
+        self.auth_api = AuthAPI(
+            self.base_url,
+            self.session,
+            username=username,
+            password=password,
+            **options,
+        )
+        self.registry = BookingRegistry()
+        self.booking_api = BookingAPI(
+            self.base_url,
+            self.session,
+            max_workers=workers or transport.pool_maxsize,
+            auth_api=self.auth_api,
+            registry=self.registry,
+            **options,
+        )
+        self.healthcheck_api = HealthCheckAPI(self.base_url, self.session, **options)
+
+    def close(self, cleanup=True):
+        """Delete bookings the run left behind, then release the pool."""
+        report = self.registry.cleanup(self.booking_api) if cleanup else None
+        self.session.close()
+        if self.fake_server is not None:
+            self.fake_server.stop()
+        return report
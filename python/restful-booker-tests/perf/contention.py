@@ -0,0 +1,309 @@
+"""
+Write contention harness
+
+N workers PATCH single fields and PUT whole bookings on the same booking
+("same"), on pairs of bookings shared with a neighbour ("overlap"), or on one
+booking each ("disjoint", the no-contention baseline). Every write carries a
+value no other write uses and goes into an operation log with its client-side
+start and end times. After each step the bookings are read back and every
+field is reconciled against the log: the final value must come from a write
+that no other successful write started after, otherwise an update was lost.
+PATCH replies are also checked to echo the value just written. Running the
+steps at increasing N shows how write throughput scales under contention.
+
+Usage: python -m perf.contention --workers 1,2,4,8 --duration 5 --pattern same
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+
+from api.metrics import LatencyHistogram
+from perf.clients import Clients
+from utils import sample_booking
+
+FIELDS = ("firstname", "lastname", "totalprice", "additionalneeds")
+PATTERNS = ("same", "overlap", "disjoint")
+
+
+class Operation:
+    """One logged write: which fields of which booking it set, and when."""
+
+    __slots__ = ("worker", "booking_id", "kind", "fields", "start", "end", "status")
+
+    def __init__(self, worker, booking_id, kind, fields, start, end, status):
+        self.worker = worker
+        self.booking_id = booking_id
+        self.kind = kind
+        self.fields = fields
+        self.start = start
+        self.end = end
+        self.status = status
+
+    @property
+    def applied(self):
+        return self.status == 200
+
+    @property
+    def ambiguous(self):
+        # A dropped connection or 5xx may or may not have reached the store.
+        return self.status is None or self.status >= 500
+
+    def __str__(self):
+        return f"{self.kind} by worker {self.worker} ({self.status})"
+
+
+def unique_values(worker, seq):
+    return {
+        "firstname": f"W{worker}N{seq}",
+        "lastname": f"L{worker}N{seq}",
+        "totalprice": worker * 1_000_000 + seq,
+        "additionalneeds": f"A{worker}N{seq}",
+    }
+
+
+def targets(pattern, worker, bookings):
+    if pattern == "same":
+        return bookings[:1]
+    if pattern == "overlap":
+        return [bookings[worker], bookings[(worker + 1) % len(bookings)]]
+    return [bookings[worker]]
+
+
+def run_contention(
+    booking_api, workers, duration, pattern="same", put_share=0.2, seed=0
+):
+    """
+    Create the bookings for one step, run workers writers for duration
+    seconds, and return (bookings, log, elapsed, echo_errors). The creates
+    are logged as the first write to every field.
+    """
+    log = []
+    bookings = []
+    for index in range(1 if pattern == "same" else workers):
+        fields = unique_values(-1, index)
+        start = time.perf_counter()
+        response = booking_api.create(
+            sample_booking(fields["firstname"], fields["lastname"]) | fields
+        )
+        response.raise_for_status()
+        booking_id = booking_api.decode(response)["bookingid"]
+        bookings.append(booking_id)
+        log.append(
+            Operation(-1, booking_id, "create", fields, start, time.perf_counter(), 200)
+        )
+
+    stop = threading.Event()
+    lock = threading.Lock()
+    echo_errors = []
+
+    def writer(worker):
+        rng = random.Random(seed * 1000 + worker)
+        mine = targets(pattern, worker, bookings)
+        entries = []
+        seq = 0
+        while not stop.is_set():
+            seq += 1
+            booking_id = rng.choice(mine)
+            values = unique_values(worker, seq)
+            if rng.random() < put_share:
+                kind, fields = "PUT", values
+                body = sample_booking(values["firstname"], values["lastname"]) | values
+                send = booking_api.update
+            else:
+                field = rng.choice(FIELDS)
+                kind, fields = f"PATCH {field}", {field: values[field]}
+                body = fields
+                send = booking_api.partial_update
+            status = None
+            start = time.perf_counter()
+            try:
+                response = send(booking_id, body)
+                status = response.status_code
+            except Exception:
+                pass
+            end = time.perf_counter()
+            entries.append(
+                Operation(worker, booking_id, kind, fields, start, end, status)
+            )
+            if status == 200:
+                echoed = booking_api.decode(response)
+                wrong = {k: v for k, v in fields.items() if echoed.get(k) != v}
+                if wrong:
+                    with lock:
+                        echo_errors.append(
+                            f"booking {booking_id}: {kind} by worker {worker} "
+                            f"echoed {', '.join(f'{k}={echoed.get(k)!r}' for k in wrong)}"
+                        )
+        with lock:
+            log.extend(entries)
+
+    threads = [
+        threading.Thread(target=writer, args=(worker,), daemon=True)
+        for worker in range(workers)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    stop.wait(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return bookings, log, elapsed, echo_errors
+
+
+def reconcile(log, final):
+    """
+    Check final states ({booking_id: booking}) against the operation log.
+
+    Each field is a register: a write is superseded when another applied
+    write to the same field started after it ended, so the final value must
+    come from a write that is not. Ambiguous writes (no reply, 5xx) may be
+    the final value but never supersede anything. Returns findings as text.
+    """
+    findings = []
+    missing = set()
+    writes = {}
+    for operation in log:
+        if operation.applied or operation.ambiguous:
+            for field, value in operation.fields.items():
+                key = (operation.booking_id, field)
+                writes.setdefault(key, []).append((operation, value))
+
+    for (booking_id, field), entries in sorted(writes.items()):
+        booking = final.get(booking_id)
+        if booking is None:
+            if booking_id not in missing:
+                missing.add(booking_id)
+                findings.append(f"booking {booking_id}: missing after the run")
+            continue
+        value = booking.get(field)
+        latest_start = max(
+            (operation.start for operation, _ in entries if operation.applied),
+            default=float("-inf"),
+        )
+        current = [
+            (operation, written)
+            for operation, written in entries
+            if operation.end >= latest_start
+        ]
+        if any(written == value for _, written in current):
+            continue
+        source = next((op for op, written in entries if written == value), None)
+        winners = ", ".join(f"{op} wrote {written!r}" for op, written in current)
+        if source is None:
+            findings.append(
+                f"booking {booking_id}: {field}={value!r} was never written "
+                f"(expected one of: {winners})"
+            )
+        else:
+            findings.append(
+                f"booking {booking_id}: lost update on {field}: final value "
+                f"{value!r} from {source}, overwritten by a later write "
+                f"that is gone ({winners})"
+            )
+    return findings
+
+
+def step_summary(workers, log, elapsed, findings, echo_errors):
+    latency = LatencyHistogram()
+    statuses = {}
+    writes = 0
+    for operation in log:
+        if operation.kind == "create":
+            continue
+        writes += 1
+        latency.record(operation.end - operation.start)
+        statuses[str(operation.status)] = statuses.get(str(operation.status), 0) + 1
+    summary = latency.summary()
+    return {
+        "workers": workers,
+        "writes": writes,
+        "throughput": writes / elapsed if elapsed else 0.0,
+        "p50": summary["p50"],
+        "p95": summary["p95"],
+        "p99": summary["p99"],
+        "statuses": statuses,
+        "lost_updates": findings,
+        "echo_errors": echo_errors,
+    }
+
+
+def run_scaling(booking_api, steps, duration, pattern, put_share=0.2, on_step=None):
+    """Run one contention step per worker count and return their summaries."""
+    results = []
+    for index, workers in enumerate(steps):
+        bookings, log, elapsed, echo_errors = run_contention(
+            booking_api, workers, duration, pattern, put_share, seed=index
+        )
+        final = {}
+        for booking_id in bookings:
+            response = booking_api.get(booking_id)
+            if response.status_code == 200:
+                final[booking_id] = booking_api.decode(response)
+        summary = step_summary(
+            workers, log, elapsed, reconcile(log, final), echo_errors
+        )
+        base = results[0] if results else summary
+        summary["efficiency"] = (
+            summary["throughput"] / (base["throughput"] / base["workers"] * workers)
+            if base["throughput"]
+            else 0.0
+        )
+        results.append(summary)
+        if on_step is not None:
+            on_step(summary)
+    return results
+
+
+def format_step(summary):
+    statuses = " ".join(f"{s}:{n}" for s, n in sorted(summary["statuses"].items()))
+    return (
+        f"N={summary['workers']:<3} {summary['throughput']:>8.1f} writes/s "
+        f"efficiency={summary['efficiency']:>5.0%} "
+        f"p50={summary['p50'] * 1000:>7.2f}ms p95={summary['p95'] * 1000:>7.2f}ms "
+        f"lost={len(summary['lost_updates'])} echo={len(summary['echo_errors'])} "
+        f"[{statuses}]"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", default="1,2,4,8", help="comma-separated steps")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per step")
+    parser.add_argument("--pattern", choices=PATTERNS, default="same")
+    parser.add_argument("--put-share", type=float, default=0.2)
+    parser.add_argument("--base-url", default=None)
+    parser.add_argument("--json", dest="json_path", default=None)
+    args = parser.parse_args(argv)
+    steps = [int(step) for step in args.workers.split(",")]
+
+    clients = Clients(args.base_url, workers=max(steps))
+    try:
+        results = run_scaling(
+            clients.booking_api,
+            steps,
+            args.duration,
+            args.pattern,
+            args.put_share,
+            on_step=lambda summary: print(format_step(summary), flush=True),
+        )
+    finally:
+        cleanup = clients.close()
+
+    for summary in results:
+        for finding in summary["lost_updates"] + summary["echo_errors"]:
+            print(f"N={summary['workers']} {finding}")
+    print(f"cleanup  {cleanup}")
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+    flagged = any(s["lost_updates"] or s["echo_errors"] for s in results)
+    return 1 if flagged else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,108 @@
+"""
+Booking format benchmark
+
+Compares the request/response formats the SUT accepts on the booking
+endpoints: encode and decode cost per booking, request and response sizes,
+and end-to-end POST /booking and GET /booking/{id} latency through BookingAPI.
+
+Usage: python -m perf.formats --iterations 500 --base-url fake
+"""
+
+import argparse
+import json
+import time
+import timeit
+
+from api.codec import get_codec, orjson
+from api.metrics import LatencyHistogram
+from perf.clients import Clients
+from utils import sample_booking
+
+FORMATS = ["json"] + (["orjson"] if orjson is not None else []) + ["xml", "form"]
+
+
+def codec_costs(codec, booking, number=2000):
+    """Return per-call encode/decode seconds and encoded size for one booking."""
+    encoded = codec.dumps(booking)
+    return {
+        "encode": timeit.timeit(lambda: codec.dumps(booking), number=number) / number,
+        "decode": timeit.timeit(lambda: codec.loads(encoded), number=number) / number,
+        "request_bytes": len(encoded),
+    }
+
+
+def endpoint_latency(booking_api, codec, booking, iterations):
+    """Time create and get round trips, including decoding, in codec's format."""
+    create, get = LatencyHistogram(), LatencyHistogram()
+    response_bytes = 0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        response = booking_api.create(booking, codec=codec)
+        response.raise_for_status()
+        booking_id = booking_api.decode(response, codec)["bookingid"]
+        create.record(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        response = booking_api.get(booking_id, codec=codec)
+        response.raise_for_status()
+        booking_api.decode(response, codec)
+        get.record(time.perf_counter() - start)
+        response_bytes += len(response.content)
+    return {
+        "create": create.summary(),
+        "get": get.summary(),
+        "response_bytes": response_bytes / iterations if iterations else 0,
+    }
+
+
+def run_benchmark(booking_api, formats=FORMATS, iterations=200):
+    booking = sample_booking("Benchmark", "Format")
+    results = {}
+    for name in formats:
+        codec = get_codec(name)
+        results[name] = {
+            **codec_costs(codec, booking),
+            **endpoint_latency(booking_api, codec, booking, iterations),
+        }
+    return results
+
+
+def format_table(results):
+    lines = [
+        f"{'format':<8} {'encode us':>10} {'decode us':>10} {'req B':>6} "
+        f"{'resp B':>7} {'create p50':>11} {'get p50':>9} {'get p99':>9}"
+    ]
+    for name, stats in results.items():
+        lines.append(
+            f"{name:<8} {stats['encode'] * 1e6:>10.2f} {stats['decode'] * 1e6:>10.2f} "
+            f"{stats['request_bytes']:>6} {stats['response_bytes']:>7.0f} "
+            f"{stats['create']['p50'] * 1000:>9.2f}ms "
+            f"{stats['get']['p50'] * 1000:>7.2f}ms {stats['get']['p99'] * 1000:>7.2f}ms"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=FORMATS)
+    parser.add_argument("--base-url", default=None)
+    parser.add_argument("--json", dest="json_path", default=None)
+    args = parser.parse_args(argv)
+
+    clients = Clients(args.base_url)
+    try:
+        results = run_benchmark(clients.booking_api, args.formats, args.iterations)
+    finally:
+        cleanup = clients.close()
+
+    print(format_table(results))
+    print(f"cleanup   {cleanup}")
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
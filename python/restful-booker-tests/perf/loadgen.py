@@ -0,0 +1,166 @@
+"""
+Open-loop load generator
+
+Starts scenario iterations at a target rate with ramp-up, steady-state and
+ramp-down phases. Start times are fixed up front and latency is measured from
+the intended start, so a slow SUT shows up as higher latency rather than as
+fewer requests (no coordinated omission).
+
+Usage: python -m perf.loadgen --scenario crud --rate 20 --ramp-up 10 --steady 60
+"""
+
+import argparse
+import json
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from api.metrics import LatencyHistogram, LatencyRecorder
+from perf.clients import Clients
+from perf.scenarios import SCENARIOS
+
+
+def arrival_times(rate, ramp_up=0.0, steady=0.0, ramp_down=0.0):
+    """Yield intended start offsets in seconds for a linear ramp/flat/ramp profile."""
+    if rate <= 0:
+        return
+    up = rate * ramp_up / 2
+    flat = rate * steady
+    down = rate * ramp_down / 2
+    # The k-th arrival is where the integrated rate reaches k, which has a
+    # closed form in each phase.
+    for k in range(int(up + flat + down)):
+        if k < up:
+            yield math.sqrt(2 * ramp_up * k / rate)
+        elif k < up + flat:
+            yield ramp_up + (k - up) / rate
+        else:
+            remaining = max(1 - 2 * (k - up - flat) / (rate * ramp_down), 0.0)
+            yield ramp_up + steady + ramp_down * (1 - math.sqrt(remaining))
+
+
+class LoadResult:
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.errors = {}
+        self.completed = 0
+        self.max_lag = 0.0
+        self.duration = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, elapsed, error=None):
+        with self._lock:
+            self.completed += 1
+            self.latency.record(elapsed)
+            if error is not None:
+                key = f"{type(error).__name__}: {error}"
+                self.errors[key] = self.errors.get(key, 0) + 1
+
+    @property
+    def error_count(self):
+        return sum(self.errors.values())
+
+    def summary(self, requests=None):
+        return {
+            "iterations": self.completed,
+            "duration": self.duration,
+            "throughput": self.completed / self.duration if self.duration else 0.0,
+            "error_rate": self.error_count / self.completed if self.completed else 0.0,
+            "max_schedule_lag": self.max_lag,
+            "latency": self.latency.summary(),
+            "errors": self.errors,
+            "requests": requests or {},
+        }
+
+
+def run_load(scenario, clients, schedule, workers):
+    """Run scenario(clients) once per offset in schedule and return a LoadResult."""
+    result = LoadResult()
+
+    def iteration(intended):
+        error = None
+        try:
+            scenario(clients)
+        except Exception as exc:
+            error = exc
+        result.record(time.perf_counter() - intended, error)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        start = time.perf_counter()
+        for offset in schedule:
+            intended = start + offset
+            delay = intended - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                result.max_lag = max(result.max_lag, -delay)
+            executor.submit(iteration, intended)
+    result.duration = time.perf_counter() - start
+    return result
+
+
+def format_summary(summary):
+    lines = [
+        f"iterations     {summary['iterations']}",
+        f"duration       {summary['duration']:.2f}s",
+        f"throughput     {summary['throughput']:.2f} it/s",
+        f"error rate     {summary['error_rate']:.2%}",
+        f"schedule lag   {summary['max_schedule_lag'] * 1000:.2f}ms max",
+    ]
+    latency = summary["latency"]
+    lines.append(
+        "latency (ms)   "
+        + " ".join(
+            f"{key}={latency[key] * 1000:.2f}" for key in ("p50", "p95", "p99", "max")
+        )
+    )
+    for error, count in summary["errors"].items():
+        lines.append(f"  {count:>6} x {error}")
+    for endpoint, stats in summary["requests"].items():
+        lines.append(
+            f"  {endpoint:<22} n={stats['count']:<7} "
+            f"p50={stats['p50'] * 1000:.2f} p99={stats['p99'] * 1000:.2f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="crud")
+    parser.add_argument("--rate", type=float, required=True, help="iterations/s")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="seconds")
+    parser.add_argument("--steady", type=float, default=60.0, help="seconds")
+    parser.add_argument("--ramp-down", type=float, default=0.0, help="seconds")
+    parser.add_argument("--workers", type=int, default=64)
+    parser.add_argument("--base-url", default=None)
+    parser.add_argument("--json", dest="json_path", default=None)
+    args = parser.parse_args(argv)
+
+    recorder = LatencyRecorder()
+    clients = Clients(args.base_url, workers=args.workers, hooks=[recorder])
+    try:
+        result = run_load(
+            SCENARIOS[args.scenario],
+            clients,
+            arrival_times(args.rate, args.ramp_up, args.steady, args.ramp_down),
+            args.workers,
+        )
+        summary = result.summary(recorder.summary())
+    finally:
+        cleanup = clients.close()
+
+    print(format_summary(summary))
+    print(f"cleanup        {cleanup}")
+    if clients.validator is not None:
+        print(f"schema         {clients.validator}")
+        for failure in clients.validator.failures:
+            print(f"  {failure}")
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(summary, f, indent=2)
+    return 1 if result.error_count else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,93 @@
+"""
+Load scenarios
+
+Each scenario replays one integration-test workflow through the functional
+clients and raises ScenarioError when a step returns an unexpected status.
+Booking bodies are rendered from a pre-encoded template so the hot loop only
+serializes the names it changes.
+"""
+
+import itertools
+
+from api.codec import PayloadTemplate
+from utils import sample_booking
+
+_sequence = itertools.count()
+_templates = {}
+
+
+class ScenarioError(Exception):
+    pass
+
+
+def expect(response, status, step):
+    if response.status_code != status:
+        raise ScenarioError(f"{step}: expected {status}, got {response.status_code}")
+    return response
+
+
+def booking_body(booking_api, first="John", last="Doe"):
+    template = _templates.get(booking_api.codec.name)
+    if template is None:
+        template = _templates[booking_api.codec.name] = PayloadTemplate(
+            sample_booking(), ("firstname", "lastname"), codec=booking_api.codec
+        )
+    return template.render(firstname=first, lastname=last)
+
+
+def crud_flow(clients):
+    """INT-001: Create → Read → Update → Delete → Verify."""
+    booking_api = clients.booking_api
+    create_resp = expect(
+        booking_api.create(booking_body(booking_api, "Jim", "Brown")), 200, "create"
+    )
+    booking_id = booking_api.decode(create_resp)["bookingid"]
+    expect(booking_api.get(booking_id), 200, "read")
+    expect(
+        booking_api.update(booking_id, booking_body(booking_api, "James", "Brown")),
+        200,
+        "update",
+    )
+    expect(booking_api.delete(booking_id), 201, "delete")
+    expect(booking_api.get(booking_id), 404, "verify")
+
+
+def create_read(clients):
+    """INT-002: Create a booking and read it back."""
+    booking_api = clients.booking_api
+    create_resp = expect(booking_api.create(booking_body(booking_api)), 200, "create")
+    expect(booking_api.get(booking_api.decode(create_resp)["bookingid"]), 200, "read")
+
+
+def filter_after_creation(clients):
+    """INT-003: Create a uniquely named booking and find it by firstname."""
+    booking_api = clients.booking_api
+    firstname = f"Load_{next(_sequence)}"
+    expect(
+        booking_api.create(booking_body(booking_api, firstname, "FilterTest")),
+        200,
+        "create",
+    )
+    expect(booking_api.get_all(firstname=firstname), 200, "filter")
+
+
+def partial_update_sequence(clients):
+    """INT-005: Create, PATCH three fields in turn, then read the final state."""
+    booking_api = clients.booking_api
+    create_resp = expect(booking_api.create(booking_body(booking_api)), 200, "create")
+    booking_id = booking_api.decode(create_resp)["bookingid"]
+    for patch in (
+        {"firstname": "Jonathan"},
+        {"lastname": "Smith"},
+        {"totalprice": 500},
+    ):
+        expect(booking_api.partial_update(booking_id, patch), 200, "patch")
+    expect(booking_api.get(booking_id), 200, "read")
+
+
+SCENARIOS = {
+    "crud": crud_flow,
+    "create_read": create_read,
+    "filter": filter_after_creation,
+    "partial_update": partial_update_sequence,
+}
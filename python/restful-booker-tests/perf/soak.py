@@ -0,0 +1,280 @@
+"""
+Soak runner
+
+Loops the INT-001 CRUD and INT-005 patch sequences for hours through the
+functional clients. Every interval it records client RSS, tracemalloc's top
+growing allocation sites, scenario latency and a GET /booking probe against
+the SUT's store size. At the end it flags client memory leaks, latency drift
+and server latency that grows faster than linearly with the store.
+
+INT-005 bookings are kept until the end of the run so the store grows;
+INT-001 deletes its own. With --base-url fake the fake SUT runs in a child
+process, so its store does not count towards client memory.
+
+Usage: python -m perf.soak --duration 7200 --interval 60 --workers 4
+"""
+
+import argparse
+import itertools
+import json
+import math
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+
+from api.metrics import LatencyHistogram
+from fake_server import DEFAULT_PASSWORD, DEFAULT_USERNAME, FAKE_BASE_URL
+from perf.clients import Clients
+from perf.scenarios import crud_flow, partial_update_sequence
+
+SOAK_SCENARIOS = (crud_flow, partial_update_sequence)
+# Windows at the start of the run that fill caches, pools and the allocator;
+# they are left out of the trend fits.
+WARMUP_SHARE = 0.2
+TOP_ALLOCATORS = 5
+
+
+def rss_bytes():
+    """Current resident set size of this process, or peak RSS where unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        import resource  # Unix only, and only needed without /proc
+
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def slope(xs, ys):
+    """Least-squares slope of ys over xs, or 0.0 when it is undefined."""
+    n = len(xs)
+    if n < 2:
+        return 0.0
+    mean_x = sum(xs) / n
+    mean_y = sum(ys) / n
+    var = sum((x - mean_x) ** 2 for x in xs)
+    if not var:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / var
+
+
+def spawn_fake_server():
+    """Start python -m fake_server on a free port; return (process, base_url)."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    process = subprocess.Popen(
+        [sys.executable, "-m", "fake_server", "--port", str(port)],
+        stdout=subprocess.DEVNULL,
+    )
+    return process, f"http://127.0.0.1:{port}"
+
+
+class SoakWindow:
+    def __init__(self, start):
+        self.start = start
+        self.latency = LatencyHistogram()
+        self.errors = 0
+        self.last_error = None
+        self._lock = threading.Lock()
+
+    def record(self, elapsed, error=None):
+        with self._lock:
+            self.latency.record(elapsed)
+            if error is not None:
+                self.errors += 1
+                self.last_error = f"{type(error).__name__}: {error}"
+
+
+def run_soak(clients, duration, interval, workers=4, trace=True, on_window=None):
+    """Run the soak scenarios for duration seconds and return one dict per interval."""
+    booking_api = clients.booking_api
+    stop = threading.Event()
+    window = SoakWindow(time.perf_counter())
+
+    def worker(offset):
+        for turn in itertools.count(offset):
+            if stop.is_set():
+                return
+            start = time.perf_counter()
+            error = None
+            try:
+                SOAK_SCENARIOS[turn % len(SOAK_SCENARIOS)](clients)
+            except Exception as exc:
+                error = exc
+            window.record(time.perf_counter() - start, error)
+
+    if trace:
+        tracemalloc.start()
+        baseline = tracemalloc.take_snapshot()
+    threads = [
+        threading.Thread(target=worker, args=(offset,), daemon=True)
+        for offset in range(workers)
+    ]
+    run_start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+
+    windows = []
+    try:
+        while not stop.is_set():
+            remaining = run_start + duration - time.perf_counter()
+            stop.wait(min(interval, max(remaining, 0)))
+            if remaining <= interval:
+                stop.set()
+            finished, window = window, SoakWindow(time.perf_counter())
+
+            probe_start = time.perf_counter()
+            probe = booking_api.get_all()
+            probe_latency = time.perf_counter() - probe_start
+            sample = {
+                "elapsed": time.perf_counter() - run_start,
+                "iterations": finished.latency.count,
+                "errors": finished.errors,
+                "last_error": finished.last_error,
+                "latency": finished.latency.summary(),
+                "store_size": len(booking_api.decode(probe)) if probe.ok else None,
+                "probe_latency": probe_latency,
+                "rss": rss_bytes(),
+            }
+            if trace:
+                snapshot = tracemalloc.take_snapshot()
+                sample["traced"] = tracemalloc.get_traced_memory()[0]
+                sample["top_allocators"] = [
+                    {
+                        "where": str(stat.traceback),
+                        "size_diff": stat.size_diff,
+                        "count_diff": stat.count_diff,
+                    }
+                    for stat in snapshot.compare_to(baseline, "lineno")[:TOP_ALLOCATORS]
+                ]
+            windows.append(sample)
+            if on_window is not None:
+                on_window(sample)
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+        if trace:
+            tracemalloc.stop()
+    return windows
+
+
+def analyze(
+    windows, leak_mb_per_hour=10.0, max_drift=0.5, max_exponent=1.2, min_growth_mb=5.0
+):
+    """
+    Return a list of findings for windows from run_soak.
+
+    - leak: RSS (or traced memory) grows faster than leak_mb_per_hour, and by
+      more than min_growth_mb in total, so short runs are not flagged on noise
+    - drift: scenario p50 in the last window is more than max_drift above
+      the first post-warmup window
+    - superlinear: the probe's log-log slope against store size exceeds
+      max_exponent (GET /booking should scale linearly at worst)
+    """
+    steady = windows[int(len(windows) * WARMUP_SHARE) :]
+    findings = []
+    if len(steady) < 2:
+        return findings
+    hours = [sample["elapsed"] / 3600 for sample in steady]
+    for key in ("rss", "traced"):
+        if key not in steady[0]:
+            continue
+        megabytes = [sample[key] / 2**20 for sample in steady]
+        rate = slope(hours, megabytes)
+        if rate > leak_mb_per_hour and megabytes[-1] - megabytes[0] > min_growth_mb:
+            findings.append(f"leak: {key} growing {rate:.1f} MB/h")
+
+    first, last = steady[0]["latency"]["p50"], steady[-1]["latency"]["p50"]
+    if first and last / first - 1 > max_drift:
+        findings.append(
+            f"drift: scenario p50 {first * 1000:.2f}ms -> {last * 1000:.2f}ms "
+            f"({last / first - 1:+.0%})"
+        )
+
+    points = [
+        (math.log(sample["store_size"]), math.log(sample["probe_latency"]))
+        for sample in steady
+        if sample["store_size"] and sample["probe_latency"] > 0
+    ]
+    exponent = slope(*zip(*points)) if len(points) >= 2 else 0.0
+    if exponent > max_exponent:
+        findings.append(
+            f"superlinear: GET /booking latency ~ store size^{exponent:.2f}"
+        )
+    return findings
+
+
+def format_window(sample):
+    line = (
+        f"{sample['elapsed']:>8.0f}s it={sample['iterations']:<6} "
+        f"err={sample['errors']:<4} p50={sample['latency']['p50'] * 1000:>7.2f}ms "
+        f"p99={sample['latency']['p99'] * 1000:>7.2f}ms store={sample['store_size']} "
+        f"probe={sample['probe_latency'] * 1000:.2f}ms "
+        f"rss={sample['rss'] / 2**20:.1f}MB"
+    )
+    if "traced" in sample:
+        line += f" traced={sample['traced'] / 2**20:.1f}MB"
+        for allocator in sample["top_allocators"][:1]:
+            line += f" top={allocator['where']} {allocator['size_diff'] / 1024:+.0f}KB"
+    return line
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--duration", type=float, default=3600.0, help="seconds")
+    parser.add_argument("--interval", type=float, default=60.0, help="seconds")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--no-tracemalloc", action="store_true")
+    parser.add_argument("--leak-mb-per-hour", type=float, default=10.0)
+    parser.add_argument("--max-drift", type=float, default=0.5)
+    parser.add_argument("--max-exponent", type=float, default=1.2)
+    parser.add_argument("--base-url", default=None)
+    parser.add_argument("--json", dest="json_path", default=None)
+    args = parser.parse_args(argv)
+
+    server = None
+    credentials = {}
+    base_url = args.base_url or os.getenv("BASE_URL")
+    if base_url == FAKE_BASE_URL:
+        server, base_url = spawn_fake_server()
+        credentials = {"username": DEFAULT_USERNAME, "password": DEFAULT_PASSWORD}
+    clients = Clients(base_url, workers=args.workers, **credentials)
+    try:
+        clients.healthcheck_api.wait_until_ready(timeout=30)
+        windows = run_soak(
+            clients,
+            args.duration,
+            args.interval,
+            args.workers,
+            trace=not args.no_tracemalloc,
+            on_window=lambda sample: print(format_window(sample), flush=True),
+        )
+    finally:
+        cleanup = clients.close()
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    findings = analyze(
+        windows, args.leak_mb_per_hour, args.max_drift, args.max_exponent
+    )
+    if clients.validator is not None and clients.validator.failed:
+        findings.append(f"schema: {clients.validator}")
+        findings += clients.validator.failures
+    for finding in findings:
+        print(f"FLAGGED {finding}")
+    print(f"cleanup  {cleanup}")
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump({"windows": windows, "findings": findings}, f, indent=2)
+    return 1 if findings else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,269 @@
+"""
+Multi-target runner
+
+Runs the pytest suite, or a load scenario, against several restful-booker
+deployments at once. Each target gets its own process, so conftest.py, the
+session pool, auth token and fake SUT (for "fake") are never shared between
+targets. Pass/fail counts, failures, timing histograms and per-endpoint
+latency histograms come back from every process and are merged into one
+report, so N environments take about as long as the slowest one.
+
+Usage: python -m perf.targets --targets http://sut-a:3001,http://sut-b:3001 suite -n 4
+       python -m perf.targets --targets fake,fake scenario --scenario crud --rate 20
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from api.metrics import LatencyHistogram, LatencyRecorder
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class _SuiteCollector:
+    # pytest plugin passed to pytest.main in the target's process. Under
+    # xdist these hooks run on the controller, after workers' reports and
+    # latency histograms have been merged there.
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+        self.skipped = 0
+        self.failures = []
+        self.timings = LatencyHistogram()
+        self.requests = []
+
+    def pytest_runtest_logreport(self, report):
+        if report.failed:
+            self.failed += 1
+            message = report.longreprtext.strip().splitlines()
+            self.failures.append(
+                f"{report.nodeid} ({report.when}): {message[-1] if message else ''}"
+            )
+        elif report.skipped:
+            self.skipped += 1
+        elif report.when == "call":
+            self.passed += 1
+        if report.when == "call":
+            self.timings.record(report.duration)
+
+    def pytest_sessionfinish(self, session):
+        from plugins.latency import recorder_key
+
+        self.requests = session.config.stash[recorder_key].to_dict()
+
+
+def run_suite(target, pytest_args=()):
+    """Run the suite against target in this process and return its result dict."""
+    import pytest
+
+    # conftest.py reads BASE_URL at import time; this process imports it fresh.
+    os.environ["BASE_URL"] = target
+    os.chdir(PROJECT_DIR)
+    collector = _SuiteCollector()
+    start = time.perf_counter()
+    exitstatus = pytest.main(["-p", "no:terminal", *pytest_args], [collector])
+    if exitstatus and not collector.failures:
+        # e.g. the SUT never became ready, or a usage error in pytest_args
+        collector.failures.append(f"pytest exited with {exitstatus!r}")
+    return {
+        "target": target,
+        "exitstatus": int(exitstatus),
+        "duration": time.perf_counter() - start,
+        "passed": collector.passed,
+        "failed": collector.failed,
+        "skipped": collector.skipped,
+        "failures": collector.failures,
+        "timings": collector.timings.to_dict(),
+        "requests": collector.requests,
+    }
+
+
+def run_scenario(target, scenario, rate, steady, ramp_up=0.0, workers=16, **creds):
+    """Drive a perf.scenarios scenario against target and return its result dict."""
+    from perf.clients import Clients
+    from perf.loadgen import arrival_times, run_load
+    from perf.scenarios import SCENARIOS
+
+    recorder = LatencyRecorder()
+    clients = Clients(target, workers=workers, hooks=[recorder], **creds)
+    try:
+        result = run_load(
+            SCENARIOS[scenario],
+            clients,
+            arrival_times(rate, ramp_up, steady),
+            workers,
+        )
+    finally:
+        clients.close()
+    return {
+        "target": target,
+        "exitstatus": 1 if result.error_count else 0,
+        "duration": result.duration,
+        "passed": result.completed - result.error_count,
+        "failed": result.error_count,
+        "skipped": 0,
+        "failures": [f"{count} x {error}" for error, count in result.errors.items()],
+        "timings": result.latency.to_dict(),
+        "requests": recorder.to_dict(),
+    }
+
+
+def run_targets(targets, job, **kwargs):
+    """
+    Run job(target, **kwargs) for every target, each in its own process.
+
+    Processes are spawned rather than forked and used for one target only, so
+    no module state (BASE_URL, pools, the fake server) leaks between targets.
+    Returns the result dicts in target order plus the wall time of the run.
+    """
+    start = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=len(targets),
+        mp_context=multiprocessing.get_context("spawn"),
+        max_tasks_per_child=1,
+    ) as executor:
+        futures = [executor.submit(job, target, **kwargs) for target in targets]
+        results = []
+        for target, future in zip(targets, futures):
+            try:
+                results.append(future.result())
+            except Exception as exc:
+                results.append(
+                    {
+                        "target": target,
+                        "exitstatus": 1,
+                        "duration": 0.0,
+                        "passed": 0,
+                        "failed": 1,
+                        "skipped": 0,
+                        "failures": [f"runner: {type(exc).__name__}: {exc}"],
+                        "timings": LatencyHistogram().to_dict(),
+                        "requests": [],
+                    }
+                )
+    return results, time.perf_counter() - start
+
+
+def aggregate(results, wall_time=None):
+    """Merge per-target result dicts into one report."""
+    overall = LatencyHistogram()
+    requests = LatencyRecorder()
+    targets = []
+    for result in results:
+        timings = LatencyHistogram.from_dict(result["timings"])
+        overall.merge(timings)
+        requests.merge_dict(result["requests"])
+        targets.append(
+            {
+                key: result[key]
+                for key in ("target", "exitstatus", "duration", "passed", "failed")
+            }
+            | {"skipped": result["skipped"], "timings": timings.summary()}
+        )
+    serial = sum(result["duration"] for result in results)
+    return {
+        "targets": targets,
+        "passed": sum(result["passed"] for result in results),
+        "failed": sum(result["failed"] for result in results),
+        "skipped": sum(result["skipped"] for result in results),
+        "failures": [
+            f"[{result['target']}] {failure}"
+            for result in results
+            for failure in result["failures"]
+        ],
+        "timings": overall.summary(),
+        "requests": requests.summary(),
+        "serial_time": serial,
+        "wall_time": serial if wall_time is None else wall_time,
+    }
+
+
+def format_report(report):
+    width = max([len("target")] + [len(t["target"]) for t in report["targets"]])
+    lines = [
+        f"{'target':<{width}} {'passed':>7} {'failed':>7} {'time':>8} "
+        f"{'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}"
+    ]
+    rows = report["targets"] + [
+        {
+            "target": "all",
+            "passed": report["passed"],
+            "failed": report["failed"],
+            "duration": report["wall_time"],
+            "timings": report["timings"],
+        }
+    ]
+    for row in rows:
+        lines.append(
+            f"{row['target']:<{width}} {row['passed']:>7} {row['failed']:>7} "
+            f"{row['duration']:>7.1f}s"
+            + "".join(
+                f" {row['timings'][key] * 1000:>9.2f}"
+                for key in ("p50", "p95", "p99", "max")
+            )
+        )
+    lines.append(
+        f"wall time {report['wall_time']:.1f}s "
+        f"(targets one after another: {report['serial_time']:.1f}s)"
+    )
+    for endpoint, stats in report["requests"].items():
+        lines.append(
+            f"  {endpoint:<22} n={stats['count']:<7} "
+            f"p50={stats['p50'] * 1000:.2f} p99={stats['p99'] * 1000:.2f}"
+        )
+    for failure in report["failures"]:
+        lines.append(f"FAILED {failure}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--targets",
+        default=os.getenv("TARGETS", ""),
+        help="comma-separated BASE_URLs to run against (default: TARGETS)",
+    )
+    parser.add_argument("--json", dest="json_path", default=None)
+    modes = parser.add_subparsers(dest="mode", required=True)
+    # Arguments the runner does not know are passed on to pytest.
+    modes.add_parser("suite", help="run pytest against every target")
+    scenario = modes.add_parser("scenario", help="run a load scenario")
+    scenario.add_argument("--scenario", default="crud")
+    scenario.add_argument("--rate", type=float, default=10.0, help="iterations/s")
+    scenario.add_argument("--ramp-up", type=float, default=0.0, help="seconds")
+    scenario.add_argument("--steady", type=float, default=30.0, help="seconds")
+    scenario.add_argument("--workers", type=int, default=16)
+    args, pytest_args = parser.parse_known_args(argv)
+    if pytest_args and args.mode != "suite":
+        parser.error(f"unrecognized arguments: {' '.join(pytest_args)}")
+    targets = [target for target in args.targets.split(",") if target]
+    if not targets:
+        parser.error("no targets given (--targets or TARGETS)")
+
+    if args.mode == "suite":
+        results, wall_time = run_targets(targets, run_suite, pytest_args=pytest_args)
+    else:
+        results, wall_time = run_targets(
+            targets,
+            run_scenario,
+            scenario=args.scenario,
+            rate=args.rate,
+            steady=args.steady,
+            ramp_up=args.ramp_up,
+            workers=args.workers,
+        )
+    report = aggregate(results, wall_time)
+    print(format_report(report))
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(report, f, indent=2)
+    return 1 if any(result["exitstatus"] for result in results) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,76 @@
+"""
+Booking cleanup plugin
+
+Bookings created through the booking_api fixture are tracked in a registry;
+whatever is still live when the session (or xdist worker) ends is deleted in
+concurrent batches with the cached token, and the outcome is reported.
+"""
+
+import os
+
+import pytest
+
+from api.auth_api import AuthAPI
+from api.booking_api import BookingAPI
+from api.registry import BookingRegistry, CleanupReport
+
+report_key = pytest.StashKey[CleanupReport]()
+
+CLEANUP_BATCH_SIZE = int(os.getenv("CLEANUP_BATCH_SIZE", "500"))
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--keep-bookings",
+        action="store_true",
+        help="Do not delete bookings created during the run",
+    )
+
+
+def pytest_configure(config):
+    config.stash[report_key] = CleanupReport()
+
+
+@pytest.fixture(scope="session")
+def booking_registry(
+    request, base_url, session, transport, auth_username, auth_password
+):
+    registry = BookingRegistry()
+    yield registry
+    if not registry or request.config.getoption("--keep-bookings"):
+        return
+    # Clients are only built here, once a test has created a booking, so
+    # sessions that never do need no SUT or token.
+    auth_api = AuthAPI(
+        base_url,
+        session,
+        transport=transport,
+        username=auth_username,
+        password=auth_password,
+    )
+    booking_api = BookingAPI(base_url, session, transport=transport, auth_api=auth_api)
+    report = registry.cleanup(booking_api, batch_size=CLEANUP_BATCH_SIZE)
+    request.config.stash[report_key].merge_dict(report.to_dict())
+
+
+def pytest_sessionfinish(session):
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["cleanup"] = session.config.stash[report_key].to_dict()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    data = getattr(node, "workeroutput", {}).get("cleanup")
+    if data:
+        node.config.stash[report_key].merge_dict(data)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if hasattr(config, "workerinput") or config.getoption("--keep-bookings"):
+        return
+    report = config.stash[report_key]
+    terminalreporter.section("booking cleanup")
+    terminalreporter.write_line(str(report))
+    for booking_id, reason in sorted(report.failed.items()):
+        terminalreporter.write_line(f"  booking {booking_id}: {reason}")
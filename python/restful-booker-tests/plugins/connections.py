@@ -0,0 +1,120 @@
+"""
+Connection timing plugin
+
+Collects the connect / time-to-first-byte / body-download breakdown the API
+clients record through their timing hooks, plus how many requests went out
+on a reused pooled connection versus a newly opened one, per endpoint and per
+session adapter. A latency spike with high connect times and a low reuse rate
+points at pool churn; one with high TTFB on reused connections points at the
+SUT's handlers. Under pytest-xdist the workers' histograms are merged on the
+controller, and the tables go to the terminal summary and the --html report.
+"""
+
+import html
+
+import pytest
+
+from api.metrics import ConnectionRecorder
+
+connections_key = pytest.StashKey[ConnectionRecorder]()
+
+
+def pytest_configure(config):
+    config.stash[connections_key] = ConnectionRecorder()
+
+
+@pytest.fixture(scope="session")
+def connection_recorder(request):
+    return request.config.stash[connections_key]
+
+
+def pytest_sessionfinish(session):
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["connections"] = session.config.stash[connections_key].to_dict()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    data = getattr(node, "workeroutput", {}).get("connections")
+    if data:
+        node.config.stash[connections_key].merge_dict(data)
+
+
+def _rows(recorder):
+    for endpoint, stats in recorder.summary().items():
+        yield (
+            endpoint,
+            stats["count"],
+            f"{stats['reuse_rate']:.0%}",
+            *(
+                f"{stats[phase][key] * 1000:.2f}"
+                for phase, key in (
+                    ("connect", "p50"),
+                    ("connect", "p95"),
+                    ("ttfb", "p50"),
+                    ("ttfb", "p95"),
+                    ("ttfb", "p99"),
+                    ("download", "p50"),
+                    ("download", "p95"),
+                )
+            ),
+        )
+
+
+HEADERS = (
+    "endpoint",
+    "count",
+    "reused",
+    "conn p50",
+    "conn p95",
+    "ttfb p50",
+    "ttfb p95",
+    "ttfb p99",
+    "body p50",
+    "body p95",
+)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix, session):
+    recorder = session.config.stash[connections_key]
+    if not recorder.endpoints:
+        return
+    header = "".join(f"<th>{name}</th>" for name in HEADERS)
+    rows = "".join(
+        "<tr>" + "".join(f"<td>{html.escape(str(cell))}</td>" for cell in row) + "</tr>"
+        for row in _rows(recorder)
+    )
+    adapters = ", ".join(
+        f"{html.escape(name)}: {counts['new']} new / {counts['reused']} reused"
+        for name, counts in recorder.adapter_summary().items()
+    )
+    prefix.append(
+        f"<h2>Connection timing (ms)</h2><table><tr>{header}</tr>{rows}</table>"
+        f"<p>Connections per adapter: {adapters}</p>"
+    )
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if hasattr(config, "workerinput"):
+        return
+    recorder = config.stash[connections_key]
+    if not recorder.endpoints:
+        return
+    terminalreporter.section("connection timing (ms)")
+    rows = list(_rows(recorder))
+    width = max(len(row[0]) for row in rows)
+    terminalreporter.write_line(
+        f"{HEADERS[0]:<{width}}" + "".join(f" {name:>9}" for name in HEADERS[1:])
+    )
+    for row in rows:
+        terminalreporter.write_line(
+            f"{row[0]:<{width}}" + "".join(f" {cell:>9}" for cell in row[1:])
+        )
+    for name, counts in recorder.adapter_summary().items():
+        total = counts["new"] + counts["reused"]
+        terminalreporter.write_line(
+            f"adapter {name}: {counts['new']} new, {counts['reused']} reused "
+            f"connections ({counts['reused'] / total:.0%} reuse)"
+        )
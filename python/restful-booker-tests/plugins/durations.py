@@ -0,0 +1,111 @@
+"""
+Duration-aware scheduling plugin
+
+Stores each test's duration (setup + call + teardown) in the pytest cache
+after every run. Under pytest-xdist with the default --dist load, tests are
+then handed to workers longest-first (LPT), so slow tests such as INT-006
+start early instead of landing on one worker at the end. Without history,
+tests are dispatched in test-plan order.
+"""
+
+import re
+
+import pytest
+
+DURATIONS_KEY = "restful-booker/durations"
+# Weight of the latest run when smoothing stored durations.
+SMOOTHING = 0.5
+
+_TEST_ID = re.compile(r"test_([A-Z]+)_(\d{3})")
+_PLAN_ID = re.compile(r"^\|\s*([A-Z]+-\d{3})\s*\|", re.MULTILINE)
+
+durations_key = pytest.StashKey["DurationLog"]()
+
+
+def plan_ids(path):
+    """Return the test IDs in tests/test-plan.md in document order."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return _PLAN_ID.findall(f.read())
+    except FileNotFoundError:
+        return []
+
+
+def plan_id(nodeid):
+    match = _TEST_ID.search(nodeid)
+    return f"{match[1]}-{match[2]}" if match else None
+
+
+def schedule_order(nodeids, durations, plan=()):
+    """
+    Return indexes into nodeids, longest expected duration first.
+
+    Tests without history are estimated at the mean recorded duration; ties
+    (including every test when there is no history) fall back to test-plan
+    order, then collection order.
+    """
+    known = [durations[nodeid] for nodeid in nodeids if nodeid in durations]
+    estimate = sum(known) / len(known) if known else 0.0
+    plan = {test_id: position for position, test_id in enumerate(plan)}
+
+    def key(index):
+        nodeid = nodeids[index]
+        return (
+            -durations.get(nodeid, estimate),
+            plan.get(plan_id(nodeid), len(plan)),
+            index,
+        )
+
+    return sorted(range(len(nodeids)), key=key)
+
+
+class DurationLog:
+    """Sums setup, call and teardown time per test for this run."""
+
+    def __init__(self):
+        self.durations = {}
+
+    def pytest_runtest_logreport(self, report):
+        # Under xdist the controller sees every worker's reports too.
+        self.durations[report.nodeid] = (
+            self.durations.get(report.nodeid, 0.0) + report.duration
+        )
+
+
+def pytest_configure(config):
+    config.stash[durations_key] = DurationLog()
+    config.pluginmanager.register(config.stash[durations_key])
+
+
+def load_durations(config):
+    if getattr(config, "cache", None) is None:
+        return {}
+    return config.cache.get(DURATIONS_KEY, {})
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if hasattr(config, "workerinput") or getattr(config, "cache", None) is None:
+        return
+    stored = load_durations(config)
+    for nodeid, duration in config.stash[durations_key].durations.items():
+        previous = stored.get(nodeid)
+        stored[nodeid] = (
+            duration
+            if previous is None
+            else SMOOTHING * duration + (1 - SMOOTHING) * previous
+        )
+    config.cache.set(DURATIONS_KEY, stored)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    if config.getvalue("dist") != "load":
+        return None
+    from plugins.lpt import LongestFirstScheduling
+
+    durations = load_durations(config)
+    plan = plan_ids(config.rootpath / "tests" / "test-plan.md")
+    return LongestFirstScheduling(
+        config, log, lambda nodeids: schedule_order(nodeids, durations, plan)
+    )
@@ -0,0 +1,82 @@
+"""
+SUT readiness and health sampling plugin
+
+Before the first test that talks to the SUT, waits for /ping with exponential
+backoff (up to READY_TIMEOUT seconds) instead of fixed sleeps, and records
+time-to-ready. Only the client fixtures depend on sut_ready, so unit tests run
+without a SUT. The probes go out on their own session without urllib3 retries,
+so the backoff loop is the only retry policy.
+With HEALTH_SAMPLE_INTERVAL set, a background thread keeps pinging for the
+whole run so availability and latency drift show up in the terminal summary.
+"""
+
+import os
+
+import pytest
+
+from api.cassette import REPLAY
+from api.health import HealthReport, HealthSampler
+from api.healthcheck_api import HealthCheckAPI
+from api.transport import build_session
+
+health_key = pytest.StashKey[HealthReport]()
+
+READY_TIMEOUT = float(os.getenv("READY_TIMEOUT", "60"))
+HEALTH_SAMPLE_INTERVAL = float(os.getenv("HEALTH_SAMPLE_INTERVAL", "0"))
+
+
+def pytest_configure(config):
+    config.stash[health_key] = HealthReport()
+
+
+@pytest.fixture(scope="session")
+def sut_ready(request, base_url, transport, cassette):
+    report = request.config.stash[health_key]
+    if cassette is not None and cassette.mode == REPLAY:
+        # Nothing to wait for: the cassette answers every request.
+        yield None
+        return
+    # Own session and no hooks, so probes and sampling stay out of the
+    # latency report and the suite's connection pool.
+    probe = transport.probe()
+    session = build_session(probe, name="health")
+    healthcheck_api = HealthCheckAPI(base_url, session, transport=probe)
+    try:
+        report.time_to_ready = healthcheck_api.wait_until_ready(READY_TIMEOUT)
+    except TimeoutError as exc:
+        session.close()
+        # Session fixtures cache the error, so every SUT test fails at once
+        # with it while tests that never touch the SUT still run.
+        pytest.fail(f"SUT not ready: {exc}", pytrace=False)
+    if not HEALTH_SAMPLE_INTERVAL:
+        session.close()
+        yield report.time_to_ready
+        return
+    sampler = HealthSampler(healthcheck_api, HEALTH_SAMPLE_INTERVAL).start()
+    yield report.time_to_ready
+    sampler.stop()
+    session.close()
+    report.samples.extend(sampler.samples)
+
+
+def pytest_sessionfinish(session):
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["health"] = session.config.stash[health_key].to_dict()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    data = getattr(node, "workeroutput", {}).get("health")
+    if data:
+        node.config.stash[health_key].merge_dict(data)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if hasattr(config, "workerinput"):
+        return
+    report = config.stash[health_key]
+    if report.time_to_ready is None:
+        return
+    terminalreporter.section("SUT health")
+    terminalreporter.write_line(str(report))
@@ -0,0 +1,83 @@
+"""
+Latency reporting plugin
+
+Collects the per-endpoint histograms recorded by the API clients' hooks, prints
+p50/p95/p99/max in the terminal summary and writes them to a JSON artifact.
+Under pytest-xdist each worker ships its raw histograms to the controller,
+which merges them before reporting.
+"""
+
+import json
+import os
+
+import pytest
+
+from api.metrics import LatencyRecorder
+
+recorder_key = pytest.StashKey[LatencyRecorder]()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--latency-json",
+        default=None,
+        help="Path for the latency JSON report (default: latency.json next to --html)",
+    )
+
+
+def pytest_configure(config):
+    config.stash[recorder_key] = LatencyRecorder()
+
+
+@pytest.fixture(scope="session")
+def latency_recorder(request):
+    return request.config.stash[recorder_key]
+
+
+def pytest_sessionfinish(session):
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["latency"] = session.config.stash[recorder_key].to_dict()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    data = getattr(node, "workeroutput", {}).get("latency")
+    if data:
+        node.config.stash[recorder_key].merge_dict(data)
+
+
+def latency_json_path(config):
+    path = config.getoption("--latency-json")
+    if path:
+        return path
+    html_path = getattr(config.option, "htmlpath", None)
+    if html_path:
+        return os.path.join(os.path.dirname(html_path), "latency.json")
+    return None
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if hasattr(config, "workerinput"):
+        return
+    summary = config.stash[recorder_key].summary()
+    if not summary:
+        return
+    terminalreporter.section("endpoint latency (ms)")
+    width = max(len(endpoint) for endpoint in summary)
+    terminalreporter.write_line(
+        f"{'endpoint':<{width}} {'count':>7} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}"
+    )
+    for endpoint, stats in summary.items():
+        terminalreporter.write_line(
+            f"{endpoint:<{width}} {stats['count']:>7}"
+            + "".join(
+                f" {stats[key] * 1000:>9.2f}" for key in ("p50", "p95", "p99", "max")
+            )
+        )
+
+    path = latency_json_path(config)
+    if path:
+        with open(path, "w") as f:
+            json.dump(summary, f, indent=2)
+        terminalreporter.write_line(f"latency report written to {path}")
@@ -0,0 +1,62 @@
+"""
+Longest-processing-time-first scheduler for pytest-xdist
+
+Imported only when xdist asks for a scheduler, so the rest of the suite does
+not depend on xdist internals.
+"""
+
+from xdist.scheduler import LoadScheduling
+
+# xdist workers only start a test once they know the next one (for fixture
+# teardown), so every node keeps two queued; beyond that, holding tests back
+# lets whichever worker frees up first take the next-longest one.
+NODE_QUEUE = 2
+
+# Private LoadScheduling members this scheduler relies on. pyproject pins
+# pytest-xdist below 4, and SCHED-003 fails loudly if a release drops one.
+XDIST_INTERNALS = (
+    "_check_nodes_have_same_collection",
+    "_send_tests",
+    "node2collection",
+    "node2pending",
+    "pending",
+)
+
+
+class LongestFirstScheduling(LoadScheduling):
+    """LoadScheduling that dispatches in a precomputed order, two at a time."""
+
+    def __init__(self, config, log, order):
+        super().__init__(config, log)
+        self.order = order
+
+    def schedule(self):
+        assert self.collection_is_completed
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        self.pending[:] = self.order(self.collection)
+        if not self.collection:
+            return
+        for node in self.nodes:
+            self._send_tests(node, NODE_QUEUE)
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
+
+    def check_schedule(self, node, duration=0):
+        if node.shutting_down:
+            return
+        if self.pending:
+            queued = len(self.node2pending[node])
+            if queued < NODE_QUEUE:
+                self._send_tests(node, NODE_QUEUE - queued)
+        else:
+            node.shutdown()
+        self.log("num items waiting for node:", len(self.pending))
@@ -0,0 +1,64 @@
+"""
+Response schema plugin
+
+Gives the API clients a ResponseValidator compiled from api/schema.py, so
+every 200 JSON response (or a SCHEMA_SAMPLE_RATE share of them) is checked
+against the booking, auth token and booking ID list schemas. Mismatches are
+reported in the terminal summary; with SCHEMA_STRICT=1 the request raises
+SchemaError and the test fails. Under pytest-xdist the workers' counts are
+merged on the controller.
+"""
+
+import os
+
+import pytest
+
+from api.codec import get_codec
+from api.schema import ResponseValidator
+
+SCHEMA_SAMPLE_RATE = float(os.getenv("SCHEMA_SAMPLE_RATE", "1"))
+SCHEMA_STRICT = os.getenv("SCHEMA_STRICT", "").lower() in ("1", "true", "yes", "on")
+# Decode with the clients' codec, so the reported cost is the one they pay.
+JSON_CODEC = os.getenv("JSON_CODEC")
+
+validator_key = pytest.StashKey[ResponseValidator]()
+
+
+def pytest_configure(config):
+    config.stash[validator_key] = ResponseValidator(
+        sample_rate=SCHEMA_SAMPLE_RATE,
+        strict=SCHEMA_STRICT,
+        codec=get_codec(JSON_CODEC),
+    )
+
+
+@pytest.fixture(scope="session")
+def response_validator(request):
+    if not SCHEMA_SAMPLE_RATE:
+        return None
+    return request.config.stash[validator_key]
+
+
+def pytest_sessionfinish(session):
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["schema"] = session.config.stash[validator_key].to_dict()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    data = getattr(node, "workeroutput", {}).get("schema")
+    if data:
+        node.config.stash[validator_key].merge_dict(data)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if hasattr(config, "workerinput"):
+        return
+    validator = config.stash[validator_key]
+    if not validator.checked:
+        return
+    terminalreporter.section("response schemas")
+    terminalreporter.write_line(str(validator))
+    for failure in validator.failures:
+        terminalreporter.write_line(f"  {failure}")
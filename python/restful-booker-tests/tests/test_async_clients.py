@@ -0,0 +1,139 @@
+"""
+Async Client Tests for Restful-Booker API
+
+Re-runs selected scenarios from the test plan through the asyncio clients so
+that requests are genuinely in flight at the same time over one shared pool.
+Test names include the test ID as per requirements (e.g., test_INT_002_concurrent_bookings_async)
+"""
+
+import asyncio
+
+import pytest
+
+from api.async_booking_api import AsyncBookingAPI
+from api.async_healthcheck_api import AsyncHealthCheckAPI
+from utils import sample_booking
+
+
+@pytest.mark.asyncio
+class TestAsyncClients:
+    """Async client tests covering health check, concurrent create and CRUD flow"""
+
+    async def test_HEALTH_001_ping_response_status_async(
+        self, async_healthcheck_api: AsyncHealthCheckAPI
+    ):
+        """
+        HEALTH-001: Ping Response Status (async client)
+        GET /ping through the async client
+        Expected: Returns HTTP 201 Created
+        """
+        ping_resp = await async_healthcheck_api.get()
+        assert ping_resp.status_code == 201
+
+    async def test_INT_002_concurrent_bookings_async(
+        self, async_booking_api: AsyncBookingAPI, booking_factory, booking_registry
+    ):
+        """
+        INT-002: Concurrent Bookings (async client)
+        Create multiple bookings simultaneously
+        Expected: All created with unique IDs
+        """
+        test_names = [
+            (booking_factory.name(first), booking_factory.name(last))
+            for first, last in [
+                ("Alice", "Smith"),
+                ("Bob", "Johnson"),
+                ("Charlie", "Williams"),
+                ("Diana", "Brown"),
+                ("Eva", "Davis"),
+            ]
+        ]
+
+        responses = await asyncio.gather(
+            *(
+                async_booking_api.create(sample_booking(first, last))
+                for first, last in test_names
+            )
+        )
+        assert all(resp.status_code == 200 for resp in responses)
+        booking_ids = [resp.json()["bookingid"] for resp in responses]
+
+        # Verify all IDs are unique and left for the registry to clean up
+        assert len(booking_ids) == len(set(booking_ids))
+        assert all(booking_id in booking_registry for booking_id in booking_ids)
+
+        # Verify each booking can be retrieved
+        get_responses = await asyncio.gather(
+            *(async_booking_api.get(booking_id) for booking_id in booking_ids)
+        )
+        for (first, last), resp in zip(test_names, get_responses):
+            assert resp.status_code == 200
+            assert resp.json()["firstname"] == first
+            assert resp.json()["lastname"] == last
+
+    async def test_CREATE_003_create_with_xml_async(
+        self, base_url, async_client, booking_factory, booking_registry
+    ):
+        """
+        CREATE-003: Create with XML (async client)
+        Create and read back a booking as XML through an async client with a hook
+        Expected: Same codec, route names and registry handling as BookingAPI
+        """
+        calls = []
+        api = AsyncBookingAPI(
+            base_url,
+            async_client,
+            registry=booking_registry,
+            hooks=[
+                lambda method, route, status, _: calls.append((method, route, status))
+            ],
+        )
+        payload = booking_factory.booking("Xavier", "Markup")
+        create_resp = await api.create(payload, codec="xml")
+        assert create_resp.status_code == 200
+        assert create_resp.content.lstrip().startswith(b"<")
+        booking_id = api.decode(create_resp, "xml")["bookingid"]
+        assert booking_id in booking_registry
+
+        get_resp = await api.get(booking_id, codec="xml")
+        assert get_resp.status_code == 200
+        assert api.decode(get_resp, "xml") == payload
+        assert calls == [
+            ("POST", "/booking", 200),
+            ("GET", "/booking/{id}", 200),
+        ]
+
+    async def test_async_clients_have_no_limiter_or_timing_hooks(self):
+        """
+        Async client gap: no limiter or timing hooks
+        AdaptiveLimiter blocks a thread and RequestTiming comes from the requests adapter
+        Expected: AsyncBaseAPI refuses both options rather than silently ignoring them
+        """
+        for option in ("limiter", "timing_hooks"):
+            with pytest.raises(TypeError, match=option):
+                AsyncBookingAPI("http://unused", None, **{option: None})
+
+    async def test_INT_001_complete_crud_flow_async(
+        self, async_booking_api: AsyncBookingAPI, async_auth_api
+    ):
+        """
+        INT-001: Complete CRUD Flow (async client)
+        Create → Read → Update → Delete → Verify
+        Expected: All operations succeed in sequence
+        """
+        create_resp = await async_booking_api.create(sample_booking("Jim", "Brown"))
+        assert create_resp.status_code == 200
+        booking_id = create_resp.json()["bookingid"]
+
+        token = await async_auth_api.create_token()
+        update_resp = await async_booking_api.update(
+            booking_id, sample_booking("James", "Brown"), token
+        )
+        assert update_resp.status_code == 200
+        assert update_resp.json()["firstname"] == "James"
+
+        delete_resp = await async_booking_api.delete(booking_id, token)
+        assert delete_resp.status_code == 201
+
+        verify_resp = await async_booking_api.get(booking_id)
+        assert verify_resp.status_code == 404
@@ -5,7 +5,11 @@ Tests from Section 2.1 of the test plan covering authentication mechanisms.
 Test names include the test ID as per requirements (e.g., test_AUTH_001_valid_credentials)
 """
 
+import pytest
+
 from api.auth_api import AuthAPI
+from api.booking_api import BookingAPI
+from utils import sample_booking
 
 
 class TestAuthentication:
@@ -88,3 +92,59 @@ class TestAuthentication:
 
         resp = booking_api.delete(1, token=token)
         assert resp.status_code != 401
+
+    def test_AUTH_008_cached_token_reused(
+        self, base_url, session, auth_username, auth_password
+    ):
+        """
+        AUTH-008: Cached Token Reuse
+        Call get_token repeatedly within the TTL
+        Expected: One POST /auth, every later call is a cache hit
+        """
+        auth = AuthAPI(
+            base_url, session, username=auth_username, password=auth_password
+        )
+
+        tokens = {auth.get_token() for _ in range(5)}
+
+        assert len(tokens) == 1
+        assert auth.token_fetches == 1
+        assert auth.token_cache_hits == 4
+
+    @pytest.mark.parametrize("rejected", ["revoked", "never_issued"])
+    def test_AUTH_009_rejected_token_refreshed_once(
+        self,
+        rejected,
+        base_url,
+        session,
+        auth_username,
+        auth_password,
+        booking_registry,
+        fake_server,
+    ):
+        """
+        AUTH-009: Refresh on 403
+        Cache a token the server rejects (revoked by the fake, or never issued), then PATCH without a token
+        Expected: A new token is fetched and the request retried successfully
+        """
+        auth = AuthAPI(
+            base_url, session, username=auth_username, password=auth_password
+        )
+        booking_api = BookingAPI(
+            base_url, session, auth_api=auth, registry=booking_registry
+        )
+        booking_id = booking_api.create(sample_booking()).json()["bookingid"]
+
+        if rejected == "revoked":
+            if fake_server is None:
+                pytest.skip("only the fake SUT can revoke a token")
+            fake_server.revoke_token(auth.get_token())
+        else:
+            auth.use_token("never-issued")
+        fetches = auth.token_fetches
+
+        resp = booking_api.partial_update(booking_id, {"firstname": "Refreshed"})
+
+        assert resp.status_code == 200
+        assert resp.json()["firstname"] == "Refreshed"
+        assert auth.token_fetches == fetches + 1
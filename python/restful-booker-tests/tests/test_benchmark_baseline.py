@@ -0,0 +1,58 @@
+"""
+Benchmark Baseline Tests
+
+Checks the regression rules and per-version baseline storage used by the
+benchmark suite in benchmarks/, without running any benchmarks.
+"""
+
+from benchmarks.baseline import BaselineStore, Comparison
+
+
+def stats(p50, p95):
+    return {"count": 50, "p50": p50, "p95": p95}
+
+
+class TestBenchmarkBaseline:
+    """Threshold comparison and version-keyed baselines"""
+
+    def test_BASELINE_001_regression_threshold(self):
+        """
+        BASELINE-001: Regression Threshold
+        Compare runs against a 10ms/20ms baseline with a 20% threshold and 1ms floor
+        Expected: Only metrics past both threshold and floor regress
+        """
+        baseline = stats(0.010, 0.020)
+
+        within = Comparison("get", stats(0.0115, 0.023), baseline, "v1", 0.2, 0.001)
+        p95_only = Comparison("get", stats(0.011, 0.030), baseline, "v1", 0.2, 0.001)
+        tiny = Comparison(
+            "ping", stats(0.0003, 0.0004), stats(0.0002, 0.0002), "v1", 0.2, 0.001
+        )
+        new = Comparison("get", stats(0.5, 0.9))
+
+        assert not within.regressed
+        assert p95_only.regressions == ["p95"]
+        assert "REGRESSED: p95" in str(p95_only)
+        assert not tiny.regressed
+        assert not new.regressed and "no baseline" in str(new)
+
+    def test_BASELINE_002_versions_and_fallback(self, tmp_path):
+        """
+        BASELINE-002: Version-keyed Baselines
+        Record two SUT versions and a fake run, then look up a new version
+        Expected: Own version first, else the latest version of the same target
+        """
+        path = tmp_path / "baselines.json"
+        store = BaselineStore(path)
+        store.record("v1", "sut", {"get": stats(0.010, 0.020)})
+        store.record("v2", "sut", {"get": stats(0.012, 0.022)})
+        store.record("fake", "fake", {"get": stats(0.001, 0.002)})
+        store.record("v2", "sut", {"ping": stats(0.001, 0.001)})
+
+        reloaded = BaselineStore(path)
+        assert reloaded.baseline("v1", "sut")[0] == "v1"
+        version, operations = reloaded.baseline("v3", "sut")
+        assert version == "v2"
+        assert set(operations) == {"get", "ping"}
+        assert reloaded.baseline("v3", "fake")[0] == "fake"
+        assert reloaded.baseline("v3", "other") == (None, {})
@@ -0,0 +1,82 @@
+"""
+Booking Response Cache Tests
+
+Covers the opt-in GET cache on BookingAPI: ETag revalidation, invalidation on
+writes made through the same client, and the LRU size bound.
+"""
+
+from api.booking_api import BookingAPI
+from api.cache import ResponseCache
+from utils import sample_booking
+
+
+class TestBookingCache:
+    """Conditional GET caching and invalidation"""
+
+    def cached_client(self, base_url, session, auth_api, booking_registry, size=16):
+        return BookingAPI(
+            base_url,
+            session,
+            auth_api=auth_api,
+            registry=booking_registry,
+            cache=ResponseCache(size),
+        )
+
+    def test_CACHE_001_repeat_reads_hit_cache(
+        self, base_url, session, auth_api, booking_registry
+    ):
+        """
+        CACHE-001: Repeat Reads
+        GET the same booking three times through a cached client
+        Expected: One miss then hits, same body every time
+        """
+        booking_api = self.cached_client(base_url, session, auth_api, booking_registry)
+        booking_id = booking_api.create(sample_booking("Cache", "Hit")).json()[
+            "bookingid"
+        ]
+
+        bodies = [booking_api.get(booking_id).json() for _ in range(3)]
+
+        assert bodies[0]["firstname"] == "Cache"
+        assert bodies[0] == bodies[1] == bodies[2]
+        assert (booking_api.cache.misses, booking_api.cache.hits) == (1, 2)
+
+    def test_CACHE_002_writes_invalidate(
+        self, base_url, session, auth_api, booking_registry
+    ):
+        """
+        CACHE-002: Invalidation on Write
+        GET, PATCH through the same client, GET again
+        Expected: Second GET is a miss and returns the patched booking
+        """
+        booking_api = self.cached_client(base_url, session, auth_api, booking_registry)
+        booking_id = booking_api.create(sample_booking("Cache", "Write")).json()[
+            "bookingid"
+        ]
+        booking_api.get(booking_id)
+
+        booking_api.partial_update(booking_id, {"firstname": "Patched"})
+        resp = booking_api.get(booking_id)
+
+        assert resp.json()["firstname"] == "Patched"
+        assert booking_api.cache.misses == 2
+        assert booking_api.cache.hits == 0
+
+    def test_CACHE_003_size_bound(self, base_url, session, auth_api, booking_registry):
+        """
+        CACHE-003: LRU Bound
+        Read five bookings through a cache limited to two entries
+        Expected: Only the two most recently read bookings are kept
+        """
+        booking_api = self.cached_client(
+            base_url, session, auth_api, booking_registry, size=2
+        )
+        created = booking_api.create_many(sample_booking(f"Cache{n}") for n in range(5))
+        booking_ids = [resp.json()["bookingid"] for resp in created]
+
+        for booking_id in booking_ids:
+            booking_api.get(booking_id)
+
+        assert len(booking_api.cache) == 2
+        booking_api.get(booking_ids[-1])
+        assert booking_api.cache.hits == 1
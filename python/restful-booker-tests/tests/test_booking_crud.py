@@ -12,6 +12,50 @@ from utils import sample_booking
 class TestBookingOperations:
     """Booking CRUD operation tests covering create, read, update, and delete workflows"""
 
+    def test_CREATE_003_create_with_xml(self, booking_api):
+        """
+        CREATE-003: Create with XML
+        Create booking with text/xml Content-Type
+        Expected: Success with XML response
+        """
+        payload = sample_booking("Xavier", "Markup")
+        create_resp = booking_api.create(payload, codec="xml")
+        assert create_resp.status_code == 200
+        assert create_resp.content.lstrip().startswith(b"<")
+
+        data = booking_api.decode(create_resp, "xml")
+        assert data["bookingid"] > 0
+        assert data["booking"] == payload
+
+    def test_CREATE_004_create_with_url_encoding(self, booking_api):
+        """
+        CREATE-004: Create with URL Encoding
+        Create booking with url-encoded Content-Type
+        Expected: Success with url-encoded response
+        """
+        payload = sample_booking("Ursula", "Encoded")
+        create_resp = booking_api.create(payload, codec="form")
+        assert create_resp.status_code == 200
+        assert b"bookingid=" in create_resp.content
+
+        data = booking_api.decode(create_resp, "form")
+        assert data["booking"] == payload
+        assert booking_api.get(data["bookingid"]).json() == payload
+
+    def test_GET_005_get_as_xml(self, booking_api):
+        """
+        GET-005: Get as XML
+        GET /booking/:id with Accept: application/xml
+        Expected: Returns XML response
+        """
+        payload = sample_booking("Gemma", "Tree")
+        booking_id = booking_api.create(payload).json()["bookingid"]
+
+        get_resp = booking_api.get(booking_id, codec="xml")
+        assert get_resp.status_code == 200
+        assert b"<booking>" in get_resp.content
+        assert booking_api.decode(get_resp, "xml") == payload
+
     def test_UPDATE_004_invalid_token(self, booking_api):
         """
         UPDATE-004: Invalid Token
@@ -44,7 +88,7 @@ class TestBookingOperations:
         assert create_resp.status_code == 200
 
         # 2. Try to update booking with invalid bookingId
-        token = auth_api.create_token()
+        token = auth_api.get_token()
         updated_payload = {**payload, "lastname": "Updated"}
         update_resp = booking_api.update(99999, updated_payload, token)
         assert update_resp.status_code == 405
@@ -55,7 +99,7 @@ class TestBookingOperations:
         DELETE /booking/:id with invalid ID
         Expected: Should fail or return 201
         """
-        token = auth_api.create_token()
+        token = auth_api.get_token()
         delete_resp = booking_api.delete(99999, token)
         assert delete_resp.status_code == 405
 
@@ -0,0 +1,94 @@
+"""
+Booking Filter Tests for Restful-Booker API
+
+Tests from Section 2.3 of the test plan covering GET /booking query filters.
+Test names include the test ID as per requirements (e.g., test_GET_006_filter_by_firstname)
+"""
+
+from utils import sample_booking
+
+
+def booking_ids(response):
+    return [
+        item["bookingid"] if isinstance(item, dict) else item
+        for item in response.json()
+    ]
+
+
+class TestBookingFilters:
+    """GET /booking filter tests by name, date and combinations"""
+
+    def test_GET_006_filter_by_firstname(self, booking_api, booking_factory):
+        """
+        GET-006: Filter by Firstname
+        GET /booking?firstname=<unique name>
+        Expected: Returns only bookings matching firstname
+        """
+        firstname = booking_factory.name("First")
+        booking_id = booking_api.create(sample_booking(firstname, "Filter")).json()[
+            "bookingid"
+        ]
+
+        resp = booking_api.get_all(firstname=firstname)
+        assert resp.status_code == 200
+        assert booking_ids(resp) == [booking_id]
+
+    def test_GET_007_filter_by_lastname(self, booking_api, booking_factory):
+        """
+        GET-007: Filter by Lastname
+        GET /booking?lastname=<unique name>
+        Expected: Returns only bookings matching lastname
+        """
+        lastname = booking_factory.name("Last")
+        created = booking_api.create_many(
+            sample_booking(first, lastname) for first in ("Ann", "Ben")
+        )
+        expected = {resp.json()["bookingid"] for resp in created}
+
+        resp = booking_api.get_all(lastname=lastname)
+        assert resp.status_code == 200
+        assert set(booking_ids(resp)) == expected
+
+    def test_GET_008_filter_by_checkin(self, booking_api, booking_factory):
+        """
+        GET-008: Filter by Checkin Date
+        GET /booking?checkin=<date before the booking's checkin>
+        Expected: Returns bookings with checkin >= date
+        """
+        payload = booking_factory.booking("Checkin", "Filter")
+        payload["bookingdates"] = {"checkin": "2031-03-10", "checkout": "2031-03-12"}
+        booking_id = booking_api.create(payload).json()["bookingid"]
+
+        resp = booking_api.get_all(checkin="2031-03-01")
+        assert resp.status_code == 200
+        assert booking_id in booking_ids(resp)
+
+    def test_GET_010_multiple_filters(self, booking_api, booking_factory):
+        """
+        GET-010: Multiple Filters
+        GET /booking with firstname AND lastname
+        Expected: Returns intersection of filters
+        """
+        first = booking_factory.name("Both")
+        last = booking_factory.name("Both")
+        created = booking_api.create_many(
+            [
+                sample_booking(first, last),
+                sample_booking(first, "Other"),
+                sample_booking("Other", last),
+            ]
+        )
+
+        resp = booking_api.get_all(firstname=first, lastname=last)
+        assert resp.status_code == 200
+        assert booking_ids(resp) == [created[0].json()["bookingid"]]
+
+    def test_GET_013_nonexistent_name_filter(self, booking_api, booking_factory):
+        """
+        GET-013: Non-existent Name Filter
+        GET /booking?firstname=NonExistent
+        Expected: Returns empty array
+        """
+        resp = booking_api.get_all(firstname=booking_factory.name("NonExistent"))
+        assert resp.status_code == 200
+        assert resp.json() == []
@@ -0,0 +1,102 @@
+"""
+Booking Generator Tests
+
+Checks that the seeded generator is reproducible, unique at volume, and that
+its records are accepted by POST /booking, with CREATE edge cases held to
+what the test plan expects of each.
+"""
+
+from itertools import islice
+
+from booking_generator import EDGE_CASES, BookingGenerator
+
+
+class TestBookingGenerator:
+    """Reproducibility, uniqueness and SUT acceptance of generated bookings"""
+
+    def test_DATA_001_same_seed_same_sequence(self):
+        """
+        DATA-001: Reproducible From Seed
+        Iterate two generators with the same seed and one with another seed
+        Expected: Identical sequences for equal seeds, different otherwise
+        """
+        first = BookingGenerator(seed=7, edge_case_rate=0.2).take(500)
+        again = BookingGenerator(seed=7, edge_case_rate=0.2).take(500)
+        other = BookingGenerator(seed=8, edge_case_rate=0.2).take(500)
+
+        assert first == again
+        assert first != other
+
+    def test_DATA_002_unique_at_volume(self):
+        """
+        DATA-002: Unique Payloads
+        Draw 50,000 records in batches of 10,000
+        Expected: Every firstname/lastname pair is distinct
+        """
+        batches = BookingGenerator(seed=1, namespace="gw0").batches(10_000)
+        names = {
+            (booking["firstname"], booking["lastname"])
+            for batch in islice(batches, 5)
+            for booking in batch
+        }
+
+        assert len(names) == 50_000
+
+    def test_DATA_003_edge_cases_applied(self):
+        """
+        DATA-003: Edge Case Coverage
+        Generate with edge_case_rate=1 for each CREATE edge case in turn
+        Expected: Each mutation shows up in the generated record
+        """
+
+        def one(case):
+            return BookingGenerator(edge_case_rate=1, edge_cases=[case]).take(1)[0]
+
+        assert one("CREATE-007")["totalprice"] == 0
+        assert one("CREATE-008")["totalprice"] < 0
+        assert one("CREATE-011")["firstname"] == ""
+        assert len(one("CREATE-013")["firstname"]) > 255
+        assert one("CREATE-014")["bookingdates"]["checkout"] < "2001"
+        dates = one("CREATE-015")["bookingdates"]
+        assert dates["checkout"] < dates["checkin"]
+        assert set(EDGE_CASES) >= {"CREATE-007", "CREATE-013", "CREATE-015"}
+
+    def test_DATA_004_generated_bookings_created(self, booking_api, data_namespace):
+        """
+        DATA-004: Generated Payloads Accepted
+        create_many with 50 generated records without edge cases
+        Expected: All created and read back unchanged
+        """
+        payloads = BookingGenerator(
+            seed=3, namespace=data_namespace, edge_case_rate=0
+        ).take(50)
+
+        created = booking_api.create_many(payloads)
+        assert created.ok
+        fetched = booking_api.get_many(resp.json()["bookingid"] for resp in created)
+        assert [resp.json()["lastname"] for resp in fetched] == [
+            payload["lastname"] for payload in payloads
+        ]
+
+    def test_DATA_005_edge_cases_per_plan(self, booking_api, data_namespace):
+        """
+        DATA-005: Generated Edge Cases
+        Create one generated record per CREATE edge case
+        Expected: "Should succeed" cases created and read back; the rest either created or rejected with an error status
+        """
+        must_succeed = {"CREATE-007", "CREATE-012", "CREATE-014"}
+        for case in EDGE_CASES:
+            payload = BookingGenerator(
+                namespace=f"{data_namespace}{case}", edge_case_rate=1, edge_cases=[case]
+            ).take(1)[0]
+
+            resp = booking_api.create(payload)
+
+            if case in must_succeed:
+                assert resp.status_code == 200, case
+                booking_id = resp.json()["bookingid"]
+                assert booking_api.get(booking_id).json() == payload, case
+            elif resp.status_code == 200:
+                assert booking_api.get(resp.json()["bookingid"]).status_code == 200
+            else:
+                assert 400 <= resp.status_code < 600, case
@@ -0,0 +1,53 @@
+"""
+Booking Registry Tests
+
+Covers tracking of bookings created through BookingAPI and the batched
+teardown that deletes whatever is still live at the end of a run.
+"""
+
+from api.booking_api import BookingAPI
+from api.registry import BookingRegistry
+from utils import sample_booking
+
+
+class TestBookingRegistry:
+    """Registration on create/delete and batched cleanup"""
+
+    def test_REGISTRY_001_tracks_live_bookings(self, booking_api, booking_registry):
+        """
+        REGISTRY-001: Track Live Bookings
+        Create a booking, then delete it through the same client
+        Expected: ID registered on create and dropped on delete
+        """
+        booking_id = booking_api.create(sample_booking()).json()["bookingid"]
+        assert booking_id in booking_registry
+
+        booking_api.delete(booking_id)
+        assert booking_id not in booking_registry
+
+    def test_REGISTRY_002_cleanup_deletes_in_batches(self, base_url, session, auth_api):
+        """
+        REGISTRY-002: Batched Cleanup
+        Create 25 bookings, delete one out-of-band, clean up in batches of 10
+        Expected: 24 deleted, 1 already gone, registry empty, all now 404
+        """
+        registry = BookingRegistry()
+        booking_api = BookingAPI(
+            base_url, session, auth_api=auth_api, registry=registry
+        )
+        created = booking_api.create_many(
+            sample_booking(f"Registry{n}") for n in range(25)
+        )
+        booking_ids = [resp.json()["bookingid"] for resp in created]
+        booking_api.delete(booking_ids[0], token=auth_api.get_token())
+        registry.add(booking_ids[0])
+
+        report = registry.cleanup(booking_api, batch_size=10)
+
+        assert report.deleted == 24
+        assert report.already_gone == 1
+        assert report.failed == {}
+        assert len(registry) == 0
+        assert all(
+            resp.status_code == 404 for resp in booking_api.get_many(booking_ids)
+        )
@@ -0,0 +1,88 @@
+"""
+Booking Streaming Tests
+
+Covers BookingAPI.iter_ids, which parses GET /booking incrementally, and
+iter_bookings, which pipelines detail GETs behind it.
+"""
+
+import json
+
+import pytest
+
+from api.streaming import iter_json_array
+from utils import sample_booking
+
+
+class TestBookingStreaming:
+    """Incremental ID parsing and pipelined detail fetch"""
+
+    def test_STREAM_001_parse_across_chunk_boundaries(self):
+        """
+        STREAM-001: Chunk Boundaries
+        Feed a bookingid list to the parser one byte at a time
+        Expected: Same items as json.loads, with multi-digit numbers kept whole
+        """
+        items = [{"bookingid": n} for n in (1, 23, 456, 7890)] + [12345, "é"]
+        body = json.dumps(items, ensure_ascii=False).encode()
+
+        parsed = list(iter_json_array(body[i : i + 1] for i in range(len(body))))
+
+        assert parsed == items
+        assert list(iter_json_array([b"[]"])) == []
+
+    def test_STREAM_002_iter_ids_matches_get_all(self, booking_api, booking_factory):
+        """
+        STREAM-002: Streamed IDs
+        Stream GET /booking?lastname=<unique name> with a tiny chunk size
+        Expected: Same IDs, in the same order, as get_all
+        """
+        lastname = booking_factory.name("Stream")
+        booking_api.create_many(
+            sample_booking(first, lastname) for first in ("Ann", "Ben", "Cy")
+        )
+
+        expected = [
+            item["bookingid"] for item in booking_api.get_all(lastname=lastname).json()
+        ]
+        streamed = list(booking_api.iter_ids(lastname=lastname, chunk_size=7))
+
+        assert len(expected) == 3
+        assert streamed == expected
+
+    def test_STREAM_003_iter_bookings_pipeline(self, booking_api, booking_factory):
+        """
+        STREAM-003: Pipelined Details
+        Iterate bookings for a unique lastname with two fetches in flight
+        Expected: Every booking comes back once, in ID order, with its details
+        """
+        lastname = booking_factory.name("Pipeline")
+        created = booking_api.create_many(
+            sample_booking(f"P{n}", lastname) for n in range(6)
+        )
+        expected = [resp.json()["bookingid"] for resp in created]
+
+        results = list(booking_api.iter_bookings(max_in_flight=2, lastname=lastname))
+
+        assert sorted(booking_id for booking_id, _ in results) == sorted(expected)
+        assert [booking_id for booking_id, _ in results] == list(
+            booking_api.iter_ids(lastname=lastname)
+        )
+        for _, resp in results:
+            assert resp.status_code == 200
+            assert resp.json()["lastname"] == lastname
+
+    def test_STREAM_004_nested_arrays(self):
+        """
+        STREAM-004: Nested Arrays
+        Feed an array whose elements are arrays, with leading whitespace, one byte at a time
+        Expected: Nested arrays come back whole; a body that is not an array is rejected
+        """
+        items = [[1, 2], [], [[3]], {"ids": [4, 5]}, 6]
+        body = b" \n" + json.dumps(items).encode()
+
+        parsed = list(iter_json_array(body[i : i + 1] for i in range(len(body))))
+
+        assert parsed == items
+        assert list(iter_json_array([b" [", b" ]"])) == []
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json_array([b'{"bookingid": 1}']))
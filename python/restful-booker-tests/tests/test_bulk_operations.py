@@ -0,0 +1,65 @@
+"""
+Bulk Operation Tests for Restful-Booker API
+
+Covers the BookingAPI bulk helpers used to seed and tear down test data.
+Each helper runs requests on a bounded thread pool and returns results in input order.
+"""
+
+from utils import sample_booking
+
+
+class TestBulkOperations:
+    """Bulk create, read, update and delete over the shared session"""
+
+    def test_BULK_001_create_get_update_delete_many(self, booking_api):
+        """
+        BULK-001: Bulk CRUD Round Trip
+        create_many → get_many → update_many → delete_many → get_many
+        Expected: Every item succeeds and results keep input order
+        """
+        names = [(f"Bulk{i}", "Seeded") for i in range(20)]
+
+        created = booking_api.create_many(sample_booking(f, l) for f, l in names)
+        assert created.ok
+        booking_ids = [resp.json()["bookingid"] for resp in created]
+        assert len(set(booking_ids)) == len(names)
+
+        fetched = booking_api.get_many(booking_ids)
+        assert fetched.ok
+        assert [resp.json()["firstname"] for resp in fetched] == [f for f, _ in names]
+
+        updated = booking_api.update_many(
+            (
+                (booking_id, sample_booking("Bulk", "Updated"))
+                for booking_id in booking_ids
+            ),
+        )
+        assert updated.ok
+        assert all(resp.json()["lastname"] == "Updated" for resp in updated)
+
+        deleted = booking_api.delete_many(booking_ids)
+        assert all(resp.status_code == 201 for resp in deleted)
+
+        verify = booking_api.get_many(booking_ids)
+        assert all(resp.status_code == 404 for resp in verify)
+
+    def test_BULK_002_per_item_errors_do_not_abort_batch(self, booking_api):
+        """
+        BULK-002: Per-item Errors
+        create_many where one payload cannot be serialized
+        Expected: Error recorded for that index, other items still created
+        """
+        payloads = [
+            sample_booking("Bulk", "Errors"),
+            {"firstname": {"not", "serializable"}},
+            sample_booking("Bulk", "Errors"),
+        ]
+
+        result = booking_api.create_many(payloads)
+
+        assert not result.ok
+        assert list(result.errors) == [1]
+        assert isinstance(result.errors[1], TypeError)
+        assert result[1] is None
+        assert result[0].status_code == 200
+        assert result[2].status_code == 200
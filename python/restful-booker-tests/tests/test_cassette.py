@@ -0,0 +1,126 @@
+"""
+Cassette Record/Replay Tests
+
+Records client traffic against a private fake SUT, then replays it with no
+server at all. Self-contained, so it also passes inside a replayed suite run.
+"""
+
+import zlib
+
+import pytest
+import requests
+
+from api.auth_api import AuthAPI
+from api.booking_api import BookingAPI
+from api.cassette import (
+    MAGIC,
+    RECORD,
+    REDACTED_TOKEN,
+    REPLAY,
+    Cassette,
+    CassetteMismatchError,
+    use_cassette,
+)
+from fake_server import DEFAULT_PASSWORD, DEFAULT_USERNAME, FakeServer
+from utils import sample_booking
+
+OFFLINE_URL = "http://127.0.0.1:9"
+
+
+def cassette_client(
+    base_url, cassette, username=DEFAULT_USERNAME, password=DEFAULT_PASSWORD
+):
+    session = use_cassette(requests.Session(), cassette)
+    session.headers.update({"Content-type": "application/json"})
+    auth_api = AuthAPI(base_url, session, username=username, password=password)
+    return BookingAPI(base_url, session, auth_api=auth_api)
+
+
+class TestCassette:
+    """Cassette recording, offline replay and mismatch reporting"""
+
+    def record(self, path):
+        cassette = Cassette(path, RECORD)
+        with FakeServer() as server:
+            booking_api = cassette_client(server.url, cassette)
+            booking_id = booking_api.create(sample_booking("Tape", "Deck")).json()[
+                "bookingid"
+            ]
+            first = booking_api.get(booking_id).json()
+            booking_api.partial_update(booking_id, {"firstname": "Rewound"})
+            second = booking_api.get(booking_id).json()
+        cassette.close()
+        return booking_id, first, second
+
+    def test_CASSETTE_001_replay_without_server(self, tmp_path):
+        """
+        CASSETTE-001: Offline Replay
+        Record create/get/auth/patch/get against a fake, replay against a dead port
+        Expected: Same responses, repeated GETs replayed in recorded order
+        """
+        path = tmp_path / "crud.cassette"
+        booking_id, first, second = self.record(path)
+
+        cassette = Cassette(path, REPLAY)
+        booking_api = cassette_client(OFFLINE_URL, cassette)
+        try:
+            created = booking_api.create(sample_booking("Tape", "Deck"))
+            assert created.json()["bookingid"] == booking_id
+            assert booking_api.get(booking_id).json() == first
+            patched = booking_api.partial_update(booking_id, {"firstname": "Rewound"})
+            assert patched.status_code == 200
+            assert booking_api.get(booking_id).json() == second
+            assert second["firstname"] == "Rewound"
+            assert len(cassette) == 5
+        finally:
+            cassette.close()
+
+    def test_CASSETTE_002_mismatch_shows_diff(self, tmp_path):
+        """
+        CASSETTE-002: Replay Mismatch
+        Replay a create whose body differs from the recording, then over-replay a GET
+        Expected: CassetteMismatchError with a diff of the changed field and a repeat count
+        """
+        path = tmp_path / "crud.cassette"
+        booking_id, _, _ = self.record(path)
+
+        cassette = Cassette(path, REPLAY)
+        booking_api = cassette_client(OFFLINE_URL, cassette)
+        try:
+            with pytest.raises(CassetteMismatchError) as mismatch:
+                booking_api.create(sample_booking("Tape", "Cassette"))
+            message = str(mismatch.value)
+            assert '-  "lastname": "Deck"' in message
+            assert '+  "lastname": "Cassette"' in message
+
+            booking_api.get(booking_id)
+            booking_api.get(booking_id)
+            with pytest.raises(CassetteMismatchError, match="recorded 2 time"):
+                booking_api.get(booking_id)
+        finally:
+            cassette.close()
+
+    def test_CASSETTE_003_auth_redacted(self, tmp_path):
+        """
+        CASSETTE-003: Credentials Redacted
+        Record a run that authenticates, scan the stored records, replay with other credentials
+        Expected: No password or live token on disk; /auth replays with a placeholder token
+        """
+        path = tmp_path / "crud.cassette"
+        self.record(path)
+
+        cassette = Cassette(path, REPLAY)
+        try:
+            data = path.read_bytes()[len(MAGIC) :]
+            stored = b""
+            for _ in range(len(cassette)):
+                blob = zlib.decompressobj()
+                stored += blob.decompress(data)
+                data = blob.unused_data
+            assert DEFAULT_PASSWORD.encode() not in stored
+            assert REDACTED_TOKEN.encode() in stored
+
+            booking_api = cassette_client(OFFLINE_URL, cassette, "other", "secret")
+            assert booking_api.auth_api.create_token() == REDACTED_TOKEN
+        finally:
+            cassette.close()
@@ -0,0 +1,127 @@
+"""
+Codec Tests
+
+Checks the pluggable JSON, XML and form codecs and pre-encoded payload
+templates used by BaseAPI, that template bodies are accepted by POST /booking,
+and a short run of the format benchmark.
+"""
+
+import json
+
+import pytest
+
+from api.codec import (
+    FormCodec,
+    OrjsonCodec,
+    PayloadTemplate,
+    StdlibJSONCodec,
+    XMLCodec,
+    orjson,
+)
+from perf.formats import FORMATS, run_benchmark
+from utils import sample_booking
+
+CODECS = [StdlibJSONCodec()] + ([OrjsonCodec()] if orjson is not None else [])
+
+
+class TestCodec:
+    """Codec round trips, template rendering and pre-encoded requests"""
+
+    @pytest.mark.parametrize(
+        "codec", CODECS + [XMLCodec(), FormCodec()], ids=lambda codec: codec.name
+    )
+    def test_CODEC_001_round_trip(self, codec):
+        """
+        CODEC-001: Codec Round Trip
+        Encode and decode a booking with unicode names
+        Expected: Bytes out, identical booking back
+        """
+        booking = sample_booking("Zoë", "Παπαδόπουλος")
+
+        encoded = codec.dumps(booking)
+
+        assert isinstance(encoded, bytes)
+        assert codec.loads(encoded) == booking
+
+    @pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+    def test_CODEC_002_template_matches_full_encode(self, codec):
+        """
+        CODEC-002: Template Rendering
+        Render a template swapping top-level and nested fields
+        Expected: Same JSON document as encoding the changed booking in full
+        """
+        template = PayloadTemplate(
+            sample_booking(),
+            fields=("firstname", "lastname", "bookingdates.checkin"),
+            codec=codec,
+        )
+
+        body = template.render(
+            firstname='Jo "Quoted"',
+            lastname="Smith",
+            bookingdates__checkin="2026-01-02",
+        )
+
+        expected = sample_booking('Jo "Quoted"', "Smith")
+        expected["bookingdates"]["checkin"] = "2026-01-02"
+        assert json.loads(body) == expected
+
+    @pytest.mark.parametrize("codec", [XMLCodec(), FormCodec()], ids=lambda c: c.name)
+    def test_CODEC_002_template_rejects_text_formats(self, codec):
+        """
+        CODEC-002: Template Rendering (non-JSON codec)
+        Build a template with the XML or form codec
+        Expected: ValueError naming the codec, as the body cannot be split on values
+        """
+        with pytest.raises(ValueError, match=codec.name):
+            PayloadTemplate(sample_booking(), fields=("firstname",), codec=codec)
+
+    def test_CODEC_003_pre_encoded_body_sent_as_is(self, booking_api):
+        """
+        CODEC-003: Pre-encoded Body
+        POST /booking with bytes rendered from a template
+        Expected: Booking created with the swapped names
+        """
+        template = PayloadTemplate(
+            sample_booking(), fields=("firstname", "lastname"), codec=booking_api.codec
+        )
+
+        resp = booking_api.create(template.render(firstname="Pre", lastname="Encoded"))
+
+        assert resp.status_code == 200
+        booking = booking_api.decode(resp)["booking"]
+        assert (booking["firstname"], booking["lastname"]) == ("Pre", "Encoded")
+
+    def test_CODEC_004_format_benchmark(self, booking_api):
+        """
+        CODEC-004: Format Benchmark
+        Run the format benchmark for three iterations per format
+        Expected: Costs, sizes and latencies for every format; XML is the largest body
+        """
+        results = run_benchmark(booking_api, iterations=3)
+
+        assert list(results) == FORMATS
+        for stats in results.values():
+            assert stats["encode"] > 0 and stats["decode"] > 0
+            assert stats["create"]["count"] == stats["get"]["count"] == 3
+        assert results["xml"]["request_bytes"] == max(
+            stats["request_bytes"] for stats in results.values()
+        )
+
+    @pytest.mark.parametrize("codec", [XMLCodec(), FormCodec()], ids=lambda c: c.name)
+    def test_CODEC_005_only_typed_fields_coerced(self, codec, booking_api):
+        """
+        CODEC-005: Text Formats Keep Strings
+        Create a booking named "007" / "1.5" in XML and form, decode the reply
+        Expected: Names stay strings; totalprice and depositpaid come back typed
+        """
+        booking = sample_booking("007", "1.5")
+
+        assert codec.loads(codec.dumps(booking)) == booking
+
+        resp = booking_api.create(booking, codec=codec.name)
+
+        assert resp.status_code == 200
+        created = booking_api.decode(resp, codec)
+        assert created["booking"] == booking
+        assert type(created["bookingid"]) is int
@@ -0,0 +1,137 @@
+"""
+Adaptive Concurrency Tests
+
+AIMD behaviour of the client-side limiter, BaseAPI requests gated by it, and
+a short capacity search against the SUT.
+"""
+
+import pytest
+import requests
+
+from api.booking_api import BookingAPI
+from api.concurrency import AdaptiveLimiter
+from api.healthcheck_api import HealthCheckAPI
+from api.transport import TransportConfig, build_session
+from perf.capacity import CapacityProbe, find_capacity, saturation
+from perf.clients import Clients
+from perf.scenarios import create_read
+from utils import sample_booking
+
+
+def window(throughput, p95, limit, server_errors=0):
+    return {
+        "elapsed": throughput / 100,
+        "limit": limit,
+        "requests": int(throughput),
+        "throughput": throughput,
+        "server_errors": server_errors,
+        "failures": 0,
+        "p95": p95,
+    }
+
+
+class TestAdaptiveConcurrency:
+    """AIMD limiter, BaseAPI gating and capacity search"""
+
+    def test_LIMIT_001_additive_increase_multiplicative_decrease(self):
+        """
+        LIMIT-001: AIMD Limit
+        Release fast, slow, 5xx and failed requests through a limiter starting at 4
+        Expected: +1 per window of fast responses, one halving per congestion window, floor at min_limit
+        """
+        limiter = AdaptiveLimiter(initial=4, min_limit=1, latency_target=0.1)
+
+        for _ in range(4):
+            limiter.release(limiter.acquire(), 0.01, 200)
+        assert 4.9 < limiter.limit < 5.0
+
+        tickets = [limiter.acquire() for _ in range(4)]
+        limiter.release(tickets[0], 0.5, 200)
+        limiter.release(tickets[1], 0.01, 503)
+        assert limiter.limit == pytest.approx(limiter.peak_limit / 2, rel=0.01)
+        assert limiter.backoffs == 1
+
+        limiter.release(tickets[2], 0.01, None)
+        limiter.release(tickets[3], 0.01, 200)
+        for status in (None, 503, None):
+            limiter.release(limiter.acquire(), 0.01, status)
+        assert limiter.limit == 1
+        assert limiter.snapshot() | {"limit": 1} == {
+            "limit": 1,
+            "peak_limit": limiter.peak_limit,
+            "in_flight": 0,
+            "successes": 5,
+            "slow": 1,
+            "server_errors": 2,
+            "failures": 3,
+            "backoffs": 4,
+        }
+
+    def test_LIMIT_002_base_api_requests_pass_through_limiter(
+        self, base_url, session, booking_api
+    ):
+        """
+        LIMIT-002: BaseAPI Gating
+        GET a booking through a limited client, then /ping an unreachable host
+        Expected: Successes counted and slots released; the connection error backs the limit off
+        """
+        booking_id = booking_api.create(sample_booking("Lim", "Iter")).json()[
+            "bookingid"
+        ]
+        limiter = AdaptiveLimiter(initial=2, latency_target=5.0)
+        limited = BookingAPI(base_url, session, limiter=limiter)
+        for _ in range(3):
+            assert limited.get(booking_id).status_code == 200
+        assert limiter.successes == 3 and limiter.in_flight == 0
+
+        session = build_session(TransportConfig(max_retries=0, connect_timeout=1.0))
+        unreachable = HealthCheckAPI("http://127.0.0.1:1", session, limiter=limiter)
+        with pytest.raises(requests.ConnectionError):
+            unreachable.get()
+        session.close()
+        assert limiter.failures == 1 and limiter.in_flight == 0
+        assert limiter.backoffs == 1
+
+    def test_LIMIT_003_capacity_search(
+        self, live_base_url, auth_username, auth_password
+    ):
+        """
+        LIMIT-003: Capacity Search
+        Run INT-002 from 8 closed-loop workers for 1s under a 2s SLO, then summarize synthetic windows
+        Expected: Windows within the limiter's bounds; sustainable peak and first SLO break found
+        """
+        probe = CapacityProbe()
+        limiter = AdaptiveLimiter(initial=1, max_limit=8, latency_target=2.0)
+        clients = Clients(
+            live_base_url,
+            workers=8,
+            hooks=[probe],
+            username=auth_username,
+            password=auth_password,
+            limiter=limiter,
+        )
+        try:
+            windows = find_capacity(
+                clients, probe, limiter, create_read, duration=1.0, interval=0.25
+            )
+        finally:
+            clients.close()
+
+        assert len(windows) >= 3
+        assert sum(sample["iterations"] for sample in windows) > 0
+        assert all(1 <= sample["limit"] <= 8 for sample in windows)
+        assert limiter.peak_limit > 1
+
+        report = saturation(
+            [
+                window(100, 0.05, 2),
+                window(300, 0.09, 6),
+                window(400, 0.30, 12),
+                window(350, 0.08, 7, server_errors=1),
+                window(320, 0.08, 6.5),
+            ],
+            slo=0.1,
+        )
+        assert report["sustainable"]["throughput"] == 320
+        assert report["first_break"]["limit"] == 12
+        assert report["settled_limit"] == 7
@@ -0,0 +1,85 @@
+"""
+Connection Timing Tests
+
+Per-request connect / TTFB / download breakdown from the timed session
+adapter, pooled-connection reuse counters, and merging of the recorder
+across processes.
+"""
+
+from api.healthcheck_api import HealthCheckAPI
+from api.metrics import ConnectionRecorder
+from api.timing import RequestTiming
+from api.transport import TransportConfig, build_session
+
+
+def timing(adapter, connect=0.0, ttfb=0.002, download=0.0001, opened=0):
+    result = RequestTiming(adapter)
+    result.connect = connect
+    result.ttfb = ttfb
+    result.download = download
+    result.opened = opened
+    return result
+
+
+class TestConnectionTiming:
+    """Request phase timing and connection reuse"""
+
+    def test_CONN_001_pooled_connection_reused(self, live_base_url):
+        """
+        CONN-001: Connection Reuse
+        Ping three times on a keep-alive session, then twice with keep-alive disabled
+        Expected: One new connection then reuse; every request opens one without keep-alive
+        """
+        recorder = ConnectionRecorder()
+        for name, keep_alive, expected_new in (
+            ("pooled", True, 1),
+            ("closing", False, 3),
+        ):
+            session = build_session(TransportConfig(keep_alive=keep_alive), name=name)
+            healthcheck_api = HealthCheckAPI(
+                live_base_url, session, timing_hooks=[recorder]
+            )
+            timings = [healthcheck_api.get().timing for _ in range(3)]
+            adapter = session.get_adapter(live_base_url)
+            session.close()
+
+            assert adapter.stats() == {
+                "requests": 3,
+                "new_connections": expected_new,
+                "reused_connections": 3 - expected_new,
+            }
+            assert timings[0].connect > 0 and not timings[0].reused
+            assert all(t.ttfb > 0 and t.download >= 0 for t in timings)
+            assert all(t.attempts == 1 for t in timings)
+
+        assert recorder.adapter_summary() == {
+            "closing": {"new": 3, "reused": 0},
+            "pooled": {"new": 1, "reused": 2},
+        }
+        stats = recorder.summary()["GET /ping"]
+        assert stats["count"] == 6 and stats["reuse_rate"] == 2 / 6
+        assert stats["connect"]["count"] == 4
+
+    def test_CONN_002_recorder_merges_across_processes(self):
+        """
+        CONN-002: Merge Connection Timings
+        Record timings in two recorders and merge one into the other via to_dict
+        Expected: Phase histograms and new/reused counts add up per endpoint and adapter
+        """
+        worker, controller = ConnectionRecorder(), ConnectionRecorder()
+        worker("GET", "/booking/{id}", timing("session", connect=0.003, opened=1))
+        worker("GET", "/booking/{id}", timing("session"))
+        controller("GET", "/booking/{id}", timing("session", ttfb=0.010))
+        controller("POST", "/booking", timing("perf"))
+
+        controller.merge_dict(worker.to_dict())
+
+        stats = controller.summary()["GET /booking/{id}"]
+        assert (stats["count"], stats["new"], stats["reused"]) == (3, 1, 2)
+        assert stats["connect"]["count"] == 1
+        assert stats["ttfb"]["count"] == 3
+        assert stats["ttfb"]["max"] == 0.010
+        assert controller.adapter_summary() == {
+            "perf": {"new": 0, "reused": 1},
+            "session": {"new": 1, "reused": 2},
+        }
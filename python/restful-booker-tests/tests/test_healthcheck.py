@@ -5,7 +5,14 @@ Tests from Section 2.7 of the test plan covering API health check endpoints.
 Test names include the test ID as per requirements (e.g., test_HEALTH_001_ping_response_status)
 """
 
+import time
+
+import pytest
+import requests
+
+from api.health import HealthReport, HealthSampler
 from api.healthcheck_api import HealthCheckAPI
+from api.transport import TransportConfig, build_session
 
 
 class TestHealthCheck:
@@ -31,3 +38,83 @@ class TestHealthCheck:
         assert ping_resp.status_code == 201
         # Verify response body contains success message
         assert ping_resp.text.strip() in ["Created", "OK"] or "OK" in ping_resp.text
+
+    def test_HEALTH_003_wait_until_ready(self, healthcheck_api: HealthCheckAPI):
+        """
+        HEALTH-003: Readiness Wait
+        Call wait_until_ready against a running SUT
+        Expected: Returns the time waited without backing off
+        """
+        assert 0 <= healthcheck_api.wait_until_ready(timeout=5) < 1
+
+    def test_HEALTH_004_wait_until_ready_times_out(self):
+        """
+        HEALTH-004: Readiness Timeout
+        Call wait_until_ready against a port nothing listens on
+        Expected: TimeoutError naming the last error after roughly the timeout
+        """
+        transport = TransportConfig(connect_timeout=0.2)
+        healthcheck_api = HealthCheckAPI(
+            "http://127.0.0.1:9", requests.Session(), transport=transport
+        )
+
+        start = time.perf_counter()
+        with pytest.raises(TimeoutError, match="ConnectionError"):
+            healthcheck_api.wait_until_ready(timeout=0.5, initial_delay=0.05)
+        assert time.perf_counter() - start < 2
+
+    def test_HEALTH_005_background_sampler(self, live_base_url):
+        """
+        HEALTH-005: Background Sampling
+        Sample /ping every 10ms, then summarize a report that includes a down period
+        Expected: Full availability while up; availability, outage and drift from samples
+        """
+        with requests.Session() as session:
+            sampler = HealthSampler(
+                HealthCheckAPI(live_base_url, session), 0.01
+            ).start()
+            time.sleep(0.2)
+            sampler.stop()
+        assert len(sampler.samples) >= 5
+        assert all(ok for _, ok, _ in sampler.samples)
+
+        report = HealthReport()
+        report.merge_dict({"time_to_ready": 0.5, "samples": []})
+        report.merge_dict(
+            {
+                "time_to_ready": 1.5,
+                "samples": [
+                    (0.0, True, 0.001),
+                    (1.0, False, 0.0),
+                    (4.0, True, 0.002),
+                    (5.0, True, 0.004),
+                ],
+            }
+        )
+        summary = report.summary()
+        assert summary["time_to_ready"] == 1.5
+        assert summary["availability"] == 0.75
+        assert summary["longest_outage"] == 3.0
+        assert summary["drift"] == 3.0
+
+    def test_HEALTH_006_probe_transport_sets_poll_rate(self):
+        """
+        HEALTH-006: Probe Polling Rate
+        Wait on a dead port through a session built from TransportConfig.probe()
+        Expected: No urllib3 retries, so the backoff loop polls several times
+        """
+        probe = TransportConfig().probe()
+        polls = []
+        with build_session(probe, name="health") as session:
+            healthcheck_api = HealthCheckAPI(
+                "http://127.0.0.1:9",
+                session,
+                transport=probe,
+                hooks=[lambda method, route, status, elapsed: polls.append(status)],
+            )
+            start = time.perf_counter()
+            with pytest.raises(TimeoutError):
+                healthcheck_api.wait_until_ready(timeout=0.5, initial_delay=0.05)
+        assert probe.max_retries == 0
+        assert time.perf_counter() - start < 1
+        assert len(polls) >= 3 and set(polls) == {None}
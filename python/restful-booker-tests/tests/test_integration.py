@@ -34,7 +34,7 @@ class TestIntegration:
         assert booking_data["lastname"] == "Brown"
 
         # 3. Update Booking
-        token = auth_api.create_token()
+        token = auth_api.get_token()
         updated_payload = sample_booking("James", "Brown")
         update_resp = booking_api.update(booking_id, updated_payload, token)
         assert update_resp.status_code == 200
@@ -81,15 +81,16 @@ class TestIntegration:
             resp = booking_api.get(booking_id)
             assert resp.status_code == 200
 
-    def test_INT_003_filter_after_creation(self, booking_api):
+    def test_INT_003_filter_after_creation(self, booking_api, booking_factory):
         """
         INT-003: Filter After Creation
         Create booking, then filter by details
         Expected: Created booking appears in filtered results
         """
         # Create a unique booking
-        unique_first = f"TestUser_{int(time.time())}"
-        payload = sample_booking(unique_first, "FilterTest")
+        unique_first = booking_factory.name("TestUser")
+        unique_last = booking_factory.name("FilterTest")
+        payload = sample_booking(unique_first, unique_last)
         create_resp = booking_api.create(payload)
         assert create_resp.status_code == 200
         booking_id = create_resp.json()["bookingid"]
@@ -104,7 +105,7 @@ class TestIntegration:
         assert booking_id in booking_ids
 
         # Filter by lastname
-        filter_resp_last = booking_api.get_all(lastname="FilterTest")
+        filter_resp_last = booking_api.get_all(lastname=unique_last)
         assert filter_resp_last.status_code == 200
         results_last = filter_resp_last.json()
         booking_ids_last = [
@@ -132,7 +133,7 @@ class TestIntegration:
         original_price = original_data["totalprice"]
 
         # Update with new values
-        token = auth_api.create_token()
+        token = auth_api.get_token()
         updated_payload = sample_booking("Updated", "Name")
         updated_payload["totalprice"] = original_price + 100
 
@@ -158,7 +159,7 @@ class TestIntegration:
         assert create_resp.status_code == 200
         booking_id = create_resp.json()["bookingid"]
 
-        token = auth_api.create_token()
+        token = auth_api.get_token()
 
         # First partial update - change firstname only
         patch_1 = {"firstname": "Jonathan"}
@@ -228,7 +229,7 @@ class TestIntegration:
         Create, delete, create new with same data
         Expected: New booking has different ID
         """
-        token = auth_api.create_token()
+        token = auth_api.get_token()
         shared_payload = sample_booking("Shared", "Data")
 
         # Create first booking
@@ -0,0 +1,44 @@
+"""
+Load Generator Tests
+
+Checks the open-loop arrival schedule and a short run of the INT-001 scenario
+through the same clients the functional tests use.
+"""
+
+from types import SimpleNamespace
+
+from perf.loadgen import arrival_times, run_load
+from perf.scenarios import crud_flow
+
+
+class TestLoadGenerator:
+    """Arrival schedule shape and a short open-loop run"""
+
+    def test_LOAD_001_arrival_schedule_phases(self):
+        """
+        LOAD-001: Arrival Schedule
+        10 it/s with 2s ramp-up, 3s steady, 2s ramp-down
+        Expected: 50 ordered arrivals, evenly spaced while steady, within 7s
+        """
+        times = list(arrival_times(10, ramp_up=2, steady=3, ramp_down=2))
+
+        assert len(times) == 50
+        assert times == sorted(times)
+        assert times[-1] < 7
+        steady = [t for t in times if 2 <= t < 5]
+        gaps = {round(b - a, 6) for a, b in zip(steady, steady[1:])}
+        assert gaps == {0.1}
+
+    def test_LOAD_002_crud_scenario_open_loop(self, booking_api, auth_api):
+        """
+        LOAD-002: Open-loop CRUD Run
+        Run INT-001 at 20 it/s for one second
+        Expected: Every iteration completes without errors
+        """
+        clients = SimpleNamespace(booking_api=booking_api, auth_api=auth_api)
+
+        result = run_load(crud_flow, clients, arrival_times(20, steady=1), workers=8)
+
+        assert result.completed == 20
+        assert result.errors == {}
+        assert result.latency.count == 20
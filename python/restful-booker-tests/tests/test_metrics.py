@@ -0,0 +1,69 @@
+"""
+Latency Metrics Tests
+
+Checks the histogram used by the latency hook and the per-endpoint keys the
+clients record, so the terminal and JSON reports group requests by route template.
+"""
+
+from api.metrics import LatencyHistogram, LatencyRecorder
+from utils import sample_booking
+
+
+class TestLatencyMetrics:
+    """Histogram accuracy and per-endpoint recording"""
+
+    def test_METRICS_001_percentiles_within_bucket_error(self):
+        """
+        METRICS-001: Percentile Accuracy
+        Record 1..1000 ms and read back percentiles
+        Expected: Each percentile within ~3% of the exact value, max exact
+        """
+        histogram = LatencyHistogram()
+        for ms in range(1, 1001):
+            histogram.record(ms / 1000)
+
+        for pct, exact in ((50, 0.5), (95, 0.95), (99, 0.99)):
+            assert abs(histogram.percentile(pct) - exact) / exact < 0.04
+        assert histogram.summary()["max"] == 1.0
+        assert histogram.count == 1000
+
+    def test_METRICS_002_requests_grouped_by_route_template(self, booking_api):
+        """
+        METRICS-002: Route Templates
+        Create and fetch two bookings through a client with a recorder hook
+        Expected: Both GETs land under GET /booking/{id} with their status
+        """
+        recorder = LatencyRecorder()
+        booking_api.hooks.append(recorder)
+        try:
+            for _ in range(2):
+                booking_id = booking_api.create(sample_booking()).json()["bookingid"]
+                booking_api.get(booking_id)
+        finally:
+            booking_api.hooks.remove(recorder)
+
+        summary = recorder.summary()
+        assert set(summary) == {"POST /booking", "GET /booking/{id}"}
+        assert summary["GET /booking/{id}"]["count"] == 2
+        assert summary["GET /booking/{id}"]["statuses"] == {"200": 2}
+
+    def test_METRICS_003_worker_histograms_merge(self):
+        """
+        METRICS-003: Worker Merge
+        Serialize two recorders as xdist workers do and merge them
+        Expected: Counts, statuses and max combine per endpoint
+        """
+        worker_a, worker_b = LatencyRecorder(), LatencyRecorder()
+        worker_a("GET", "/booking/{id}", 200, 0.010)
+        worker_b("GET", "/booking/{id}", 404, 0.030)
+        worker_b("GET", "/ping", None, 0.002)
+
+        controller = LatencyRecorder()
+        controller.merge_dict(worker_a.to_dict())
+        controller.merge_dict(worker_b.to_dict())
+
+        summary = controller.summary()
+        assert summary["GET /booking/{id}"]["count"] == 2
+        assert summary["GET /booking/{id}"]["statuses"] == {"200": 1, "404": 1}
+        assert summary["GET /booking/{id}"]["max"] == 0.030
+        assert summary["GET /ping"]["statuses"] == {"None": 1}
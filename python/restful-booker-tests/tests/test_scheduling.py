@@ -0,0 +1,92 @@
+"""
+Duration-Aware Scheduling Tests
+
+Checks the dispatch order used by plugins/durations.py for pytest-xdist runs,
+without starting any workers.
+"""
+
+import heapq
+import pathlib
+
+from plugins.durations import plan_ids, schedule_order
+from plugins.lpt import XDIST_INTERNALS, LongestFirstScheduling
+
+TEST_PLAN = pathlib.Path(__file__).parent / "test-plan.md"
+
+
+def node(test_id, name="case"):
+    section, number = test_id.split("-")
+    return f"tests/test_x.py::TestX::test_{section}_{number}_{name}"
+
+
+def makespan(durations, order, workers):
+    # Each test goes to whichever worker frees up first.
+    finish = [0.0] * workers
+    for duration in (durations[i] for i in order):
+        heapq.heappush(finish, heapq.heappop(finish) + duration)
+    return max(finish)
+
+
+class TestScheduling:
+    """Longest-first ordering with test-plan fallback"""
+
+    def test_SCHED_001_plan_order_without_history(self):
+        """
+        SCHED-001: No History
+        Order tests collected out of plan order with no stored durations
+        Expected: Test-plan order, unplanned tests last in collection order
+        """
+        nodeids = [
+            node("INT-001"),
+            node("CACHE-002"),
+            node("AUTH-002"),
+            node("CACHE-001"),
+            node("AUTH-001"),
+        ]
+
+        order = schedule_order(nodeids, {}, plan_ids(TEST_PLAN))
+
+        assert [nodeids[i] for i in order] == [
+            node("AUTH-001"),
+            node("AUTH-002"),
+            node("INT-001"),
+            node("CACHE-002"),
+            node("CACHE-001"),
+        ]
+
+    def test_SCHED_002_longest_first_with_history(self):
+        """
+        SCHED-002: Longest First
+        Order tests with recorded durations, one of them new
+        Expected: Descending duration, new test at the mean, shorter makespan than collection order
+        """
+        durations = {
+            node("AUTH-001"): 0.01,
+            node("GET-001"): 0.02,
+            node("UPDATE-001"): 0.03,
+            node("DELETE-001"): 0.3,
+            node("INT-005"): 0.4,
+            node("INT-006"): 1.0,
+        }
+        nodeids = list(durations) + [node("PATCH-001")]
+
+        order = schedule_order(nodeids, durations, plan_ids(TEST_PLAN))
+
+        ordered = [nodeids[i] for i in order]
+        assert ordered[:2] == [node("INT-006"), node("INT-005")]
+        assert ordered.index(node("PATCH-001")) == 3
+        expected = [durations.get(n, 0.29) for n in nodeids]
+        assert makespan(expected, order, 2) < makespan(expected, range(len(nodeids)), 2)
+
+    def test_SCHED_003_xdist_internals_present(self, pytestconfig, monkeypatch):
+        """
+        SCHED-003: xdist Internals
+        Build the longest-first scheduler and look up the private LoadScheduling members it uses
+        Expected: Every member exists, so an xdist release that drops one fails here
+        """
+        monkeypatch.setattr(pytestconfig.option, "tx", ["2*popen"])
+        scheduler = LongestFirstScheduling(pytestconfig, None, order=list)
+
+        missing = [name for name in XDIST_INTERNALS if not hasattr(scheduler, name)]
+
+        assert missing == []
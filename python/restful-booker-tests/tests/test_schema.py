@@ -0,0 +1,151 @@
+"""
+Response Schema Tests
+
+Compiled validators for the booking object, auth token and booking ID list
+from test-plan.md section 1, checked against live responses, malformed
+payloads, and through BaseAPI with sampling and strict mode.
+"""
+
+import io
+import json
+import timeit
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+
+from api.booking_api import BookingAPI
+from api.schema import (
+    BOOKING,
+    BOOKING_IDS,
+    RESPONSE_SCHEMAS,
+    ResponseValidator,
+    SchemaError,
+    compile_schema,
+)
+from utils import sample_booking
+
+STUB_URL = "http://stub.invalid"
+
+
+class CannedAdapter(HTTPAdapter):
+    """Answers every request with the same 200 JSON body, without a network."""
+
+    def __init__(self, content):
+        super().__init__()
+        self.content = content
+
+    def send(self, request, **kwargs):
+        raw = HTTPResponse(
+            body=io.BytesIO(self.content),
+            headers={"Content-Type": "application/json; charset=utf-8"},
+            status=200,
+            reason="OK",
+            preload_content=False,
+        )
+        return self.build_response(request, raw)
+
+
+def canned_session(payload):
+    session = requests.Session()
+    session.mount(STUB_URL, CannedAdapter(json.dumps(payload).encode()))
+    return session
+
+
+class TestResponseSchemas:
+    """Schema compilation, error paths and BaseAPI validation"""
+
+    def test_SCHEMA_001_live_responses_match(
+        self, auth_api, booking_api, response_validator
+    ):
+        """
+        SCHEMA-001: Live Responses
+        Validate /auth (good and bad credentials), create, get and the ID list
+        Expected: Every response matches its endpoint's schema; the suite's validator decodes with the clients' codec
+        """
+        validators = {key: compile_schema(s) for key, s in RESPONSE_SCHEMAS.items()}
+        create_resp = booking_api.create(sample_booking("Sky", "Schema"))
+        booking_id = create_resp.json()["bookingid"]
+        responses = {
+            ("POST", "/auth"): auth_api.create(
+                {"username": auth_api.username, "password": auth_api.password}
+            ),
+            ("POST", "/booking"): create_resp,
+            ("GET", "/booking/{id}"): booking_api.get(booking_id),
+            ("GET", "/booking"): booking_api.get_all(lastname="Schema"),
+        }
+
+        for key, response in responses.items():
+            assert response.status_code == 200
+            assert validators[key](response.json()) is None, key
+        bad_credentials = auth_api.create({"username": "nobody", "password": "x"})
+        assert validators[("POST", "/auth")](bad_credentials.json()) is None
+        if response_validator is not None:
+            assert type(response_validator.codec) is type(booking_api.codec)
+
+    def test_SCHEMA_002_malformed_payloads_name_the_path(self):
+        """
+        SCHEMA-002: Malformed Payloads
+        Validate bookings and ID lists with wrong types, missing and extra fields
+        Expected: The first failing JSON path is named; validation takes microseconds
+        """
+        validate = compile_schema(BOOKING)
+        booking = sample_booking()
+        cases = [
+            (
+                {**booking, "totalprice": True},
+                "$.totalprice: expected number, got bool",
+            ),
+            ({**booking, "depositpaid": "yes"}, "$.depositpaid: expected boolean"),
+            (
+                {**booking, "bookingdates": {"checkin": "01/12/2025"}},
+                "$.bookingdates.checkin: expected CCYY-MM-DD date",
+            ),
+            (
+                {k: v for k, v in booking.items() if k != "lastname"},
+                "$.lastname: missing",
+            ),
+            ({**booking, "id": 1}, "$: unexpected field 'id'"),
+            ([booking], "$: expected object, got list"),
+        ]
+        for data, message in cases:
+            assert validate(data).startswith(message)
+        no_extras = {k: v for k, v in booking.items() if k != "additionalneeds"}
+        assert validate(no_extras) is None
+        assert compile_schema(BOOKING_IDS)([{"bookingid": 1}, {"bookingid": "2"}]) == (
+            "$[1].bookingid: expected integer, got str"
+        )
+
+        seconds = timeit.timeit(lambda: validate(booking), number=10_000) / 10_000
+        assert seconds < 50e-6
+
+    def test_SCHEMA_003_base_api_sampling_and_strict(
+        self, base_url, session, booking_registry, sut_ready
+    ):
+        """
+        SCHEMA-003: Validation in BaseAPI
+        Sample GETs of a live booking, then read a canned string totalprice through counting and strict validators
+        Expected: About half the GETs checked at rate 0.5; mismatches counted, or raised when strict
+        """
+        writer = BookingAPI(base_url, session, registry=booking_registry)
+        valid_id = writer.create(sample_booking("Well", "Formed")).json()["bookingid"]
+
+        sampled = ResponseValidator(sample_rate=0.5)
+        reader = BookingAPI(base_url, session, validator=sampled)
+        for _ in range(40):
+            reader.get(valid_id)
+        assert 0 < sampled.checked < 40 and sampled.failed == 0
+
+        # The malformed body never reaches the SUT, which should refuse it (VALID-002).
+        stub = canned_session(sample_booking("Mal", "Formed") | {"totalprice": "lots"})
+
+        counting = ResponseValidator()
+        BookingAPI(STUB_URL, stub, validator=counting).get(1)
+        assert counting.summary()["failures"] == [
+            "GET /booking/{id}: $.totalprice: expected number, got str"
+        ]
+
+        strict = BookingAPI(STUB_URL, stub, validator=ResponseValidator(strict=True))
+        with pytest.raises(SchemaError, match=r"\$\.totalprice"):
+            strict.get(1)
@@ -0,0 +1,72 @@
+"""
+Soak Runner Tests
+
+A sub-second soak run through its own clients, and the leak, drift and
+superlinear-slowdown rules applied to synthetic time series.
+"""
+
+from perf.clients import Clients
+from perf.soak import analyze, run_soak
+
+
+def window(elapsed, rss_mb, p50, store_size, probe):
+    return {
+        "elapsed": elapsed,
+        "rss": rss_mb * 2**20,
+        "latency": {"p50": p50},
+        "store_size": store_size,
+        "probe_latency": probe,
+    }
+
+
+class TestSoak:
+    """Short soak run and time-series analysis"""
+
+    def test_SOAK_001_short_run_samples(
+        self, live_base_url, auth_username, auth_password
+    ):
+        """
+        SOAK-001: Short Soak Run
+        Loop INT-001/INT-005 with two workers for 0.6s, sampling every 0.2s
+        Expected: Windows with iterations, no errors, RSS, store size and top allocators
+        """
+        clients = Clients(
+            live_base_url, workers=2, username=auth_username, password=auth_password
+        )
+        try:
+            windows = run_soak(clients, duration=0.6, interval=0.2, workers=2)
+        finally:
+            report = clients.close()
+
+        assert len(windows) >= 2
+        assert sum(sample["iterations"] for sample in windows) > 0
+        assert all(sample["errors"] == 0 for sample in windows)
+        assert all(sample["rss"] > 0 and sample["store_size"] for sample in windows)
+        assert all(sample["top_allocators"] for sample in windows)
+        assert report.deleted > 0 and not report.failed
+
+    def test_SOAK_002_flags_leaks_and_slowdowns(self):
+        """
+        SOAK-002: Trend Analysis
+        Analyze a flat two-hour series and one with growing RSS, p50 and quadratic probe latency
+        Expected: Nothing flagged for the flat series; leak, drift and superlinear for the other
+        """
+        flat = [window(h * 3600, 50, 0.010, 1000 * (h + 1), 0.002) for h in range(10)]
+        degrading = [
+            window(
+                h * 3600,
+                50 + 40 * h,
+                0.010 * (1 + h),
+                1000 * (h + 1),
+                1e-9 * (1000 * (h + 1)) ** 2,
+            )
+            for h in range(10)
+        ]
+
+        assert analyze(flat) == []
+        findings = analyze(degrading)
+        assert [finding.split(":")[0] for finding in findings] == [
+            "leak",
+            "drift",
+            "superlinear",
+        ]
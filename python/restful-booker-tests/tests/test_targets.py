@@ -0,0 +1,82 @@
+"""
+Multi-Target Runner Tests
+
+A load scenario run against two targets in separate processes, and merging
+of per-target results into one report.
+"""
+
+from api.metrics import LatencyHistogram, LatencyRecorder
+from perf.targets import aggregate, run_scenario, run_targets
+
+
+def target_result(target, seconds, failures=()):
+    timings = LatencyHistogram()
+    recorder = LatencyRecorder()
+    for elapsed in seconds:
+        timings.record(elapsed)
+        recorder("GET", "/booking/{id}", 200, elapsed)
+    return {
+        "target": target,
+        "exitstatus": 1 if failures else 0,
+        "duration": sum(seconds),
+        "passed": len(seconds),
+        "failed": len(failures),
+        "skipped": 0,
+        "failures": list(failures),
+        "timings": timings.to_dict(),
+        "requests": recorder.to_dict(),
+    }
+
+
+class TestTargets:
+    """Per-target processes and the aggregated report"""
+
+    def test_TARGETS_001_scenario_per_process(
+        self, live_base_url, auth_username, auth_password
+    ):
+        """
+        TARGETS-001: Scenario Against Two Targets
+        Run INT-002 at 20 it/s for 0.5s against the same SUT twice, one process each
+        Expected: Two results with iterations, no failures, and merged endpoint histograms
+        """
+        results, wall_time = run_targets(
+            [live_base_url, live_base_url],
+            run_scenario,
+            scenario="create_read",
+            rate=20,
+            steady=0.5,
+            workers=4,
+            username=auth_username,
+            password=auth_password,
+        )
+        report = aggregate(results, wall_time)
+
+        assert [result["target"] for result in results] == [
+            live_base_url,
+            live_base_url,
+        ]
+        assert all(result["passed"] > 0 for result in results)
+        assert report["failed"] == 0 and report["failures"] == []
+        assert report["requests"]["POST /booking"]["count"] == report["passed"]
+
+    def test_TARGETS_002_aggregate_results(self):
+        """
+        TARGETS-002: Aggregate Report
+        Merge a passing target with three timings and a failing one with two
+        Expected: Summed counts, merged histograms, and failures tagged with their target
+        """
+        report = aggregate(
+            [
+                target_result("http://a", [0.010, 0.020, 0.030]),
+                target_result("http://b", [0.040, 0.050], ["INT-001 (call): boom"]),
+            ],
+            wall_time=0.1,
+        )
+
+        assert report["passed"] == 5 and report["failed"] == 1
+        assert report["timings"]["count"] == 5
+        assert report["timings"]["max"] == 0.05
+        assert report["requests"]["GET /booking/{id}"]["count"] == 5
+        assert report["failures"] == ["[http://b] INT-001 (call): boom"]
+        assert [row["exitstatus"] for row in report["targets"]] == [0, 1]
+        assert report["serial_time"] > report["wall_time"]
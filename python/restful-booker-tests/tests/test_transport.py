@@ -0,0 +1,60 @@
+"""
+Transport Configuration Tests
+
+Checks that HTTP_* settings reach the session adapter and the per-request timeout
+used by every client, without needing anything from the system under test.
+"""
+
+from api.transport import TransportConfig, build_session
+
+
+class TestTransport:
+    """Transport config parsing and session construction"""
+
+    def test_TRANSPORT_001_from_env_overrides_defaults(self):
+        """
+        TRANSPORT-001: Environment Overrides
+        Build a config from HTTP_* variables
+        Expected: Set variables override defaults, unset ones keep them
+        """
+        config = TransportConfig.from_env(
+            {
+                "HTTP_POOL_MAXSIZE": "64",
+                "HTTP_KEEP_ALIVE": "false",
+                "HTTP_READ_TIMEOUT": "2.5",
+                "HTTP_MAX_RETRIES": "",
+            }
+        )
+
+        assert config.pool_maxsize == 64
+        assert config.keep_alive is False
+        assert config.timeout == (TransportConfig.connect_timeout, 2.5)
+        assert config.max_retries == TransportConfig.max_retries
+
+    def test_TRANSPORT_002_session_adapter_uses_config(self):
+        """
+        TRANSPORT-002: Session Adapter
+        Build a session from a config with a custom pool and retry policy
+        Expected: Adapter pool size and retries match, keep-alive disabled
+        """
+        config = TransportConfig(pool_maxsize=32, max_retries=5, keep_alive=False)
+
+        session = build_session(config)
+        adapter = session.get_adapter("http://localhost")
+
+        assert adapter._pool_maxsize == 32
+        assert adapter.max_retries.total == 5
+        assert "POST" not in adapter.max_retries.allowed_methods
+        assert session.headers["Connection"] == "close"
+
+    def test_TRANSPORT_003_async_limits_follow_keep_alive(self):
+        """
+        TRANSPORT-003: Async Keep-Alive
+        Build httpx pool limits with keep-alive on and off
+        Expected: Idle connections kept only with keep-alive; total limit unchanged
+        """
+        kept = TransportConfig().async_limits(20)
+        closed = TransportConfig(keep_alive=False).async_limits(20)
+
+        assert (kept.max_connections, kept.max_keepalive_connections) == (20, 20)
+        assert (closed.max_connections, closed.max_keepalive_connections) == (20, 0)
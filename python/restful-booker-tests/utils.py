@@ -1,3 +1,6 @@
+import itertools
+
+
 def sample_booking(first="John", last="Doe"):
     return {
         "firstname": first,
@@ -7,3 +10,17 @@ def sample_booking(first="John", last="Doe"):
         "bookingdates": {"checkin": "2025-12-01", "checkout": "2025-12-05"},
         "additionalneeds": "Breakfast",
     }
+
+
+class BookingFactory:
+    """Builds sample bookings with names unique to one worker's namespace."""
+
+    def __init__(self, namespace):
+        self.namespace = namespace
+        self._sequence = itertools.count(1)
+
+    def name(self, base):
+        return f"{base}_{self.namespace}_{next(self._sequence)}"
+
+    def booking(self, first="John", last="Doe"):
+        return sample_booking(self.name(first), self.name(last))